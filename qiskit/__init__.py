@@ -17,8 +17,12 @@
 
 """Main Qiskit public functionality."""
 
+import importlib
+import importlib.util
 import pkgutil
 import sys
+import types
+import typing
 import warnings
 import os
 
@@ -48,40 +52,103 @@ import qiskit.circuit.reset
 # importing the package you want to allow extensions for (in this case `backends`).
 __path__ = pkgutil.extend_path(__path__, __name__)
 
-# Please note these are global instances, not modules.
-from qiskit.providers.basicaer import BasicAer
-
 _config = _user_config.get_config()
 
-# Try to import the Aer provider if installed.
-try:
-    from qiskit.providers.aer import Aer
-except ImportError:
-    suppress_warnings = os.environ.get('QISKIT_SUPPRESS_PACKAGING_WARNINGS', '')
-    if suppress_warnings.upper() != 'Y':
-        if not _config.get('suppress_packaging_warnings') or suppress_warnings.upper() == 'N':
-            warnings.warn('Could not import the Aer provider from the qiskit-aer '
-                          'package. Install qiskit-aer or check your installation.',
-                          RuntimeWarning)
-# Try to import the IBMQ provider if installed.
-try:
-    from qiskit.providers.ibmq import IBMQ
-except ImportError:
+
+def _warn_if_missing(package, provider, distribution):
+    """Warn at import time if an optional provider package is not installed.
+
+    The provider packages extend the qiskit namespace, so this looks for their
+    directory in it, without importing them or qiskit.providers. A provider
+    that is installed but fails to import raises its error on first access.
+    """
+    relative_path = os.path.join(*package.split('.')[1:])
+    if any(os.path.isdir(os.path.join(path, relative_path)) for path in __path__):
+        return
     suppress_warnings = os.environ.get('QISKIT_SUPPRESS_PACKAGING_WARNINGS', '')
     if suppress_warnings.upper() != 'Y':
         if not _config.get('suppress_packaging_warnings') or suppress_warnings.upper() == 'N':
-            warnings.warn('Could not import the IBMQ provider from the '
-                          'qiskit-ibmq-provider package. Install '
-                          'qiskit-ibmq-provider or check your installation.',
+            warnings.warn('The {provider} provider from the {distribution} package is '
+                          'not installed. Install {distribution} to use '
+                          'qiskit.{provider}.'.format(provider=provider,
+                                                      distribution=distribution),
                           RuntimeWarning)
 
-# Moved to after IBMQ and Aer imports due to import issues
-# with other modules that check for IBMQ (tools)
+
+# The Aer and IBMQ providers are imported on first use, but whether they are
+# installed is checked now, without importing them.
+_warn_if_missing('qiskit.providers.aer', 'Aer', 'qiskit-aer')
+_warn_if_missing('qiskit.providers.ibmq', 'IBMQ', 'qiskit-ibmq-provider')
+
+# The compiler functions execute uses are imported when it is first called.
 from qiskit.execute import execute  # noqa
-from qiskit.compiler import transpile, assemble, schedule  # noqa
 
 from .version import __version__  # noqa
-from .version import _get_qiskit_versions  # noqa
+
+# Attributes of the qiskit namespace imported on first access, as the module
+# they come from and their name in it. The global provider instances and the
+# compiler functions pull in most of Qiskit and its heavy dependencies.
+_LAZY_ATTRIBUTES = {
+    'BasicAer': ('qiskit.providers.basicaer', 'BasicAer'),
+    'Aer': ('qiskit.providers.aer', 'Aer'),
+    'IBMQ': ('qiskit.providers.ibmq', 'IBMQ'),
+    'transpile': ('qiskit.compiler', 'transpile'),
+    'assemble': ('qiskit.compiler', 'assemble'),
+    'schedule': ('qiskit.compiler', 'schedule'),
+    '__qiskit_version__': ('qiskit.version', '__qiskit_version__'),
+}
+
+if typing.TYPE_CHECKING:
+    # Only for linters and type checkers, which do not see the lazy attributes.
+    from qiskit.providers.basicaer import BasicAer
+    from qiskit.compiler import transpile, assemble, schedule
+    try:
+        from qiskit.providers.aer import Aer
+    except ImportError:
+        pass
+    try:
+        from qiskit.providers.ibmq import IBMQ
+    except ImportError:
+        pass
+    from qiskit.version import __qiskit_version__
+
+
+class _QiskitModule(types.ModuleType):
+    """The qiskit module, whose heavy attributes are imported on first access.
+
+    This is a module subclass rather than a module level ``__getattr__`` to
+    also support Python 3.5 and 3.6.
+    """
+
+    def __getattr__(self, name):
+        if name in _LAZY_ATTRIBUTES:
+            module_name, attribute = _LAZY_ATTRIBUTES[name]
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as err:
+                if err.name != module_name:
+                    raise
+                # An optional provider that is not installed.
+                raise AttributeError(
+                    "module 'qiskit' has no attribute '%s'" % name) from err
+            value = getattr(module, attribute)
+            setattr(self, name, value)
+            return value
+        if name == '__all__':
+            # For ``from qiskit import *``, which only sees the module dict otherwise.
+            public = {key for key in self.__dict__ if not key.startswith('_')}
+            for key in _LAZY_ATTRIBUTES:
+                if not key.startswith('_') and \
+                        importlib.util.find_spec(_LAZY_ATTRIBUTES[key][0]) is not None:
+                    public.add(key)
+            return sorted(public)
+        raise AttributeError("module 'qiskit' has no attribute '%s'" % name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = _QiskitModule
 
 
 if sys.version_info[0] == 3 and sys.version_info[1] == 5:
@@ -89,6 +156,3 @@ if sys.version_info[0] == 3 and sys.version_info[1] == 5:
         "Using Qiskit with Python 3.5 is deprecated as of the 0.12.0 release. "
         "Support for running Qiskit with Python 3.5 will be removed at the "
         "Python 3.5 EoL on 09/13/2020.", DeprecationWarning)
-
-
-__qiskit_version__ = _get_qiskit_versions()
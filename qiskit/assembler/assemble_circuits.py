@@ -13,29 +13,64 @@
 # that they have been altered from the originals.
 
 """Assemble function for converting a list of circuits into a qobj."""
+from qiskit.circuit.gate import Gate
+from qiskit.circuit.instruction import Instruction
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
                          QasmQobjConfig)
+from qiskit.qobj import utils as qobj_utils
+from qiskit.validation.jsonschema.exceptions import SchemaValidationError
 from qiskit.tools.parallel import parallel_map
 
+# Instructions whose class keeps the default assembly are fully described in
+# the qobj by their name and parameters.
+_DEFAULT_ASSEMBLE = (Instruction.assemble, Gate.assemble)
 
-def _assemble_circuit(circuit):
+
+def _assemble_op(op, templates):
+    """Assemble ``op``, with placeholder qubits and memory.
+
+    Unconditional instructions with the default assembly share a template,
+    keyed on their name and parameters, holding their evaluated parameters.
+    """
+    if (op.condition is None and type(op).assemble in _DEFAULT_ASSEMBLE
+            and getattr(op, 'label', None) is None):
+        key = (op.name, tuple(op.params))
+        try:
+            params = templates[key]
+        except KeyError:
+            params = templates[key] = getattr(op.assemble(), 'params', None)
+        except TypeError:
+            # Unhashable parameters, e.g. the matrix of a unitary
+            return op.assemble()
+        return QasmQobjInstruction(name=op.name, params=list(params) if params else None)
+    return op.assemble()
+
+
+def _assemble_circuit(circuit, validate=True):
     # header stuff
     num_qubits = 0
     memory_slots = 0
     qubit_labels = []
     clbit_labels = []
+    qubit_indices = {}
+    clbit_indices = {}
+    creg_indices = {}
 
     qreg_sizes = []
     creg_sizes = []
     for qreg in circuit.qregs:
         qreg_sizes.append([qreg.name, qreg.size])
-        for j in range(qreg.size):
+        for j, qubit in enumerate(qreg):
+            qubit_indices[qubit] = len(qubit_labels)
             qubit_labels.append([qreg.name, j])
         num_qubits += qreg.size
     for creg in circuit.cregs:
         creg_sizes.append([creg.name, creg.size])
-        for j in range(creg.size):
+        creg_indices.setdefault(creg.name, [])
+        for j, clbit in enumerate(creg):
+            clbit_indices[clbit] = len(clbit_labels)
+            creg_indices[creg.name].append((j, len(clbit_labels)))
             clbit_labels.append([creg.name, j])
         memory_slots += creg.size
 
@@ -57,40 +92,58 @@ def _assemble_circuit(circuit):
     # their clbit_index, create a new register slot for every conditional gate
     # and add a bfunc to map the creg=val mask onto the gating register bit.
 
-    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit.data)
+    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit._data)
     max_conditional_idx = 0
 
+    path = 'experiment %s' % circuit.name
+    default_assemblies = {}
+    templates = {}
+    condition_masks = {}
     instructions = []
-    for op_context in circuit.data:
-        instruction = op_context[0].assemble()
+    for op, qargs, cargs in circuit._data:
+        instruction = _assemble_op(op, templates)
 
         # Add register attributes to the instruction
-        qargs = op_context[1]
-        cargs = op_context[2]
         if qargs:
-            qubit_indices = [qubit_labels.index([qubit.register.name, qubit.index])
-                             for qubit in qargs]
-            instruction.qubits = qubit_indices
+            instruction.qubits = [qubit_indices[qubit] for qubit in qargs]
         if cargs:
-            clbit_indices = [clbit_labels.index([clbit.register.name, clbit.index])
-                             for clbit in cargs]
-            instruction.memory = clbit_indices
+            clbit_positions = [clbit_indices[clbit] for clbit in cargs]
+            instruction.memory = clbit_positions
             # If the experiment has conditional instructions, assume every
             # measurement result may be needed for a conditional gate.
             if instruction.name == "measure" and is_conditional_experiment:
-                instruction.register = clbit_indices
+                instruction.register = clbit_positions
+
+        if validate:
+            # The indices set above come from the bit maps of the circuit, and
+            # the default assembly only sets the name besides them.
+            default_assembly = default_assemblies.get(type(op))
+            if default_assembly is None:
+                default_assembly = default_assemblies[type(op)] = \
+                    type(op).assemble in _DEFAULT_ASSEMBLE
+            if not default_assembly:
+                qobj_utils.validate_instruction_structure(
+                    instruction, num_qubits, memory_slots,
+                    path='%s.instructions[%d]' % (path, len(instructions)))
+            elif instruction.name.__class__ is not str:
+                raise SchemaValidationError(
+                    "Qobj validation failed. Specifically path: %s.instructions[%d] "
+                    "has no name" % (path, len(instructions)))
 
         # To convert to a qobj-style conditional, insert a bfunc prior
         # to the conditional instruction to map the creg ?= val condition
         # onto a gating register bit.
         if hasattr(instruction, '_condition'):
             ctrl_reg, ctrl_val = instruction._condition
-            mask = 0
-            val = 0
-            for clbit in clbit_labels:
-                if clbit[0] == ctrl_reg.name:
-                    mask |= (1 << clbit_labels.index(clbit))
-                    val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
+            try:
+                mask, val = condition_masks[ctrl_reg.name, ctrl_val]
+            except KeyError:
+                mask = 0
+                val = 0
+                for bit_index, clbit_index in creg_indices.get(ctrl_reg.name, []):
+                    mask |= (1 << clbit_index)
+                    val |= (((ctrl_val >> bit_index) & 1) << clbit_index)
+                condition_masks[ctrl_reg.name, ctrl_val] = mask, val
 
             conditional_reg_idx = memory_slots + max_conditional_idx
             conversion_bfunc = QasmQobjInstruction(name='bfunc',
@@ -106,8 +159,11 @@ def _assemble_circuit(circuit):
             del instruction._condition
 
         instructions.append(instruction)
-    return QasmQobjExperiment(instructions=instructions, header=header,
-                              config=config)
+    experiment = QasmQobjExperiment(instructions=instructions, header=header,
+                                    config=config)
+    # validate_qobj_structure does not check the experiment again
+    experiment._structure_validated = validate
+    return experiment
 
 
 def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
@@ -139,7 +195,10 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
     qobj_config.memory_slots = max(memory_slot_sizes)
     qobj_config.n_qubits = max(qubit_sizes)
 
-    experiments = parallel_map(_assemble_circuit, circuits)
+    # the structure of the instructions is checked as they are built, unless
+    # qobj validation is switched off
+    validate = qobj_utils.get_validation_mode() != 'none'
+    experiments = parallel_map(_assemble_circuit, circuits, task_args=(validate,))
 
     return QasmQobj(qobj_id=qobj_id,
                     config=qobj_config,
@@ -204,6 +204,7 @@ Parametric Quantum Circuits
     Parameter
     ParameterVector
     ParameterExpression
+    ParameterBinder
 
 Random Circuits
 ---------------
@@ -227,4 +228,5 @@ from .reset import Reset
 from .parameter import Parameter
 from .parametervector import ParameterVector
 from .parameterexpression import ParameterExpression
+from .parameterbinder import ParameterBinder
 from .equivalence import EquivalenceLibrary
@@ -131,6 +131,11 @@ class ControlledGate(Gate):
             excited_def: The circuit with all closed controls."""
         super(Gate, self.__class__).definition.fset(self, excited_def)
 
+    def _get_definition(self):
+        if self._open_ctrl:
+            return self.definition
+        return super()._get_definition()
+
     @property
     def num_ctrl_qubits(self):
         """Get number of control qubits.
@@ -203,7 +208,7 @@ class ControlledGate(Gate):
                 self.base_gate == other.base_gate and
                 self.num_qubits == other.num_qubits and
                 self.num_clbits == other.num_clbits and
-                self.definition == other.definition)
+                self._get_definition() == other._get_definition())
 
     def inverse(self) -> 'ControlledGate':
         """Invert this gate by calling inverse on the base gate."""
@@ -17,8 +17,6 @@
 import io
 from collections import namedtuple
 
-import networkx as nx
-
 from .exceptions import CircuitError
 from .parameterexpression import ParameterExpression
 
@@ -44,6 +42,46 @@ Equivalence = namedtuple('Equivalence', ['params',  # Ordered to match Gate.para
                                          'circuit'])
 
 
+class _LazyEquivalence:
+    """An equivalence built by a factory the first time it is needed."""
+
+    __slots__ = ('key', 'factory', 'basis', '_equivalence')
+
+    def __init__(self, key, factory, basis):
+        self.key = key
+        self.factory = factory
+        self.basis = frozenset(basis) if basis is not None else None
+        self._equivalence = None
+
+    def resolve(self):
+        """Build the equivalence, if not done yet, and return it.
+
+        Returns:
+            Equivalence: the equivalence.
+
+        Raises:
+            CircuitError: if the gate or circuit returned by the factory do not
+                match the key or the basis of the equivalence.
+        """
+        if self._equivalence is None:
+            gate, equivalent_circuit = self.factory()
+            if (gate.name, gate.num_qubits) != tuple(self.key):
+                raise CircuitError('Lazy equivalence for {}/{} built an equivalence '
+                                   'for {}/{}.'.format(self.key.name, self.key.num_qubits,
+                                                       gate.name, gate.num_qubits))
+            _raise_if_shape_mismatch(gate, equivalent_circuit)
+            _raise_if_param_mismatch(gate.params, equivalent_circuit.parameters)
+            if self.basis is not None and self.basis != _circuit_basis(equivalent_circuit):
+                raise CircuitError('Lazy equivalence for {}/{} was declared with basis {} '
+                                   'but its circuit uses {}.'.format(
+                                       self.key.name, self.key.num_qubits, set(self.basis),
+                                       set(_circuit_basis(equivalent_circuit))))
+            self._equivalence = Equivalence(params=gate.params.copy(),
+                                            circuit=equivalent_circuit.copy())
+            self.factory = None
+        return self._equivalence
+
+
 class EquivalenceLibrary():
     """A library providing a one-way mapping of Gates to their equivalent
     implementations as QuantumCircuits."""
@@ -88,6 +126,35 @@ class EquivalenceLibrary():
 
         self._map[key].equivalences.append(equiv)
 
+    def add_lazy_equivalence(self, name, num_qubits, factory, basis=None):
+        """Add an equivalence which is only built the first time it is needed.
+
+        The factory is called the first time the equivalences of the gate are
+        queried, for example by :meth:`get_entry`, or the equivalence is
+        chosen by the basis search of the
+        :class:`~qiskit.transpiler.passes.BasisTranslator`, so a library of
+        many equivalences costs little to create.
+
+        Args:
+            name (str): name of the gate.
+            num_qubits (int): number of qubits of the gate.
+            factory (Callable[[], Tuple[Gate, QuantumCircuit]]): function
+                returning a gate named ``name`` on ``num_qubits`` qubits and a
+                circuit equivalently implementing it, as accepted by
+                :meth:`add_equivalence`.
+            basis (Optional[Iterable[Tuple[str, int]]]): the names and numbers
+                of qubits of the instructions of the circuit. If given, the
+                basis search does not build the equivalence to know which
+                instructions it uses, and it is checked against the circuit
+                when the equivalence is built.
+        """
+        key = Key(name=name, num_qubits=num_qubits)
+
+        if key not in self._map:
+            self._map[key] = Entry(search_base=True, equivalences=[])
+
+        self._map[key].equivalences.append(_LazyEquivalence(key, factory, basis))
+
     def has_entry(self, gate):
         """Check if a library contains any decompositions for gate.
 
@@ -181,6 +248,8 @@ class EquivalenceLibrary():
             raise ImportError('EquivalenceLibrary.draw requires pillow. '
                               "You can use 'pip install pillow' to install")
 
+        import networkx as nx
+
         dot = nx.drawing.nx_pydot.to_pydot(self._build_basis_graph())
         if filename:
             extension = filename.split('.')[-1]
@@ -190,6 +259,8 @@ class EquivalenceLibrary():
         return Image.open(io.BytesIO(png))
 
     def _build_basis_graph(self):
+        import networkx as nx
+
         graph = nx.MultiDiGraph()
 
         for key in self._get_all_keys():
@@ -199,9 +270,7 @@ class EquivalenceLibrary():
             basis = frozenset(['{}/{}'.format(name, num_qubits)])
             for params, decomp in equivalences:
                 decomp_basis = frozenset('{}/{}'.format(name, num_qubits)
-                                         for name, num_qubits in
-                                         set((inst.name, inst.num_qubits)
-                                             for inst, _, __ in decomp.data))
+                                         for name, num_qubits in _circuit_basis(decomp))
 
                 graph.add_node(basis, label=str(set(basis)))
                 graph.add_node(decomp_basis, label=str(set(decomp_basis)))
@@ -229,10 +298,43 @@ class EquivalenceLibrary():
     def _get_equivalences(self, key):
         search_base, equivalences = self._map.get(key, (True, []))
 
+        for index, equiv in enumerate(equivalences):
+            if isinstance(equiv, _LazyEquivalence):
+                equivalences[index] = equiv.resolve()
+
         if search_base and self._base is not None:
             return equivalences + self._base._get_equivalences(key)
         return equivalences
 
+    def _get_equivalence_bases(self, key):
+        """Return the bases of the equivalences of a key, without building the
+        lazy equivalences declared with their basis.
+
+        Returns:
+            List[Tuple[FrozenSet[Tuple[str, int]], Callable[[], Equivalence]]]:
+                for every equivalence, in the order of :meth:`_get_equivalences`,
+                the names and numbers of qubits of the instructions of its circuit
+                and a function returning the equivalence.
+        """
+        search_base, equivalences = self._map.get(key, (True, []))
+
+        bases = []
+        for equiv in equivalences:
+            if isinstance(equiv, _LazyEquivalence):
+                if equiv.basis is not None:
+                    bases.append((equiv.basis, equiv.resolve))
+                    continue
+                equiv = equiv.resolve()
+            bases.append((_circuit_basis(equiv.circuit), lambda equiv=equiv: equiv))
+
+        if search_base and self._base is not None:
+            return bases + self._base._get_equivalence_bases(key)
+        return bases
+
+
+def _circuit_basis(circuit):
+    return frozenset((inst.name, inst.num_qubits) for inst, _, __ in circuit.data)
+
 
 def _raise_if_param_mismatch(gate_params, circuit_parameters):
     gate_parameters = [p for p in gate_params
@@ -34,6 +34,7 @@ The circuit itself keeps this context.
 """
 import warnings
 import copy
+import numbers
 from itertools import zip_longest
 
 import numpy
@@ -43,14 +44,30 @@ from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.qobj.qasm_qobj import QasmQobjInstruction
 from qiskit.circuit.parameter import ParameterExpression
+from qiskit.circuit.metrics import CircuitMetrics
 from .tools import pi_check
 
 _CUTOFF_PRECISION = 1E-10
 
+# Definitions of instructions with numeric parameters, shared between the
+# instances of the classes that cache their definitions, by definition key.
+_DEFINITIONS = {}
+_MAX_DEFINITIONS = 10000
+
 
 class Instruction:
     """Generic quantum instruction."""
 
+    # Whether the definitions of the instances depend only on their class, name,
+    # dimensions and parameters, so that the definitions built for numeric
+    # parameters can be shared between the instances.
+    _cache_definitions = False
+    # Whether the definition of the instance is shared, and must not be modified.
+    _shared_definition = False
+    # Whether the instance was processed by the tracked metrics of a circuit,
+    # which must then be computed again when its condition changes.
+    _metrics_processed = False
+
     def __init__(self, name, num_qubits, num_clbits, params):
         """Create a new instruction.
 
@@ -96,8 +113,11 @@ class Instruction:
         if type(self) is not type(other) or \
                 self.name != other.name or \
                 self.num_qubits != other.num_qubits or \
-                self.num_clbits != other.num_clbits or \
-                self.definition != other.definition:
+                self.num_clbits != other.num_clbits:
+            return False
+        definition = self._get_definition()
+        other_definition = other._get_definition()
+        if definition is not other_definition and definition != other_definition:
             return False
 
         for self_param, other_param in zip_longest(self.params, other.params):
@@ -172,14 +192,46 @@ class Instruction:
     @property
     def definition(self):
         """Return definition in terms of other basic gates."""
+        definition = self._get_definition()
+        if self._shared_definition:
+            # the instruction gets a copy of its own, which can be modified
+            definition = self.definition = definition.copy()
+        return definition
+
+    def _get_definition(self):
+        """Return the definition, without copying it if it is shared with other
+        instructions, in which case it must not be modified."""
         if self._definition is None:
-            self._define()
+            if self._cache_definitions:
+                self._define_shared()
+            else:
+                self._define()
         return self._definition
 
     @definition.setter
     def definition(self, array):
         """Set gate representation"""
         self._definition = array
+        self._shared_definition = False
+
+    def _define_shared(self):
+        """Populate self.definition with the definition shared by the instances with the
+        same numeric parameters, defining it if it is not cached yet."""
+        key = _definition_key(self)
+        if key is None:
+            self._define()
+            return
+        definition = _DEFINITIONS.get(key)
+        if definition is None:
+            self._define()
+            definition = self._definition
+            if definition is None:
+                return
+            if len(_DEFINITIONS) >= _MAX_DEFINITIONS:
+                del _DEFINITIONS[next(iter(_DEFINITIONS))]
+            _DEFINITIONS[key] = definition
+        self._definition = definition
+        self._shared_definition = True
 
     @property
     def decompositions(self):
@@ -267,7 +319,7 @@ class Instruction:
             CircuitError: if the instruction is not composite
                 and an inverse has not been implemented for it.
         """
-        if self.definition is None:
+        if self._get_definition() is None:
             raise CircuitError("inverse() not implemented for %s." % self.name)
         inverse_gate = self.copy(name=self.name + '_dg')
         inverse_gate.definition._data = [(inst.inverse(), qargs, cargs)
@@ -282,6 +334,8 @@ class Instruction:
         if val < 0:
             raise CircuitError("condition value should be non-negative")
         self.condition = (classical, val)
+        if self._metrics_processed:
+            CircuitMetrics.condition_changed()
         return self
 
     def copy(self, name=None):
@@ -305,7 +359,7 @@ class Instruction:
     def __deepcopy__(self, _memo=None):
         cpy = copy.copy(self)
         cpy._params = copy.copy(self._params)
-        if self._definition:
+        if self._definition and not self._shared_definition:
             cpy._definition = copy.deepcopy(self._definition, _memo)
         return cpy
 
@@ -388,3 +442,13 @@ class Instruction:
             qc._data = [(self, qargs[:], cargs[:])] * n
         instruction.definition = qc
         return instruction
+
+
+def _definition_key(instruction):
+    """Return the key of the shared definition of an instruction, or None if its
+    parameters are not all numbers."""
+    params = instruction.params
+    if not all(isinstance(param, numbers.Number) for param in params):
+        return None
+    return (type(instruction), instruction.name, instruction.num_qubits,
+            instruction.num_clbits, tuple((type(param), param) for param in params))
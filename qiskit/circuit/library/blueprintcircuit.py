@@ -97,6 +97,11 @@ class BlueprintCircuit(QuantumCircuit, ABC):
             self._build()
         return super().qasm(formatted, filename)
 
+    def write_qasm(self, file):
+        if self._data is None:
+            self._build()
+        super().write_qasm(file)
+
     def append(self, instruction, qargs=None, cargs=None):
         if self._data is None:
             self._build()
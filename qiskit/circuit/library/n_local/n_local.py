@@ -14,13 +14,16 @@
 
 """The n-local circuit class."""
 
+import copy
 import logging
+import operator
 from typing import Union, Optional, List, Any, Tuple, Sequence, Set, Callable
 from itertools import combinations
 
 import numpy
 from qiskit import QuantumCircuit, QuantumRegister
-from qiskit.circuit import Instruction, Parameter, ParameterVector, ParameterExpression
+from qiskit.circuit import (Instruction, Parameter, ParameterVector, ParameterExpression,
+                            ParameterBinder)
 from qiskit.circuit.parametertable import ParameterTable
 
 from ..blueprintcircuit import BlueprintCircuit
@@ -137,6 +140,13 @@ class NLocal(BlueprintCircuit):
         self._data = None
         self._bounds = None
 
+        # the instructions of the blocks, and the circuit state at the start of each repetition,
+        # used to build the circuit faster and to keep the built repetitions if ``reps`` changes
+        self._block_templates = {}
+        self._rep_checkpoints = []
+        self._built_data = []
+        self._resume = None
+
         if num_qubits is not None:
             self.num_qubits = num_qubits
 
@@ -482,7 +492,7 @@ class NLocal(BlueprintCircuit):
             repetitions: The new repetitions.
         """
         if repetitions != self._reps:
-            self._invalidate()
+            self._invalidate_reps(min(repetitions, self._reps))
             self._reps = repetitions
 
     def print_settings(self) -> str:
@@ -667,6 +677,32 @@ class NLocal(BlueprintCircuit):
         """Invalidate the current circuit build."""
         self._data = None
         self._parameter_table = ParameterTable()
+        self._block_templates = {}
+        self._rep_checkpoints = []
+        self._built_data = []
+        self._resume = None
+
+    def _invalidate_reps(self, rep: int) -> None:
+        """Invalidate the current circuit build from the repetition ``rep`` on.
+
+        The instructions before that repetition are kept and the next build continues from
+        there, unless the circuit was modified since it was built or its layers depend on the
+        number of repetitions.
+        """
+        checkpoints = self._rep_checkpoints
+        if (self._data is None or rep >= len(checkpoints) or self._skip_unentangled_qubits
+                or not isinstance(self._ordered_parameters, ParameterVector)):
+            self._invalidate()
+            return
+
+        length, consumed, global_phase = checkpoints[rep]
+        prefix = self._data[:length]
+        if len(prefix) < length or not all(map(operator.is_, prefix, self._built_data)):
+            self._invalidate()
+            return
+
+        self._invalidate()
+        self._resume = (rep, prefix, consumed, global_phase, checkpoints[:rep])
 
     def add_layer(self,
                   other: Union['NLocal', Instruction, QuantumCircuit],
@@ -757,15 +793,7 @@ class NLocal(BlueprintCircuit):
                                      'the number of parameters ({}), but {} are given.'.format(
                                          self.num_parameters, len(param_dict)
                                      ))
-            unbound_params = [param for param in self._ordered_parameters if
-                              isinstance(param, ParameterExpression)]
-
-            # to get a sorted list of unique parameters, keep track of the already used parameters
-            # in a set and add the parameters to the unique list only if not existing in the set
-            used = set()
-            unbound_unique_params = [param for param in unbound_params
-                                     if param not in used and (used.add(param) or True)]
-            param_dict = dict(zip(unbound_unique_params, param_dict))
+            param_dict = dict(zip(self._unbound_unique_parameters(), param_dict))
 
         if inplace:
             new = [param_dict.get(param, param) for param in self.ordered_parameters]
@@ -773,22 +801,141 @@ class NLocal(BlueprintCircuit):
 
         return super().assign_parameters(param_dict, inplace=inplace)
 
+    def parameter_binder(self) -> ParameterBinder:
+        """Get a binder of the parameters of the circuit to arrays of values.
+
+        The binder takes the values in the same order as :meth:`assign_parameters` given a
+        list, i.e. the order of the unbound parameters in :attr:`ordered_parameters`, without
+        duplicates. It binds a vector of values, or a 2-D array with one vector per row, much
+        faster than :meth:`assign_parameters`, which makes it suited to evaluate e.g. a feature
+        map on many data points.
+
+        Examples:
+
+            >>> from qiskit.circuit.library import ZZFeatureMap
+            >>> feature_map = ZZFeatureMap(2)
+            >>> binder = feature_map.parameter_binder()
+            >>> circuits = binder([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+        Returns:
+            A binder of the parameters of the circuit, see
+            :class:`~qiskit.circuit.ParameterBinder`.
+        """
+        if self._data is None:
+            self._build()
+
+        return ParameterBinder(self, self._unbound_unique_parameters())
+
+    def _unbound_unique_parameters(self) -> List[Parameter]:
+        """Get the unbound parameters in the order of :attr:`ordered_parameters`."""
+        unbound_params = [param for param in self._ordered_parameters if
+                          isinstance(param, ParameterExpression)]
+
+        # to get a sorted list of unique parameters, keep track of the already used parameters
+        # in a set and add the parameters to the unique list only if not existing in the set
+        used = set()
+        return [param for param in unbound_params
+                if param not in used and (used.add(param) or True)]
+
     def _parametrize_block(self, block, param_iter=None, rep_num=None, block_num=None, indices=None,
                            params=None):
         """Convert ``block`` to a circuit of correct width and parameterized using the iterator."""
         if self._overwrite_block_parameters:
-            # check if special parameters should be used
-            # pylint: disable=assignment-from-none
-            if params is None:
-                params = self._parameter_generator(rep_num, block_num, indices)
             if params is None:
-                params = [next(param_iter) for _ in range(len(get_parameters(block)))]
+                params = self._block_parameters(block, param_iter, rep_num, block_num, indices)
 
             update = dict(zip(block.parameters, params))
             return block.assign_parameters(update)
 
         return block.copy()
 
+    def _block_parameters(self, block, param_iter, rep_num, block_num, indices):
+        """Get the parameters of an instance of ``block``, or None to keep its own parameters."""
+        if not self._overwrite_block_parameters:
+            return None
+
+        # check if special parameters should be used
+        # pylint: disable=assignment-from-none
+        params = self._parameter_generator(rep_num, block_num, indices)
+        if params is None:
+            params = [next(param_iter) for _ in range(len(get_parameters(block)))]
+        return params
+
+    def _block_template(self, block):
+        """Get the instructions of ``block`` with the positions of the parameters to replace.
+
+        The template is a list of ``(instruction, qubit positions, slots)`` and the block
+        parameters, where ``slots`` lists the ``(param_index, block parameter positions)`` of
+        the instruction parameters to replace. It is None if the block must be parametrized
+        with :meth:`_parametrize_block`.
+        """
+        cached = self._block_templates.get(id(block))
+        if cached is not None:
+            return cached[1]
+
+        template = None
+        if isinstance(block, QuantumCircuit) and not block.clbits and not block.global_phase:
+            block_params = list(block.parameters) if self._overwrite_block_parameters else []
+            positions = {param: k for k, param in enumerate(block_params)}
+            qubit_positions = {qubit: k for k, qubit in enumerate(block.qubits)}
+            instructions = []
+            for instruction, qargs, _ in block.data:
+                if instruction.condition:
+                    break
+                slots = []
+                for index, param in enumerate(instruction.params):
+                    if isinstance(param, ParameterExpression):
+                        used = [positions[p] for p in param.parameters if p in positions]
+                        if used:
+                            slots.append((index, used))
+                if slots and instruction._definition is not None:
+                    break
+                instructions.append((instruction, [qubit_positions[q] for q in qargs], slots))
+            else:
+                template = (instructions, block_params)
+
+        # keep a reference to the block, such that its id is not reused
+        self._block_templates[id(block)] = (block, template)
+        return template
+
+    def _build_layer(self, block, param_iter, rep_num, block_num, block_indices):
+        """Append the instances of ``block`` acting on the qubits ``block_indices``."""
+        template = self._block_template(block)
+        qubits = self.qubits
+        entries = []
+        global_phase = 0
+        for indices in block_indices:
+            params = self._block_parameters(block, param_iter, rep_num, block_num, indices)
+            if template is None or params is not None and not all(
+                    isinstance(param, ParameterExpression) for param in params):
+                # numeric values are bound, as QuantumCircuit.assign_parameters does
+                placed = QuantumCircuit(*self.qregs)
+                placed.compose(self._parametrize_block(block, params=params), indices,
+                               inplace=True)
+                entries += placed.data
+                global_phase += placed.global_phase
+                continue
+
+            instructions, block_params = template
+            block_qubits = [qubits[index] for index in indices]
+            for instruction, qargs, slots in instructions:
+                if slots:
+                    instruction = copy.copy(instruction)
+                    instruction._params = new_params = list(instruction.params)
+                    for index, used in slots:
+                        if isinstance(new_params[index], Parameter):
+                            new_params[index] = params[used[0]]
+                        else:
+                            new_params[index] = new_params[index].subs(
+                                {block_params[k]: params[k] for k in used})
+                entries.append((instruction, [block_qubits[k] for k in qargs], []))
+
+        # the unmodified instructions are shared with the block
+        self._instructions_shared = True
+        self.append_many(entries, validate=False)
+        if global_phase:
+            self.global_phase += global_phase
+
     def _build_rotation_layer(self, param_iter, i):
         """Build a rotation layer."""
         # if the unentangled qubits are skipped, compute the set of qubits that are not entangled
@@ -797,9 +944,6 @@ class NLocal(BlueprintCircuit):
 
         # iterate over all rotation blocks
         for j, block in enumerate(self.rotation_blocks):
-            # create a new layer
-            layer = QuantumCircuit(*self.qregs)
-
             # we apply the rotation gates stacked on top of each other, i.e.
             # if we have 4 qubits and a rotation block of width 2, we apply two instances
             block_indices = [
@@ -814,28 +958,15 @@ class NLocal(BlueprintCircuit):
                                  if set(indices).isdisjoint(unentangled_qubits)]
 
             # apply the operations in the layer
-            for indices in block_indices:
-                parametrized_block = self._parametrize_block(block, param_iter, i, j, indices)
-                layer.compose(parametrized_block, indices, inplace=True)
-
-            # add the layer to the circuit
-            self += layer
+            self._build_layer(block, param_iter, i, j, block_indices)
 
     def _build_entanglement_layer(self, param_iter, i):
         """Build an entanglement layer."""
         # iterate over all entanglement blocks
         for j, block in enumerate(self.entanglement_blocks):
-            # create a new layer and get the entangler map for this block
-            layer = QuantumCircuit(*self.qregs)
+            # get the entangler map for this block and apply the operations in the layer
             entangler_map = self.get_entangler_map(i, j, block.num_qubits)
-
-            # apply the operations in the layer
-            for indices in entangler_map:
-                parametrized_block = self._parametrize_block(block, param_iter, i, j, indices)
-                layer.compose(parametrized_block, indices, inplace=True)
-
-            # add the layer to the circuit
-            self += layer
+            self._build_layer(block, param_iter, i, j, entangler_map)
 
     def _build_additional_layers(self, which):
         if which == 'appended':
@@ -868,18 +999,37 @@ class NLocal(BlueprintCircuit):
         if self.num_qubits == 0:
             return
 
-        # use the initial state circuit if it is not None
-        if self._initial_state:
-            circuit = self._initial_state.construct_circuit('circuit', register=self.qregs[0])
-            self += circuit
+        parameters = self.ordered_parameters
+        if self._resume is None:
+            start = 0
+            self._rep_checkpoints = []
 
-        param_iter = iter(self.ordered_parameters)
+            # use the initial state circuit if it is not None
+            if self._initial_state:
+                circuit = self._initial_state.construct_circuit('circuit', register=self.qregs[0])
+                self += circuit
 
-        # build the prepended layers
-        self._build_additional_layers('prepended')
+            param_iter = iter(parameters)
+
+            # build the prepended layers
+            self._build_additional_layers('prepended')
+        else:
+            # continue from the repetitions kept by the reps setter
+            start, self._data, consumed, self.global_phase, self._rep_checkpoints = self._resume
+            self._resume = None
+            for instruction, _, _ in self._data:
+                if instruction.params:
+                    self._update_parameter_table(instruction)
+            param_iter = iter(parameters[consumed:])
+
+        def checkpoint():
+            consumed = len(parameters) - operator.length_hint(param_iter)
+            self._rep_checkpoints.append((len(self._data), consumed, self.global_phase))
 
         # main loop to build the entanglement and rotation layers
-        for i in range(self.reps):
+        for i in range(start, self.reps):
+            checkpoint()
+
             # insert barrier if specified and there is a preceding layer
             if self._insert_barriers and (i > 0 or len(self._prepended_blocks) > 0):
                 self.barrier()
@@ -894,14 +1044,17 @@ class NLocal(BlueprintCircuit):
             # build the entanglement layer
             self._build_entanglement_layer(param_iter, i)
 
+        checkpoint()
+
         # add the final rotation layer
         if not self._skip_final_rotation_layer:
             if self.insert_barriers:
                 self.barrier()
-            self._build_rotation_layer(param_iter, i)
+            self._build_rotation_layer(param_iter, self.reps - 1)
 
         # add the appended layers
         self._build_additional_layers('appended')
+        self._built_data = list(self._data)
 
     # pylint: disable=unused-argument
     def _parameter_generator(self, rep: int, block: int, indices: List[int]) -> Optional[Parameter]:
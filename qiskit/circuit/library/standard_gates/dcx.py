@@ -46,6 +46,8 @@ class DCXGate(Gate):
             \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self):
         """Create new DCX gate."""
         super().__init__('dcx', 2, [])
@@ -49,6 +49,8 @@ class HGate(Gate):
             \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new H gate."""
         super().__init__('h', 1, [], label=label)
@@ -151,6 +153,8 @@ class CHGate(ControlledGate):
                     0 & 0 & 1 & -1
                 \end{pmatrix}
     """
+
+    _cache_definitions = True
     # Define class constants. This saves future allocation time.
     _sqrt2o2 = 1 / numpy.sqrt(2)
     _matrix1 = numpy.array([[1, 0, 0, 0],
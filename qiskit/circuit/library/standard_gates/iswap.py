@@ -77,6 +77,8 @@ class iSwapGate(Gate):
             \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self):
         """Create new iSwap gate."""
         super().__init__('iswap', 2, [])
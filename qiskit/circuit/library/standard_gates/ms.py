@@ -29,6 +29,8 @@ class MSGate(Gate):
     and is thus reduced to the RXXGate.
     """
 
+    _cache_definitions = True
+
     @deprecate_arguments({'n_qubits': 'num_qubits'})
     def __init__(self, num_qubits, theta, *, n_qubits=None,  # pylint:disable=unused-argument
                  label=None):
@@ -44,6 +44,9 @@ class RGate(Gate):
                 -i e^{i \phi} \sin{\th} & \cos{\th}
             \end{pmatrix}
     """
+
+    _cache_definitions = True
+
     def __init__(self, theta, phi):
         """Create new r single-qubit gate."""
         super().__init__('r', 1, [theta, phi])
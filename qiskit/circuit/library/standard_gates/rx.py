@@ -46,6 +46,8 @@ class RXGate(Gate):
             \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None):
         """Create new RX gate."""
         super().__init__('rx', 1, [theta], label=label)
@@ -163,6 +165,8 @@ class CRXGate(ControlledGate, metaclass=CRXMeta):
                 \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None, ctrl_state=None):
         """Create new CRX gate."""
         super().__init__('crx', 2, [theta], num_ctrl_qubits=1,
@@ -68,6 +68,8 @@ class RXXGate(Gate):
                                     \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta):
         """Create new RXX gate."""
         super().__init__('rxx', 2, [theta])
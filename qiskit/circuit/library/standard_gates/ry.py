@@ -46,6 +46,8 @@ class RYGate(Gate):
             \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None):
         """Create new RY gate."""
         super().__init__('ry', 1, [theta], label=label)
@@ -163,6 +165,8 @@ class CRYGate(ControlledGate, metaclass=CRYMeta):
                 \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None, ctrl_state=None):
         """Create new CRY gate."""
         super().__init__('cry', 2, [theta], num_ctrl_qubits=1, label=label,
@@ -69,6 +69,8 @@ class RYYGate(Gate):
                                     \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta):
         """Create new RYY gate."""
         super().__init__('ryy', 2, [theta])
@@ -56,6 +56,8 @@ class RZGate(Gate):
         `1612.00858 <https://arxiv.org/abs/1612.00858>`_
     """
 
+    _cache_definitions = True
+
     def __init__(self, phi, label=None):
         """Create new RZ gate."""
         super().__init__('rz', 1, [phi], label=label)
@@ -180,6 +182,8 @@ class CRZGate(ControlledGate, metaclass=CRZMeta):
         phase difference.
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None, ctrl_state=None):
         """Create new CRZ gate."""
         super().__init__('crz', 2, [theta], num_ctrl_qubits=1, label=label,
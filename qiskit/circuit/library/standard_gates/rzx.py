@@ -114,6 +114,8 @@ class RZXGate(Gate):
                                     \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta):
         """Create new RZX gate."""
         super().__init__('rzx', 2, [theta])
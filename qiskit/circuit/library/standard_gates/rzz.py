@@ -81,6 +81,8 @@ class RZZGate(Gate):
                                     \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta):
         """Create new RZZ gate."""
         super().__init__('rzz', 2, [theta])
@@ -47,6 +47,8 @@ class SGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new S gate."""
         super().__init__('s', 1, [], label=label)
@@ -103,6 +105,8 @@ class SdgGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new Sdg gate."""
         super().__init__('sdg', 1, [], label=label)
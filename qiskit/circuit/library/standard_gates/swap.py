@@ -52,6 +52,8 @@ class SwapGate(Gate):
         |a, b\rangle \rightarrow |b, a\rangle
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new SWAP gate."""
         super().__init__('swap', 2, [], label=label)
@@ -187,6 +189,8 @@ class CSwapGate(ControlledGate, metaclass=CSwapMeta):
         |0, b, c\rangle \rightarrow |0, b, c\rangle
         |1, b, c\rangle \rightarrow |1, c, b\rangle
     """
+
+    _cache_definitions = True
     # Define class constants. This saves future allocation time.
     _matrix1 = numpy.array([[1, 0, 0, 0, 0, 0, 0, 0],
                             [0, 1, 0, 0, 0, 0, 0, 0],
@@ -48,6 +48,8 @@ class TGate(Gate):
     Equivalent to a :math:`\pi/4` radian rotation about the Z axis.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new T gate."""
         super().__init__('t', 1, [], label=label)
@@ -104,6 +106,8 @@ class TdgGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new Tdg gate."""
         super().__init__('tdg', 1, [], label=label)
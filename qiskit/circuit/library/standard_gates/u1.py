@@ -75,6 +75,8 @@ class U1Gate(Gate):
         `1612.00858 <https://arxiv.org/abs/1612.00858>`_
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None):
         """Create new U1 gate."""
         super().__init__('u1', 1, [theta], label=label)
@@ -170,6 +172,8 @@ class CU1Gate(ControlledGate, metaclass=CU1Meta):
         phase difference.
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, label=None, ctrl_state=None):
         """Create new CU1 gate."""
         super().__init__('cu1', 2, [theta], num_ctrl_qubits=1, label=label,
@@ -276,6 +280,8 @@ class MCU1Gate(ControlledGate):
         The singly-controlled-version of this gate.
     """
 
+    _cache_definitions = True
+
     def __init__(self, lam, num_ctrl_qubits, label=None):
         """Create new MCU1 gate."""
         super().__init__('mcu1', num_ctrl_qubits + 1, [lam], num_ctrl_qubits=num_ctrl_qubits,
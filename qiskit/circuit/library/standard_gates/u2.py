@@ -59,6 +59,8 @@ class U2Gate(Gate):
         using two X90 pulses.
     """
 
+    _cache_definitions = True
+
     def __init__(self, phi, lam, label=None):
         """Create new U2 gate."""
         super().__init__('u2', 1, [phi, lam], label=label)
@@ -170,6 +170,8 @@ class CU3Gate(ControlledGate, metaclass=CU3Meta):
                 \end{pmatrix}
     """
 
+    _cache_definitions = True
+
     def __init__(self, theta, phi, lam, label=None, ctrl_state=None):
         """Create new CU3 gate."""
         super().__init__('cu3', 2, [theta, phi, lam], num_ctrl_qubits=1,
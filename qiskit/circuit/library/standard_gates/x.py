@@ -70,6 +70,8 @@ class XGate(Gate):
         |1\rangle \rightarrow |0\rangle
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new X gate."""
         super().__init__('x', 1, [], label=label)
@@ -315,6 +317,8 @@ class CCXGate(ControlledGate, metaclass=CCXMeta):
 
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CCX gate."""
         super().__init__('ccx', 3, [], num_ctrl_qubits=2, label=label,
@@ -409,6 +413,8 @@ class RCCXGate(Gate):
     of Fig. 3.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create a new simplified CCX gate."""
         super().__init__('rccx', 3, [], label=label)
@@ -591,6 +597,8 @@ class RC3XGate(Gate):
     of Fig. 4.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create a new RC3X gate."""
         super().__init__('rcccx', 4, [], label=label)
@@ -674,6 +682,8 @@ class C4XGate(ControlledGate):
         [1] Barenco et al., 1995. https://arxiv.org/pdf/quant-ph/9503016.pdf
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None, ctrl_state=None):
         """Create a new 4-qubit controlled X gate."""
         super().__init__('mcx', 5, [], num_ctrl_qubits=4, label=label, ctrl_state=ctrl_state)
@@ -759,6 +769,8 @@ class C4XGate(ControlledGate):
 class MCXGate(ControlledGate):
     """The general, multi-controlled X gate."""
 
+    _cache_definitions = True
+
     def __new__(cls, num_ctrl_qubits=None, label=None, ctrl_state=None):
         """Create a new MCX instance.
 
@@ -842,6 +854,8 @@ class MCXGrayCode(MCXGate):
     This delegates the implementation to the MCU1 gate, since :math:`X = H \cdot U1(\pi) \cdot H`.
     """
 
+    _cache_definitions = True
+
     def __init__(self, num_ctrl_qubits, label=None, ctrl_state=None):
         super().__init__(num_ctrl_qubits, label=label, ctrl_state=ctrl_state, _name='mcx_gray')
 
@@ -866,6 +880,8 @@ class MCXRecursive(MCXGate):
     for these we have a concrete implementation that do not require ancillas.
     """
 
+    _cache_definitions = True
+
     def __init__(self, num_ctrl_qubits, label=None, ctrl_state=None):
         super().__init__(num_ctrl_qubits, label=label, ctrl_state=ctrl_state, _name='mcx_recursive')
 
@@ -917,6 +933,9 @@ class MCXRecursive(MCXGate):
 class MCXVChain(MCXGate):
     """Implement the multi-controlled X gate using a V-chain of CX gates."""
 
+    # the definition also depends on whether the ancillas are dirty
+    _cache_definitions = False
+
     def __new__(cls, num_ctrl_qubits=None, dirty_ancillas=False,  # pylint: disable=unused-argument
                 label=None, ctrl_state=None):
         """Create a new MCX instance.
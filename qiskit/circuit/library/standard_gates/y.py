@@ -65,6 +65,8 @@ class YGate(Gate):
         |1\rangle \rightarrow -i|0\rangle
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new Y gate."""
         super().__init__('y', 1, [], label=label)
@@ -173,6 +175,8 @@ class CYGate(ControlledGate, metaclass=CYMeta):
                 \end{pmatrix}
 
     """
+
+    _cache_definitions = True
     # Define class constants. This saves future allocation time.
     _matrix1 = numpy.array([[1, 0, 0, 0],
                             [0, 0, 0, -1j],
@@ -64,6 +64,8 @@ class ZGate(Gate):
         |1\rangle \rightarrow -|1\rangle
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None):
         """Create new Z gate."""
         super().__init__('z', 1, [], label=label)
@@ -150,6 +152,8 @@ class CZGate(ControlledGate, metaclass=CZMeta):
     the target qubit if the control qubit is in the :math:`|1\rangle` state.
     """
 
+    _cache_definitions = True
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CZ gate."""
         super().__init__('cz', 2, [], label=label, num_ctrl_qubits=1,
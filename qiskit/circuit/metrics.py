@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Incrementally maintained metrics of a QuantumCircuit."""
+
+import copy
+import itertools
+
+# Compiler and simulator directives, which are not counted as operations.
+_DIRECTIVES = ('barrier', 'snapshot')
+
+
+class CircuitMetrics:
+    """Size, depth, operation counts and connected components of a circuit.
+
+    The metrics are computed as in the corresponding methods of
+    :class:`~qiskit.circuit.QuantumCircuit`, but are kept between calls to
+    :meth:`update`, which only processes the instructions appended to the
+    circuit since the previous call. If the instructions already processed
+    were replaced or removed, or one of them was given a condition with
+    :meth:`~qiskit.circuit.Instruction.c_if`, the metrics are computed again
+    from the start.
+    """
+
+    # Number of times the condition of an instruction processed by the metrics
+    # of any circuit was changed.
+    _condition_changes = 0
+
+    def __init__(self, circuit):
+        """Create the metrics of a circuit.
+
+        Args:
+            circuit (QuantumCircuit): the circuit.
+        """
+        self._circuit = circuit
+        self._data = None
+        self._processed = 0
+        self._last = None
+        self._seen_condition_changes = CircuitMetrics._condition_changes
+        self.size = 0
+        self.depth = 0
+        self.num_nonlocal_gates = 0
+        self.counts = {}
+        self._levels = {}
+        self._components = _DisjointBits()
+        self._unitary_components = _DisjointBits()
+
+    @classmethod
+    def condition_changed(cls):
+        """Record that the condition of a processed instruction was changed.
+
+        Instructions are not tied to a circuit, so the metrics of all the
+        circuits are computed again on their next update.
+        """
+        cls._condition_changes += 1
+
+    def reset(self):
+        """Forget the processed instructions, so the next update processes all of them."""
+        self._data = None
+        self._processed = 0
+        self._last = None
+        self.size = 0
+        self.depth = 0
+        self.num_nonlocal_gates = 0
+        self.counts = {}
+        self._levels = {}
+        self._components = _DisjointBits()
+        self._unitary_components = _DisjointBits()
+
+    def copy(self, circuit):
+        """Return a copy of the metrics, for a copy of the circuit.
+
+        Args:
+            circuit (QuantumCircuit): the copy of the circuit.
+
+        Returns:
+            CircuitMetrics: the metrics of ``circuit``.
+        """
+        cpy = copy.copy(self)
+        cpy._circuit = circuit
+        cpy._data = circuit._data if self._data is not None else None
+        cpy.counts = self.counts.copy()
+        cpy._levels = self._levels.copy()
+        cpy._components = self._components.copy()
+        cpy._unitary_components = self._unitary_components.copy()
+        return cpy
+
+    def update(self):
+        """Process the instructions appended to the circuit since the last update."""
+        data = self._circuit._data
+        if (data is not self._data or len(data) < self._processed
+                or self._processed and data[self._processed - 1] is not self._last
+                or self._seen_condition_changes != CircuitMetrics._condition_changes):
+            self.reset()
+            self._data = data
+            self._seen_condition_changes = CircuitMetrics._condition_changes
+        for instruction, qargs, cargs in itertools.islice(data, self._processed, None):
+            self._add(instruction, qargs, cargs)
+        self._processed = len(data)
+        self._last = data[-1] if data else None
+
+    def num_connected_components(self, unitary_only=False):
+        """Return the number of connected components of the processed instructions.
+
+        Args:
+            unitary_only (bool): only count the components of the qubits.
+
+        Returns:
+            int: Number of connected components.
+        """
+        if unitary_only:
+            return len(self._circuit.qubits) - self._unitary_components.merges
+        return (len(self._circuit.qubits) + len(self._circuit.clbits)
+                - self._components.merges)
+
+    def _add(self, instruction, qargs, cargs):
+        instruction._metrics_processed = True
+        name = instruction.name
+        self.counts[name] = self.counts.get(name, 0) + 1
+        directive = name in _DIRECTIVES
+        if not directive:
+            self.size += 1
+            if instruction.num_qubits > 1:
+                self.num_nonlocal_gates += 1
+
+        # Stack the operation on its bits, and on the bits of the register of
+        # its condition, as QuantumCircuit.depth does.
+        bits = qargs + cargs
+        condition_bits = []
+        if instruction.condition:
+            condition_bits = [bit for bit in instruction.condition[0] if bit not in bits]
+        if bits or condition_bits:
+            levels = self._levels
+            level = max([levels.get(bit, 0) + (not directive) for bit in bits]
+                        + [levels.get(bit, 0) + 1 for bit in condition_bits])
+            for bit in itertools.chain(bits, condition_bits):
+                levels[bit] = level
+            if level > self.depth:
+                self.depth = level
+
+        if directive:
+            return
+        if len(qargs) > 1:
+            self._unitary_components.join(qargs)
+        if len(bits) + bool(instruction.condition) > 1:
+            self._components.join(bits + list(instruction.condition[0])
+                                  if instruction.condition else bits)
+
+
+class _DisjointBits:
+    """Union-find of bits, counting the merges of two sets."""
+
+    def __init__(self):
+        self._parents = {}
+        self.merges = 0
+
+    def copy(self):
+        """Return a copy of the sets."""
+        cpy = _DisjointBits()
+        cpy._parents = self._parents.copy()
+        cpy.merges = self.merges
+        return cpy
+
+    def _find(self, bit):
+        parents = self._parents
+        parent = parents.get(bit, bit)
+        while parent is not bit and parent != bit:
+            grandparent = parents.get(parent, parent)
+            parents[bit] = grandparent
+            bit, parent = grandparent, parents.get(grandparent, grandparent)
+        return bit
+
+    def join(self, bits):
+        """Merge the sets of the bits."""
+        root = self._find(bits[0])
+        for bit in bits[1:]:
+            other = self._find(bit)
+            if other is not root and other != root:
+                self._parents[other] = root
+                self.merges += 1
@@ -43,12 +43,13 @@ class Parameter(ParameterExpression):
 
         return (self.name, self._uuid)
 
-    def __init__(self, name):
+    def __init__(self, name):  # pylint: disable=super-init-not-called
         self._name = name
 
-        from sympy import Symbol
-        symbol = Symbol(name)
-        super().__init__(symbol_map={self: symbol}, expr=symbol)
+        # the sympy symbol of the parameter is only created if it is needed
+        self._symbols = None
+        self._expr = None
+        self._affine = ({self: 1}, 0)
 
     def subs(self, parameter_map):
         """Substitute self with the corresponding parameter in parameter_map."""
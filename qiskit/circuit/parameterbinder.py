@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Binding of the parameters of a circuit to arrays of values."""
+
+import copy
+
+import numpy
+
+from .exceptions import CircuitError
+from .parameter import Parameter
+from .parameterexpression import ParameterExpression
+from .parametertable import ParameterTable
+
+
+class ParameterBinder:
+    """Bind the parameters of a circuit to vectors of values.
+
+    The positions of the parameters in the instructions of the circuit are
+    found once, when the binder is created. Binding a vector of values, or a
+    2-D array with one vector of values per row, then copies the parameterized
+    instructions with float parameters, without substituting the parameters in
+    symbolic expressions or looking them up in dictionaries. Parameter
+    expressions, such as the products of the
+    :class:`~qiskit.circuit.library.ZZFeatureMap`, are compiled to a single
+    NumPy function and evaluated for all the rows of the array at once.
+
+    The instructions without parameters are shared by the bound circuits, and
+    should be replaced by copies rather than modified in place.
+
+    Example::
+
+        import numpy
+        from qiskit.circuit.library import ZZFeatureMap
+
+        feature_map = ZZFeatureMap(4)
+        binder = feature_map.parameter_binder()
+        circuits = binder(numpy.random.random((1000, 4)))
+    """
+
+    def __init__(self, circuit, parameters):
+        """Create a binder of the parameters of a circuit.
+
+        Args:
+            circuit (QuantumCircuit): the circuit to bind.
+            parameters (list[Parameter]): the parameters of the circuit, in the order of
+                the values to bind.
+
+        Raises:
+            CircuitError: if the parameters are not distinct, or do not include all the
+                parameters of the circuit.
+        """
+        columns = {parameter: column for column, parameter in enumerate(parameters)}
+        if len(columns) != len(parameters):
+            raise CircuitError('The parameters to bind are not distinct.')
+        missing = circuit.parameters - columns.keys()
+        if missing:
+            raise CircuitError('The parameters {} of the circuit are not bound.'.format(
+                sorted(str(parameter) for parameter in missing)))
+
+        # the bound circuits are copies of a circuit without parameter table
+        self._circuit = circuit.copy()
+        self._circuit._parameter_table = ParameterTable()
+        self._num_parameters = len(parameters)
+
+        # the data indices and parameter indices of the parameterized instructions; their
+        # values are numbered in order and taken from a column of the values if they are
+        # parameters, or computed from the values if they are expressions
+        self._slots = []
+        self._definitions = {}
+        self._phase_slot = None
+        direct, expressions = [], []
+
+        def add_slot(param):
+            if isinstance(param, Parameter):
+                direct.append((len(direct) + len(expressions), columns[param]))
+            else:
+                expressions.append((len(direct) + len(expressions), param))
+
+        for index, (instruction, _, _) in enumerate(self._circuit._data):
+            param_indices = []
+            for param_index, param in enumerate(instruction.params):
+                if isinstance(param, ParameterExpression) and param.parameters:
+                    param_indices.append(param_index)
+                    add_slot(param)
+                    if instruction._definition is not None:
+                        self._definitions.setdefault(index, set()).update(param.parameters)
+            if param_indices:
+                self._slots.append((index, param_indices))
+
+        phase = self._circuit.global_phase
+        if isinstance(phase, ParameterExpression) and phase.parameters:
+            self._phase_slot = len(direct) + len(expressions)
+            add_slot(phase)
+
+        self._num_slots = len(direct) + len(expressions)
+        self._direct_slots = numpy.array([slot for slot, _ in direct], dtype=int)
+        self._direct_columns = numpy.array([column for _, column in direct], dtype=int)
+        self._expression_slots = [slot for slot, _ in expressions]
+        self._expressions = None
+        if expressions:
+            self._expressions = _compile([expr for _, expr in expressions], columns)
+
+        # the columns of the parameters of the instructions with a definition to rebind
+        self._definitions = {index: [(parameter, columns[parameter]) for parameter in params]
+                             for index, params in self._definitions.items()}
+
+    @property
+    def num_parameters(self):
+        """The number of values to bind."""
+        return self._num_parameters
+
+    def __call__(self, values):
+        """Bind the parameters of the circuit.
+
+        Args:
+            values (array_like): the values of the parameters, either a vector with one value
+                per parameter, or a 2-D array with a vector of values per row.
+
+        Returns:
+            QuantumCircuit or list[QuantumCircuit]: the bound circuit if ``values`` is a
+            vector, otherwise the list of bound circuits, one per row of ``values``.
+
+        Raises:
+            CircuitError: if ``values`` is not a vector or 2-D array with one value per
+                parameter.
+        """
+        values = numpy.asarray(values, dtype=float)
+        if values.ndim not in (1, 2) or values.shape[-1] != self._num_parameters:
+            raise CircuitError('The values must be a vector or 2-D array of {} values per '
+                               'row, but have the shape {}.'.format(
+                                   self._num_parameters, values.shape))
+        rows = values.reshape(-1, self._num_parameters)
+
+        slot_values = numpy.empty((len(rows), self._num_slots))
+        slot_values[:, self._direct_slots] = rows[:, self._direct_columns]
+        if self._expressions is not None:
+            results = self._expressions(*rows.T)
+            for slot, result in zip(self._expression_slots, results):
+                slot_values[:, slot] = numpy.real(result)
+
+        circuits = [self._bind(row, slot_row)
+                    for row, slot_row in zip(rows, slot_values.tolist())]
+        return circuits[0] if values.ndim == 1 else circuits
+
+    def _bind(self, row, slot_row):
+        """Return a copy of the circuit with the parameterized instructions replaced."""
+        # the instructions without parameters are shared with the other bound circuits
+        bound = self._circuit._copy_registers()
+        bound._parameter_table = ParameterTable()
+        bound._data = data = self._circuit._data.copy()
+        if bound._metrics is not None:
+            bound._metrics = self._circuit._metrics.copy(bound)
+        position = 0
+        for index, param_indices in self._slots:
+            instruction, qargs, cargs = data[index]
+            if index in self._definitions:
+                instruction = instruction.copy()
+                for parameter, column in self._definitions[index]:
+                    bound._rebind_definition(instruction, parameter, float(row[column]))
+            else:
+                instruction = copy.copy(instruction)
+            params = instruction._params = list(instruction._params)
+            for param_index in param_indices:
+                params[param_index] = slot_row[position]
+                position += 1
+            data[index] = (instruction, qargs, cargs)
+        if self._phase_slot is not None:
+            bound.global_phase = slot_row[self._phase_slot]
+        return bound
+
+
+def _compile(expressions, columns):
+    """Compile parameter expressions to a function of the columns of the values."""
+    from sympy import Symbol, lambdify
+
+    symbols = [Symbol('_x{}'.format(column)) for column in range(len(columns))]
+    exprs = []
+    for expr in expressions:
+        # pylint: disable=protected-access
+        replacements = {symbol: symbols[columns[parameter]]
+                        for parameter, symbol in expr._parameter_symbols.items()}
+        exprs.append(expr._symbol_expr.xreplace(replacements))
+    return lambdify(symbols, exprs, modules='numpy')
@@ -15,8 +15,10 @@
 ParameterExpression Class to enable creating simple expressions of Parameters.
 """
 
+import math
 import numbers
 import operator
+from fractions import Fraction
 
 import numpy
 
@@ -24,7 +26,14 @@ from qiskit.circuit.exceptions import CircuitError
 
 
 class ParameterExpression():
-    """ParameterExpression class to enable creating expressions of Parameters."""
+    """ParameterExpression class to enable creating expressions of Parameters.
+
+    Affine expressions of the parameters, such as ``2 * theta + 1`` or sums of
+    parameters, are stored as the coefficients of their parameters and their
+    constant term. Operations on them, binding, comparison and hashing only use
+    numeric arithmetic, and their sympy expression is created when it is needed,
+    e.g. to print them or to multiply two parameters.
+    """
 
     def __init__(self, symbol_map, expr):
         """Create a new ParameterExpression.
@@ -37,12 +46,35 @@ class ParameterExpression():
                                serving as their placeholder in expr.
             expr (sympy.Expr): Expression of sympy.Symbols.
         """
-        self._parameter_symbols = symbol_map
-        self._symbol_expr = expr
+        self._symbols = symbol_map
+        self._expr = expr
+        self._affine = _affine_form(symbol_map, expr)
+
+    @property
+    def _parameter_symbols(self):
+        """The mapping of the parameters to their sympy symbols."""
+        if self._symbols is None:
+            from sympy import Symbol
+            self._symbols = {parameter: Symbol(parameter.name) for parameter in self._affine[0]}
+        return self._symbols
+
+    @property
+    def _symbol_expr(self):
+        """The sympy expression of the symbols of the parameters."""
+        if self._expr is None:
+            symbols = self._parameter_symbols
+            coeffs, constant = self._affine
+            expr = _sympify(constant)
+            for parameter, coeff in coeffs.items():
+                expr = expr + _sympify(coeff) * symbols[parameter]
+            self._expr = expr
+        return self._expr
 
     @property
     def parameters(self):
         """Returns a set of the unbound Parameters in the expression."""
+        if self._affine is not None:
+            return set(self._affine[0])
         return set(self._parameter_symbols.keys())
 
     def conjugate(self):
@@ -71,6 +103,24 @@ class ParameterExpression():
         self._raise_if_passed_unknown_parameters(parameter_values.keys())
         self._raise_if_passed_non_real_value(parameter_values)
 
+        if self._affine is not None:
+            coeffs, constant = self._affine
+            free_coeffs = {}
+            for parameter, coeff in coeffs.items():
+                if parameter not in parameter_values:
+                    free_coeffs[parameter] = coeff
+                elif coeff != 0:
+                    # as in sympy, terms with a zero coefficient vanish
+                    constant = _number(constant + coeff * parameter_values[parameter])
+
+            if math.isinf(constant):
+                raise ZeroDivisionError('Binding provided for expression '
+                                        'results in division by zero '
+                                        '(Expression: {}, Bindings: {}).'.format(
+                                            self, parameter_values))
+
+            return _affine_expression(free_coeffs, constant)
+
         symbol_values = {self._parameter_symbols[parameter]: value
                          for parameter, value in parameter_values.items()}
         bound_symbol_expr = self._symbol_expr.subs(symbol_values)
@@ -118,6 +168,19 @@ class ParameterExpression():
         self._raise_if_passed_unknown_parameters(parameter_map.keys())
         self._raise_if_parameter_names_conflict(inbound_parameters, parameter_map.keys())
 
+        if self._affine is not None and all(replacement._affine is not None
+                                            for replacement in parameter_map.values()):
+            coeffs, constant = self._affine
+            new_coeffs = {p: c for p, c in coeffs.items() if p not in parameter_map}
+            for old_param, replacement in parameter_map.items():
+                coeff = coeffs[old_param]
+                replacement_coeffs, replacement_constant = replacement._affine
+                for parameter, replacement_coeff in replacement_coeffs.items():
+                    new_coeffs[parameter] = _number(new_coeffs.get(parameter, 0)
+                                                    + coeff * replacement_coeff)
+                constant = constant + coeff * replacement_constant
+            return _affine_expression(new_coeffs, _number(constant))
+
         from sympy import Symbol
         new_parameter_symbols = {p: Symbol(p.name)
                                  for p in inbound_parameters}
@@ -190,18 +253,29 @@ class ParameterExpression():
                 operation.
         """
 
-        self_expr = self._symbol_expr
-
         if isinstance(other, ParameterExpression):
-            self._raise_if_parameter_names_conflict(other._parameter_symbols.keys())
+            self._raise_if_parameter_names_conflict(other.parameters)
+            other_affine = other._affine
+        elif isinstance(other, numbers.Real) and numpy.isfinite(other):
+            other_affine = ({}, other)
+        else:
+            return NotImplemented
 
+        if self._affine is not None and other_affine is not None:
+            if reflected:
+                affine = _affine_operation(operation, other_affine, self._affine)
+            else:
+                affine = _affine_operation(operation, self._affine, other_affine)
+            if affine is not None:
+                return _affine_expression(*affine)
+
+        self_expr = self._symbol_expr
+        if isinstance(other, ParameterExpression):
             parameter_symbols = {**self._parameter_symbols, **other._parameter_symbols}
             other_expr = other._symbol_expr
-        elif isinstance(other, numbers.Real) and numpy.isfinite(other):
+        else:
             parameter_symbols = self._parameter_symbols.copy()
             other_expr = other
-        else:
-            return NotImplemented
 
         if reflected:
             expr = operation(other_expr, self_expr)
@@ -249,6 +323,8 @@ class ParameterExpression():
         if self.parameters:
             raise TypeError('ParameterExpression with unbound parameters ({}) '
                             'cannot be cast to a float.'.format(self.parameters))
+        if self._affine is not None:
+            return float(self._affine[1])
         return float(self._symbol_expr)
 
     def __copy__(self):
@@ -258,7 +334,112 @@ class ParameterExpression():
         return self
 
     def __eq__(self, other):
+        if not isinstance(other, ParameterExpression):
+            return False
+
+        # an expression which is affine is always stored as such, so it cannot be equal
+        # to an expression which is not
+        if self._affine is not None or other._affine is not None:
+            return self._affine == other._affine
+
         from sympy import srepr
-        return (isinstance(other, ParameterExpression)
-                and self.parameters == other.parameters
+        return (self.parameters == other.parameters
                 and srepr(self._symbol_expr) == srepr(other._symbol_expr))
+
+    def __hash__(self):
+        if self._affine is not None:
+            coeffs, constant = self._affine
+            if constant == 0 and len(coeffs) == 1:
+                # equal to the parameter itself if its coefficient is 1
+                (parameter, coeff), = coeffs.items()
+                if coeff == 1:
+                    return hash(parameter)
+            return hash((frozenset(coeffs.items()), constant))
+        return hash((frozenset(self._parameter_symbols), self._symbol_expr))
+
+
+def _affine_expression(coeffs, constant):
+    """Return the affine ParameterExpression with the coefficients and constant term."""
+    expression = ParameterExpression.__new__(ParameterExpression)
+    expression._symbols = None
+    expression._expr = None
+    expression._affine = (coeffs, constant)
+    return expression
+
+
+def _number(value):
+    """Return a zero or an exact integer as an int, as sympy does."""
+    if value == 0:
+        return 0
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return int(value)
+    return value
+
+
+def _divide(numerator, denominator):
+    """Divide exactly if both numbers are rational, as sympy does."""
+    if isinstance(numerator, numbers.Rational) and isinstance(denominator, numbers.Rational):
+        return _number(Fraction(numerator) / Fraction(denominator))
+    return numerator / denominator
+
+
+def _affine_operation(operation, left, right):
+    """Apply an operation to affine forms, or return None if the result is not affine."""
+    left_coeffs, left_constant = left
+    right_coeffs, right_constant = right
+
+    if operation in (operator.add, operator.sub):
+        coeffs = dict(left_coeffs)
+        for parameter, coeff in right_coeffs.items():
+            coeffs[parameter] = _number(operation(coeffs.get(parameter, 0), coeff))
+        return coeffs, _number(operation(left_constant, right_constant))
+
+    if operation is operator.mul:
+        if not right_coeffs:
+            coeffs, scale, constant = left_coeffs, right_constant, left_constant
+        elif not left_coeffs:
+            coeffs, scale, constant = right_coeffs, left_constant, right_constant
+        else:
+            return None
+        return ({parameter: _number(coeff * scale) for parameter, coeff in coeffs.items()},
+                _number(constant * scale))
+
+    if operation is operator.truediv and not right_coeffs and right_constant != 0:
+        return ({parameter: _divide(coeff, right_constant)
+                 for parameter, coeff in left_coeffs.items()},
+                _divide(left_constant, right_constant))
+
+    return None
+
+
+def _sympify(value):
+    """Convert a number of an affine form to sympy."""
+    from sympy import Rational, sympify
+    if isinstance(value, Fraction):
+        return Rational(value.numerator, value.denominator)
+    return sympify(value)
+
+
+def _affine_form(symbol_map, expr):
+    """Return the coefficients and constant term of a sympy expression, if it is affine
+    with rational or float coefficients, otherwise None."""
+    from sympy import Add
+    parameters = {symbol: parameter for parameter, symbol in symbol_map.items()}
+    coeffs = dict.fromkeys(symbol_map, 0)
+    constant = 0
+    for term in Add.make_args(expr):
+        coeff, factor = term.as_coeff_Mul()
+        if coeff.is_Rational:
+            coeff = _number(Fraction(int(coeff.p), int(coeff.q)))
+        elif coeff.is_Float:
+            coeff = float(coeff)
+        else:
+            return None
+        if factor == 1:
+            constant = _number(constant + coeff)
+        elif factor in parameters:
+            parameter = parameters[factor]
+            coeffs[parameter] = _number(coeffs[parameter] + coeff)
+        else:
+            return None
+    return coeffs, constant
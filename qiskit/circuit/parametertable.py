@@ -14,9 +14,56 @@
 """
 Look-up table for variable parameters in QuantumCircuit.
 """
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 
-from .instruction import Instruction
+
+class ParameterReferences(Sequence):
+    """The ``(instruction, param_index)`` slots of the parameters of instructions
+    depending on a circuit parameter.
+
+    The slots are kept in insertion order, together with a set of their keys,
+    such that checking if a slot is present takes constant time. Slots are
+    compared by the identity of their instruction.
+    """
+
+    __slots__ = ['_slots', '_keys']
+
+    def __init__(self, slots=()):
+        self._slots = []
+        self._keys = set()
+        for slot in slots:
+            self.append(slot)
+
+    def append(self, slot):
+        """Add a slot, if it is not present yet.
+
+        Args:
+            slot (tuple): the ``(instruction, param_index)`` to add.
+        """
+        key = (id(slot[0]), slot[1])
+        if key not in self._keys:
+            self._keys.add(key)
+            self._slots.append(slot)
+
+    def __contains__(self, slot):
+        return (id(slot[0]), slot[1]) in self._keys
+
+    def __getitem__(self, index):
+        return self._slots[index]
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __eq__(self, other):
+        if isinstance(other, (ParameterReferences, list)):
+            return self._slots == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return 'ParameterReferences({0})'.format(repr(self._slots))
 
 
 class ParameterTable(MutableMapping):
@@ -27,11 +74,13 @@ class ParameterTable(MutableMapping):
     def __init__(self, *args, **kwargs):
         """
         the structure of _table is,
-           {var_object: [(instruction_object, parameter_index), ...]}
+           {var_object: ParameterReferences([(instruction_object, parameter_index), ...])}
         """
-        self._table = dict(*args, **kwargs)
-        self._keys = set(self._table)
-        self._names = set(x.name for x in self._table)
+        self._table = {}
+        self._keys = set()
+        self._names = set()
+        for parameter, instr_params in dict(*args, **kwargs).items():
+            self[parameter] = instr_params
 
     def __getitem__(self, key):
         return self._table[key]
@@ -44,14 +93,32 @@ class ParameterTable(MutableMapping):
             instr_params (list): List of (Instruction, int) tuples. Int is the
               parameter index at which the parameter appears in the instruction.
         """
-
-        for instruction, param_index in instr_params:
-            assert isinstance(instruction, Instruction)
-            assert isinstance(param_index, int)
+        if not isinstance(instr_params, ParameterReferences):
+            instr_params = ParameterReferences(instr_params)
         self._table[parameter] = instr_params
         self._keys.add(parameter)
         self._names.add(parameter.name)
 
+    def slots_for(self, parameters):
+        """Return the slots of the instruction parameters depending on any of ``parameters``.
+
+        Args:
+            parameters (Iterable[Parameter]): the parameters. Those not in the table
+                are ignored.
+
+        Returns:
+            list[tuple]: the distinct ``(instruction, param_index)`` slots, in the order of
+            ``parameters``.
+        """
+        table = self._table
+        slots = ParameterReferences()
+        for parameter in parameters:
+            references = table.get(parameter)
+            if references is not None:
+                for slot in references:
+                    slots.append(slot)
+        return slots._slots
+
     def get_keys(self):
         """Return a set of all keys in the parameter table
 
@@ -15,6 +15,7 @@
 """Quantum circuit object."""
 
 import copy
+import io
 import itertools
 import sys
 import warnings
@@ -26,13 +27,12 @@ from qiskit.exceptions import QiskitError
 from qiskit.util import is_main_process
 from qiskit.util import deprecate_arguments
 from qiskit.circuit.instruction import Instruction
-from qiskit.circuit.gate import Gate
 from qiskit.qasm.qasm import Qasm
 from qiskit.circuit.exceptions import CircuitError
 from .parameterexpression import ParameterExpression
 from .quantumregister import QuantumRegister, Qubit, AncillaRegister
 from .classicalregister import ClassicalRegister, Clbit
-from .parametertable import ParameterTable
+from .parametertable import ParameterTable, ParameterReferences
 from .parametervector import ParameterVector
 from .instructionset import InstructionSet
 from .register import Register
@@ -161,6 +161,13 @@ class QuantumCircuit:
         # in the order they were applied.
         self._data = []
 
+        # Whether the instructions may also be in other circuits, in which case
+        # they are copied before being modified, see _unshare_instructions.
+        self._instructions_shared = False
+
+        # Metrics updated with the appended instructions, see track_metrics.
+        self._metrics = None
+
         # This is a map of registers bound to this circuit, by name.
         self.qregs = []
         self.cregs = []
@@ -335,6 +342,7 @@ class QuantumCircuit:
             new_qargs = [new_qubits[num_qubits - old_qubits.index(q) - 1] for q in qargs]
             new_cargs = [new_clbits[num_clbits - old_clbits.index(c) - 1] for c in cargs]
             circ._append(inst, new_qargs, new_cargs)
+        circ._instructions_shared = self._instructions_shared = True
         return circ
 
     def inverse(self):
@@ -500,6 +508,8 @@ class QuantumCircuit:
         circuit = QuantumCircuit(*combined_qregs, *combined_cregs)
         for instruction_context in itertools.chain(self.data, rhs.data):
             circuit._append(*instruction_context)
+        circuit._instructions_shared = self._instructions_shared = True
+        rhs._instructions_shared = True
         circuit.global_phase = self.global_phase + rhs.global_phase
         return circuit
 
@@ -540,6 +550,7 @@ class QuantumCircuit:
         # Add new gates
         for instruction_context in data:
             self._append(*instruction_context)
+        self._instructions_shared = rhs._instructions_shared = True
         self.global_phase += rhs.global_phase
         return self
 
@@ -832,6 +843,70 @@ class QuantumCircuit:
 
         return instruction
 
+    def append_many(self, instructions, validate=True):
+        """Append many instructions to the end of the circuit, modifying the
+        circuit in place.
+
+        This is a faster alternative to calling :meth:`append` in a loop, for
+        programs generating large circuits. The bits of every instruction are
+        given explicitly, as indices in :attr:`qubits` and :attr:`clbits` or
+        as bits of the circuit, and are not broadcast. The whole batch is
+        checked before any instruction is added, so the circuit is not
+        modified if any of them is invalid.
+
+        Example::
+
+            from qiskit.circuit import QuantumCircuit
+            from qiskit.circuit.library import HGate, CXGate, Measure
+
+            circuit = QuantumCircuit(2, 2)
+            circuit.append_many([(HGate(), [0]),
+                                 (CXGate(), [0, 1]),
+                                 (Measure(), [1], [1])])
+
+        Args:
+            instructions (iterable): tuples ``(instruction, qubits)`` or
+                ``(instruction, qubits, clbits)``, where ``qubits`` and
+                ``clbits`` are sequences of indices or bits.
+            validate (bool): if False, the instructions are trusted to be
+                :class:`~qiskit.circuit.Instruction` instances with the right
+                number of distinct bits of this circuit, and are added without
+                any check.
+
+        Raises:
+            CircuitError: if an instruction is not an Instruction, or if its
+                bits are not distinct bits of this circuit, or are not as many
+                as it acts on.
+        """
+        qubits, clbits = self._qubits, self._clbits
+        data = []
+        if validate:
+            qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+            clbit_indices = {clbit: index for index, clbit in enumerate(clbits)}
+        for entry in instructions:
+            instruction, qargs = entry[0], entry[1]
+            cargs = entry[2] if len(entry) > 2 else ()
+            if validate:
+                if not isinstance(instruction, Instruction):
+                    raise CircuitError('object is not an Instruction.')
+                if len(qargs) != instruction.num_qubits or len(cargs) != instruction.num_clbits:
+                    raise CircuitError(
+                        'The amount of qubit/clbit arguments does not match the '
+                        'instruction expectation.')
+                qargs = _checked_bits(qargs, qubits, qubit_indices)
+                cargs = _checked_bits(cargs, clbits, clbit_indices)
+                if len(set(map(id, qargs))) != len(qargs):
+                    raise CircuitError("duplicate qubit arguments")
+            else:
+                qargs = [qarg if isinstance(qarg, Bit) else qubits[qarg] for qarg in qargs]
+                cargs = [carg if isinstance(carg, Bit) else clbits[carg] for carg in cargs]
+            data.append((instruction, qargs, cargs))
+
+        self._data.extend(data)
+        for instruction, _, _ in data:
+            if instruction.params:
+                self._update_parameter_table(instruction)
+
     def _update_parameter_table(self, instruction):
         for param_index, param in enumerate(instruction.params):
             if isinstance(param, ParameterExpression):
@@ -839,9 +914,7 @@ class QuantumCircuit:
 
                 for parameter in param.parameters:
                     if parameter in current_parameters:
-                        if not self._check_dup_param_spec(self._parameter_table[parameter],
-                                                          instruction, param_index):
-                            self._parameter_table[parameter].append((instruction, param_index))
+                        current_parameters[parameter].append((instruction, param_index))
                     else:
                         if parameter.name in self._parameter_table.get_names():
                             raise CircuitError(
@@ -850,12 +923,6 @@ class QuantumCircuit:
 
         return instruction
 
-    def _check_dup_param_spec(self, parameter_spec_list, instruction, param_index):
-        for spec in parameter_spec_list:
-            if spec[0] is instruction and spec[1] == param_index:
-                return True
-        return False
-
     def add_register(self, *regs):
         """Add registers."""
         if not regs:
@@ -976,7 +1043,7 @@ class QuantumCircuit:
         qubit_parameters = ",".join(["q%i" % num for num in range(instruction.num_qubits)])
         composite_circuit_gates = ""
 
-        for data, qargs, _ in instruction.definition:
+        for data, qargs, _ in instruction._get_definition():
             gate_qargs = ",".join(["q%i" % index for index in [qubit.index for qubit in qargs]])
             composite_circuit_gates += "%s %s; " % (data.qasm(), gate_qargs)
 
@@ -999,64 +1066,9 @@ class QuantumCircuit:
             ImportError: If pygments is not installed and ``formatted`` is
                 ``True``.
         """
-        existing_gate_names = ['ch', 'cx', 'cy', 'cz', 'crx', 'cry', 'crz', 'ccx', 'cswap',
-                               'cu1', 'cu3', 'dcx', 'h', 'i', 'id', 'iden', 'iswap', 'ms',
-                               'r', 'rx', 'rxx', 'ry', 'ryy', 'rz', 'rzx', 'rzz', 's', 'sdg',
-                               'swap', 'x', 'y', 'z', 't', 'tdg', 'u1', 'u2', 'u3']
-
-        existing_composite_circuits = []
-
-        string_temp = self.header + "\n"
-        string_temp += self.extension_lib + "\n"
-        for register in self.qregs:
-            string_temp += register.qasm() + "\n"
-        for register in self.cregs:
-            string_temp += register.qasm() + "\n"
-        unitary_gates = []
-        for instruction, qargs, cargs in self._data:
-            if instruction.name == 'measure':
-                qubit = qargs[0]
-                clbit = cargs[0]
-                string_temp += "%s %s[%d] -> %s[%d];\n" % (instruction.qasm(),
-                                                           qubit.register.name, qubit.index,
-                                                           clbit.register.name, clbit.index)
-            # If instruction is a composite circuit
-            elif not isinstance(instruction, Gate) and (instruction.name not in ['barrier',
-                                                                                 'reset']):
-                if instruction not in existing_composite_circuits:
-                    if instruction.name in existing_gate_names:
-                        old_name = instruction.name
-                        instruction.name += "_" + str(id(instruction))
-
-                        warnings.warn("A gate named {} already exists. "
-                                      "We have renamed "
-                                      "your gate to {}".format(old_name, instruction.name))
-
-                    # Get qasm of composite circuit
-                    qasm_string = self._get_composite_circuit_qasm_from_instruction(instruction)
-
-                    # Insert composite circuit qasm definition right after header and extension lib
-                    string_temp = string_temp.replace(self.extension_lib,
-                                                      "%s\n%s" % (self.extension_lib,
-                                                                  qasm_string))
-
-                    existing_composite_circuits.append(instruction)
-                    existing_gate_names.append(instruction.name)
-
-                # Insert qasm representation of the original instruction
-                string_temp += "%s %s;\n" % (instruction.qasm(),
-                                             ",".join(["%s[%d]" % (j.register.name, j.index)
-                                                       for j in qargs + cargs]))
-            else:
-                string_temp += "%s %s;\n" % (instruction.qasm(),
-                                             ",".join(["%s[%d]" % (j.register.name, j.index)
-                                                       for j in qargs + cargs]))
-            if instruction.name == 'unitary':
-                unitary_gates.append(instruction)
-
-        # this resets them, so if another call to qasm() is made the gate def is added again
-        for gate in unitary_gates:
-            gate._qasm_def_written = False
+        stream = io.StringIO()
+        self.write_qasm(stream)
+        string_temp = stream.getvalue()
 
         if filename:
             with open(filename, 'w+') as file:
@@ -1076,6 +1088,21 @@ class QuantumCircuit:
         else:
             return string_temp
 
+    def write_qasm(self, file):
+        """Write the OpenQASM program of the circuit to a file object.
+
+        The program is the one returned by :meth:`qasm`, but it is written in
+        chunks of statements as it is generated, so exporting a large circuit
+        does not build the whole program in memory.
+
+        Args:
+            file (file): the text file object to write the program to, for example
+                a file opened with ``open(filename, 'w')``.
+        """
+        # pylint: disable=cyclic-import
+        from qiskit.qasm.qasmwriter import write_circuit
+        write_circuit(self, file)
+
     def draw(self, output=None, scale=None, filename=None, style=None,
              interactive=False, plot_barriers=True,
              reverse_bits=False, justify=None, vertical_compression='medium', idle_wires=True,
@@ -1291,12 +1318,44 @@ class QuantumCircuit:
                               initial_state=initial_state,
                               cregbundle=cregbundle)
 
+    def track_metrics(self, enabled=True):
+        """Keep the metrics of the circuit up to date as instructions are appended.
+
+        By default, :meth:`size`, :meth:`depth`, :meth:`count_ops`,
+        :meth:`num_nonlocal_gates` and :meth:`num_connected_components` go
+        through all the instructions of the circuit every time they are
+        called. When the metrics are tracked, they only process the
+        instructions appended since the previous call, which makes querying
+        the depth of a circuit after every layer added to it linear in the
+        size of the circuit instead of quadratic. If instructions are
+        replaced, inserted or removed, or an instruction already processed is
+        given a condition with :meth:`~qiskit.circuit.Instruction.c_if`, the
+        metrics are computed from the start again on the next call.
+
+        Args:
+            enabled (bool): whether to track the metrics.
+        """
+        if not enabled:
+            self._metrics = None
+        elif self._metrics is None:
+            from .metrics import CircuitMetrics
+            self._metrics = CircuitMetrics(self)
+
+    def _updated_metrics(self):
+        """Return the tracked metrics, updated, or None if they are not tracked."""
+        if self._metrics is not None:
+            self._metrics.update()
+        return self._metrics
+
     def size(self):
         """Returns total number of gate operations in circuit.
 
         Returns:
             int: Total number of gate operations.
         """
+        metrics = self._updated_metrics()
+        if metrics is not None:
+            return metrics.size
         gate_ops = 0
         for instr, _, _ in self._data:
             if instr.name not in ['barrier', 'snapshot']:
@@ -1315,6 +1374,9 @@ class QuantumCircuit:
             The circuit depth and the DAG depth need not be the
             same.
         """
+        metrics = self._updated_metrics()
+        if metrics is not None:
+            return metrics.depth
         # Labels the registers by ints
         # and then the qubit position in
         # a register is given by reg_int+qubit_num
@@ -1415,9 +1477,13 @@ class QuantumCircuit:
         Returns:
             OrderedDict: a breakdown of how many operations of each kind, sorted by amount.
         """
-        count_ops = {}
-        for instr, _, _ in self._data:
-            count_ops[instr.name] = count_ops.get(instr.name, 0) + 1
+        metrics = self._updated_metrics()
+        if metrics is not None:
+            count_ops = metrics.counts
+        else:
+            count_ops = {}
+            for instr, _, _ in self._data:
+                count_ops[instr.name] = count_ops.get(instr.name, 0) + 1
         return OrderedDict(sorted(count_ops.items(), key=lambda kv: kv[1], reverse=True))
 
     def num_nonlocal_gates(self):
@@ -1425,6 +1491,9 @@ class QuantumCircuit:
 
         Conditional nonlocal gates are also included.
         """
+        metrics = self._updated_metrics()
+        if metrics is not None:
+            return metrics.num_nonlocal_gates
         multi_qubit_gates = 0
         for instr, _, _ in self._data:
             if instr.num_qubits > 1 and instr.name not in ['barrier', 'snapshot']:
@@ -1440,6 +1509,9 @@ class QuantumCircuit:
         Returns:
             int: Number of connected components in circuit.
         """
+        metrics = self._updated_metrics()
+        if metrics is not None:
+            return metrics.num_connected_components(unitary_only)
         # Convert registers to ints (as done in depth).
         reg_offset = 0
         reg_map = {}
@@ -1479,8 +1551,9 @@ class QuantumCircuit:
                         temp_int = creg_int + coff
                         for k in range(num_sub_graphs):
                             if temp_int in sub_graphs[k]:
-                                graphs_touched.append(k)
-                                num_touched += 1
+                                if k not in graphs_touched:
+                                    graphs_touched.append(k)
+                                    num_touched += 1
                                 break
 
                 for item in args:
@@ -1538,12 +1611,7 @@ class QuantumCircuit:
           QuantumCircuit: a deepcopy of the current circuit, with the specified name
         """
 
-        cpy = copy.copy(self)
-        # copy registers correctly, in copy.copy they are only copied via reference
-        cpy.qregs = self.qregs.copy()
-        cpy.cregs = self.cregs.copy()
-        cpy._qubits = self._qubits.copy()
-        cpy._clbits = self._clbits.copy()
+        cpy = self._copy_registers()
 
         instr_instances = {id(instr): instr
                            for instr, _, __ in self._data}
@@ -1552,18 +1620,31 @@ class QuantumCircuit:
                         for id_, instr in instr_instances.items()}
 
         cpy._parameter_table = ParameterTable({
-            param: [(instr_copies[id(instr)], param_index)
-                    for instr, param_index in self._parameter_table[param]]
+            param: ParameterReferences([(instr_copies[id(instr)], param_index)
+                                        for instr, param_index in self._parameter_table[param]])
             for param in self._parameter_table
         })
 
         cpy._data = [(instr_copies[id(inst)], qargs.copy(), cargs.copy())
                      for inst, qargs, cargs in self._data]
+        cpy._instructions_shared = False
+        if self._metrics is not None:
+            cpy._metrics = self._metrics.copy(cpy)
 
         if name:
             cpy.name = name
         return cpy
 
+    def _copy_registers(self):
+        """Copy the circuit without its data, but with its own register lists."""
+        cpy = copy.copy(self)
+        # copy registers correctly, in copy.copy they are only copied via reference
+        cpy.qregs = self.qregs.copy()
+        cpy.cregs = self.cregs.copy()
+        cpy._qubits = self._qubits.copy()
+        cpy._clbits = self._clbits.copy()
+        return cpy
+
     def _create_creg(self, length, name):
         """ Creates a creg, checking if ClassicalRegister with same name exists
         """
@@ -1803,6 +1884,8 @@ class QuantumCircuit:
             raise CircuitError('Cannot bind parameters ({}) not present in the circuit.'.format(
                 [str(p) for p in param_dict.keys() - self._parameter_table]))
 
+        bound_circuit._unshare_instructions(unrolled_param_dict)
+
         # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
         for parameter, value in unrolled_param_dict.items():
             if isinstance(value, ParameterExpression):
@@ -1839,6 +1922,8 @@ class QuantumCircuit:
             raise CircuitError('Cannot bind parameters ({}) not present in the circuit.'.format(
                 [str(p) for p in value_dict.keys() - self._parameter_table.keys()]))
 
+        bound_circuit._unshare_instructions(unrolled_value_dict)
+
         # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
         for parameter, value in unrolled_value_dict.items():
             bound_circuit._bind_parameter(parameter, value)
@@ -1859,6 +1944,24 @@ class QuantumCircuit:
                 unrolled_value_dict.update(zip(param, value))
         return unrolled_value_dict
 
+    def _unshare_instructions(self, parameters):
+        """Replace the instructions using the parameters by copies, before they
+        are modified, if they may be shared with other circuits."""
+        if not self._instructions_shared:
+            return
+        copies = {}
+        for instr, _ in self._parameter_table.slots_for(parameters):
+            if id(instr) not in copies:
+                copies[id(instr)] = instr.copy()
+        if not copies:
+            return
+        self._data = [(copies.get(id(instr), instr), qargs, cargs)
+                      for instr, qargs, cargs in self._data]
+        for parameter in self._parameter_table:
+            self._parameter_table[parameter] = [
+                (copies.get(id(instr), instr), param_index)
+                for instr, param_index in self._parameter_table[parameter]]
+
     def _bind_parameter(self, parameter, value):
         """Assigns a parameter value to matching instructions in-place."""
         for (instr, param_index) in self._parameter_table[parameter]:
@@ -2274,10 +2377,32 @@ class QuantumCircuit:
                            [control_qubit, target_qubit], [])
 
 
+def _checked_bits(args, bits, bit_indices):
+    """Return the bits of a circuit given by indices or bits, checking they are in it."""
+    try:
+        return [bits[bit_indices[arg]] if isinstance(arg, Bit) else bits[arg] for arg in args]
+    except KeyError:
+        raise CircuitError('bit not in this circuit')
+    except IndexError:
+        raise CircuitError('Index out of range.')
+    except TypeError:
+        raise CircuitError('Bits must be given as indices or bits, not %s.' % (args,))
+
+
 def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
     from qiskit.converters import ast_to_dag
+    from qiskit.converters import circuit_to_dag
     from qiskit.converters import dag_to_circuit
+    from qiskit.qasm.qasmreader import read_circuit
+    # Most programs are read directly into a circuit, the others go through
+    # the parser, the abstract syntax tree and a DAG. The circuits read
+    # directly, in program order, go through a DAG too, so that both give
+    # the instructions in the topological order of the DAG.
+    data = qasm.return_data()
+    circuit = read_circuit(data) if data else None
+    if circuit is not None:
+        return dag_to_circuit(circuit_to_dag(circuit))
     ast = qasm.parse()
     dag = ast_to_dag(ast)
     return dag_to_circuit(dag)
@@ -60,6 +60,7 @@ class QuantumCircuitData(MutableSequence):
         self._circuit._check_cargs(cargs)
 
         self._circuit._data[key] = (instruction, qargs, cargs)
+        self._reset_metrics()
 
         self._circuit._update_parameter_table(instruction)
 
@@ -69,6 +70,12 @@ class QuantumCircuitData(MutableSequence):
 
     def __delitem__(self, i):
         del self._circuit._data[i]
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        """Recompute the tracked metrics of the circuit, if any, after a modification."""
+        if self._circuit._metrics is not None:
+            self._circuit._metrics.reset()
 
     def __len__(self):
         return len(self._circuit._data)
@@ -109,6 +116,7 @@ class QuantumCircuitData(MutableSequence):
     def sort(self, *args, **kwargs):
         """In-place stable sort. Accepts arguments of list.sort."""
         self._circuit._data.sort(*args, **kwargs)
+        self._reset_metrics()
 
     def copy(self):
         """Returns a shallow copy of instruction list."""
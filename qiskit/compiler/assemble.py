@@ -19,7 +19,10 @@ import logging
 import warnings
 from time import time
 from typing import Union, List, Dict, Optional
-from qiskit.circuit import QuantumCircuit, Qubit, Parameter
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, Qubit, Parameter, ParameterExpression
 from qiskit.exceptions import QiskitError
 from qiskit.pulse import ScheduleComponent, LoConfig
 from qiskit.assembler.run_config import RunConfig
@@ -62,6 +65,7 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
              parameter_binds: Optional[List[Dict[Parameter, float]]] = None,
              parametric_pulses: Optional[List[str]] = None,
              init_qubits: bool = True,
+             lazy_parameter_binds: bool = False,
              **run_config: Dict) -> Qobj:
     """Assemble a list of circuits or pulse schedules into a ``Qobj``.
 
@@ -122,6 +126,14 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
             ['gaussian', 'constant']
         init_qubits: Whether to reset the qubits to the ground state for each shot.
                      Default: ``True``.
+        lazy_parameter_binds: If ``True``, each parameterized circuit is assembled once,
+            bound to the first element of ``parameter_binds``, and the values of its
+            parameterized instruction parameters for every bind are stored as a numeric
+            table in the ``parameter_binds`` field of the experiment config. The backend
+            expands each such experiment into one experiment per bind when it runs, so
+            the size of the ``Qobj`` barely grows with the number of binds. Only
+            backends that support this table, such as the ``BasicAer`` simulators,
+            can run such a ``Qobj``. Default: ``False``.
         **run_config: Extra arguments used to configure the run (e.g., for Aer configurable
             backends). Refer to the backend documentation for details on these
             arguments.
@@ -144,13 +156,24 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
     if all(isinstance(exp, QuantumCircuit) for exp in experiments):
         run_config = _parse_circuit_args(parameter_binds, **run_config_common_dict)
 
-        # If circuits are parameterized, bind parameters and remove from run_config
-        bound_experiments, run_config = _expand_parameters(circuits=experiments,
-                                                           run_config=run_config)
+        parameter_tables = None
+        if lazy_parameter_binds:
+            # If circuits are parameterized, keep one bound template per circuit
+            # and tabulate the values of every bind
+            bound_experiments, run_config, parameter_tables = _tabulate_parameters(
+                circuits=experiments, run_config=run_config)
+        else:
+            # If circuits are parameterized, bind parameters and remove from run_config
+            bound_experiments, run_config = _expand_parameters(circuits=experiments,
+                                                               run_config=run_config)
+        qobj = assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
+                                 qobj_header=qobj_header, run_config=run_config)
+        if parameter_tables:
+            for experiment, table in zip(qobj.experiments, parameter_tables):
+                experiment.config.parameter_binds = table
         end_time = time()
         _log_assembly_time(start_time, end_time)
-        return assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
-                                 qobj_header=qobj_header, run_config=run_config)
+        return qobj
 
     elif all(isinstance(exp, ScheduleComponent) for exp in experiments):
         run_config = _parse_pulse_args(backend, qubit_lo_freq, meas_lo_freq,
@@ -364,24 +387,7 @@ def _expand_parameters(circuits, run_config):
     if parameter_binds or \
        any(circuit.parameters for circuit in circuits):
 
-        all_bind_parameters = [bind.keys()
-                               for bind in parameter_binds]
-        all_circuit_parameters = [circuit.parameters for circuit in circuits]
-
-        # Collect set of all unique parameters across all circuits and binds
-        unique_parameters = {param
-                             for param_list in all_bind_parameters + all_circuit_parameters
-                             for param in param_list}
-
-        # Check that all parameters are common to all circuits and binds
-        if not all_bind_parameters \
-           or not all_circuit_parameters \
-           or any(unique_parameters != bind_params for bind_params in all_bind_parameters) \
-           or any(unique_parameters != parameters for parameters in all_circuit_parameters):
-            raise QiskitError(
-                ('Mismatch between run_config.parameter_binds and all circuit parameters. ' +
-                 'Parameter binds: {} ' +
-                 'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
+        _check_parameter_binds(circuits, parameter_binds)
 
         circuits = [circuit.bind_parameters(binds)
                     for circuit in circuits
@@ -392,3 +398,103 @@ def _expand_parameters(circuits, run_config):
         run_config.parameter_binds = []
 
     return circuits, run_config
+
+
+def _tabulate_parameters(circuits, run_config):
+    """Like :func:`_expand_parameters`, but instead of binding every circuit to every
+    bind, binds each circuit to the first bind only and returns, for each circuit, a
+    table of the values of its parameterized instruction parameters for all binds.
+
+    The table is a dict with a ``slots`` list of ``[instruction index, parameter
+    index]`` pairs, indexing the assembled experiment instructions, and a ``values``
+    list with one list of slot values per bind.
+
+    Raises:
+        QiskitError: if run_config parameters are not compatible with circuit parameters
+
+    Returns:
+        Tuple(List[QuantumCircuit], RunConfig, List[dict]):
+          - List of input circuits bound to the first bind
+          - RunConfig with parameter_binds removed
+          - List of parameter tables, or None if nothing is parameterized
+    """
+    parameter_binds = run_config.parameter_binds
+    if not parameter_binds and not any(circuit.parameters for circuit in circuits):
+        return circuits, run_config, None
+
+    _check_parameter_binds(circuits, parameter_binds)
+
+    tables = [_parameter_table(circuit, parameter_binds) for circuit in circuits]
+    circuits = [circuit.bind_parameters(parameter_binds[0]) for circuit in circuits]
+
+    run_config = copy.deepcopy(run_config)
+    run_config.parameter_binds = []
+
+    return circuits, run_config, tables
+
+
+def _check_parameter_binds(circuits, parameter_binds):
+    """Check that there is a single common set of parameters shared between all
+    circuits and all parameter binds.
+
+    Raises:
+        QiskitError: if the parameter binds are not compatible with circuit parameters
+    """
+    all_bind_parameters = [bind.keys()
+                           for bind in parameter_binds]
+    all_circuit_parameters = [circuit.parameters for circuit in circuits]
+
+    # Collect set of all unique parameters across all circuits and binds
+    unique_parameters = {param
+                         for param_list in all_bind_parameters + all_circuit_parameters
+                         for param in param_list}
+
+    # Check that all parameters are common to all circuits and binds
+    if not all_bind_parameters \
+       or not all_circuit_parameters \
+       or any(unique_parameters != bind_params for bind_params in all_bind_parameters) \
+       or any(unique_parameters != parameters for parameters in all_circuit_parameters):
+        raise QiskitError(
+            ('Mismatch between run_config.parameter_binds and all circuit parameters. ' +
+             'Parameter binds: {} ' +
+             'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
+
+
+def _parameter_table(circuit, parameter_binds):
+    """Tabulate the values taken by the parameterized instruction parameters of
+    ``circuit`` over ``parameter_binds``. See :func:`_tabulate_parameters`."""
+    columns = {parameter: np.array([bind[parameter] for bind in parameter_binds], dtype=float)
+               for parameter in circuit.parameters}
+    evaluated = {}
+
+    slots = []
+    slot_values = []
+    position = 0
+    for instruction, _, _ in circuit._data:
+        # The assembler inserts a bfunc before every conditional instruction
+        if instruction.condition:
+            position += 1
+        for param_index, param in enumerate(instruction.params):
+            if isinstance(param, ParameterExpression) and param.parameters:
+                if id(param) not in evaluated:
+                    evaluated[id(param)] = _evaluate_expression(param, columns)
+                slots.append([position, param_index])
+                slot_values.append(evaluated[id(param)])
+        position += 1
+
+    values = np.array(slot_values).T.reshape(len(parameter_binds), len(slots))
+    return {'slots': slots, 'values': values.tolist()}
+
+
+def _evaluate_expression(expression, columns):
+    """Evaluate ``expression`` on arrays of parameter values, one per bind."""
+    if isinstance(expression, Parameter):
+        return columns[expression]
+    from sympy import lambdify
+    # pylint: disable=protected-access
+    parameters = list(expression._parameter_symbols)
+    function = lambdify([expression._parameter_symbols[parameter] for parameter in parameters],
+                        expression._symbol_expr, modules='numpy')
+    num_binds = len(next(iter(columns.values())))
+    values = function(*[columns[parameter] for parameter in parameters])
+    return np.broadcast_to(np.asarray(values, dtype=float), (num_binds,))
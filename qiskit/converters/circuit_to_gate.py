@@ -104,5 +104,6 @@ def circuit_to_gate(circuit, parameter_map=None, equivalence_library=None, label
         rules))
     qc = QuantumCircuit(q, name=gate.name, global_phase=target.global_phase)
     qc._data = rules
+    qc._instructions_shared = True
     gate.definition = qc
     return gate
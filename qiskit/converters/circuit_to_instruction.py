@@ -111,19 +111,22 @@ def circuit_to_instruction(circuit, parameter_map=None, equivalence_library=None
                            list(map(lambda y: q[find_bit_position(y)], x[1])),
                            list(map(lambda y: c[find_bit_position(y)], x[2]))), definition))
 
-    # fix condition
-    for rule in definition:
-        condition = rule[0].condition
+    # fix condition, on copies of the instructions, which are shared with the circuit
+    for index, (rule_instruction, qargs, cargs) in enumerate(definition):
+        condition = rule_instruction.condition
         if condition:
             reg, val = condition
             if reg.size == c.size:
-                rule[0].condition = (c, val)
+                rule_instruction = rule_instruction.copy()
+                rule_instruction.condition = (c, val)
+                definition[index] = (rule_instruction, qargs, cargs)
             else:
                 raise QiskitError('Cannot convert condition in circuit with '
                                   'multiple classical registers to instruction')
 
     qc = QuantumCircuit(*regs, name=instruction.name)
     qc._data = definition
+    qc._instructions_shared = True
     if circuit.global_phase:
         qc.global_phase = circuit.global_phase
 
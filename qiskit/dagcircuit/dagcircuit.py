@@ -1244,6 +1244,37 @@ class DAGCircuit:
         layers as this is currently implemented. This may not be
         the desired behavior.
         """
+        for layer in self.op_node_layers():
+            # Construct a shallow copy of self
+            new_layer = DAGCircuit()
+            new_layer.name = self.name
+
+            # add in the registers - this adds the input/output nodes
+            for creg in self.cregs.values():
+                new_layer.add_creg(creg)
+            for qreg in self.qregs.values():
+                new_layer.add_qreg(qreg)
+
+            for node in layer["nodes"]:
+                # this creates new DAGNodes in the new_layer
+                new_layer.apply_operation_back(node.op,
+                                               node.qargs,
+                                               node.cargs)
+
+            yield {"graph": new_layer, "partition": layer["partition"]}
+
+    def op_node_layers(self):
+        """Yield the op nodes of each layer of this DAGCircuit.
+
+        The layers are the same as the ones from :meth:`layers`, but no
+        sub-DAG is built for them. Each returned layer is a dict containing
+        {"nodes": list of op nodes, "partition": list of qubit lists}, where
+        the nodes are the DAGNodes of this dag, sorted in the order they were
+        added to it.
+
+        This is the preferred way of walking the layers of large circuits, as
+        it does not allocate any new DAGCircuit or DAGNode.
+        """
         graph_layers = self.multigraph_layers()
         try:
             next(graph_layers)  # Remove input nodes
@@ -1266,30 +1297,14 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            # add in the registers - this adds the input/output nodes
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            for node in op_nodes:
-                # this creates new DAGNodes in the new_layer
-                new_layer.apply_operation_back(node.op,
-                                               node.qargs,
-                                               node.cargs)
-
             # The quantum registers that have an operation in this layer.
             support_list = [
                 op_node.qargs
-                for op_node in new_layer.op_nodes()
+                for op_node in op_nodes
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            yield {"graph": new_layer, "partition": support_list}
+            yield {"nodes": op_nodes, "partition": support_list}
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
@@ -1297,29 +1312,58 @@ class DAGCircuit:
         A serial layer is a circuit with one gate. The layers have the
         same structure as in layers().
         """
-        for next_node in self.topological_op_nodes():
+        for layer in self.serial_op_node_layers():
+            next_node = layer["nodes"][0]
             new_layer = DAGCircuit()
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
             for creg in self.cregs.values():
                 new_layer.add_creg(creg)
-            # Save the support of the operation we add to the layer
-            support_list = []
             # Operation data
             op = copy.copy(next_node.op)
             qa = copy.copy(next_node.qargs)
             ca = copy.copy(next_node.cargs)
-            co = copy.copy(next_node.condition)
-            _ = self._bits_in_condition(co)
 
             # Add node to new_layer
             new_layer.apply_operation_back(op, qa, ca)
+            l_dict = {"graph": new_layer, "partition": layer["partition"]}
+            yield l_dict
+
+    def serial_op_node_layers(self, nodes=None):
+        """Yield a layer of op nodes for all gates of this circuit.
+
+        A serial layer contains a single op node of this dag, in topological
+        order. The layers have the same structure as in op_node_layers(), and
+        like those no sub-DAG is built for them.
+
+        Args:
+            nodes (list[DAGNode]): the op nodes of a layer of op_node_layers(),
+                to serialize only those. They are yielded in the order
+                serial_layers() gives on the sub-DAG of the layer built by
+                layers(), which is the order of the last wire they act on,
+                classical wires first. If None, all the op nodes are yielded.
+
+        Yields:
+            dict: {"nodes": list with one op node, "partition": list of qubit lists}.
+        """
+        if nodes is None:
+            nodes = self.topological_op_nodes()
+        else:
+            wire_order = {wire: idx for idx, wire in enumerate(self.clbits + self.qubits)}
+
+            def _serial_key(node):
+                wires = node.qargs + node.cargs + self._bits_in_condition(node.condition)
+                return max(wire_order[wire] for wire in wires)
+
+            nodes = sorted(nodes, key=_serial_key)
+        for next_node in nodes:
+            # Save the support of the operation we add to the layer
+            support_list = []
             # Add operation to partition
             if next_node.name not in ["barrier",
                                       "snapshot", "save", "load", "noise"]:
-                support_list.append(list(qa))
-            l_dict = {"graph": new_layer, "partition": support_list}
-            yield l_dict
+                support_list.append(list(next_node.qargs))
+            yield {"nodes": [next_node], "partition": support_list}
 
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
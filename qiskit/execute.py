@@ -23,7 +23,6 @@ Executing Experiments (:mod:`qiskit.execute`)
 """
 import logging
 from time import time
-from qiskit.compiler import transpile, assemble, schedule
 from qiskit.qobj.utils import MeasLevel, MeasReturnType
 from qiskit.pulse import Schedule
 from qiskit.exceptions import QiskitError
@@ -232,6 +231,10 @@ def execute(experiments, backend,
 
             job = execute(qc, backend, shots=4321)
     """
+    # Imported here so that ``import qiskit``, which binds this function, does
+    # not import the transpiler.
+    from qiskit.compiler import transpile, assemble, schedule
+
     if isinstance(experiments, Schedule) or (isinstance(experiments, list) and
                                              isinstance(experiments[0], Schedule)):
         # do not transpile a schedule circuit
@@ -19,7 +19,17 @@ import sys
 import functools
 
 from qiskit.providers import BaseJob, JobStatus, JobError
-from qiskit.qobj import validate_qobj_against_schema
+from qiskit.qobj import utils as qobj_utils
+from qiskit.qobj import validate_qobj_against_schema, validate_qobj_structure
+
+
+def _validate_qobj(qobj):
+    """Validate a qobj as selected by the ``qobj_validation`` user setting."""
+    validation = qobj_utils.get_validation_mode()
+    if validation == 'full':
+        validate_qobj_against_schema(qobj)
+    elif validation == 'structure':
+        validate_qobj_structure(qobj)
 
 
 def requires_submit(func):
@@ -62,6 +72,13 @@ class BasicAerJob(BaseJob):
     def submit(self):
         """Submit the job to the backend for execution.
 
+        The Qobj is validated according to the ``qobj_validation`` setting of
+        the user config file: against the full Qobj schema (``full``, the
+        default), against its structural invariants only (``structure``), or
+        not at all (``none``), for pipelines where the qobjs come from
+        :func:`~qiskit.compiler.assemble`, which checks the structure of every
+        experiment it builds.
+
         Raises:
             QobjValidationError: if the JSON serialization of the Qobj passed
             during construction does not validate against the Qobj schema.
@@ -71,7 +88,7 @@ class BasicAerJob(BaseJob):
         if self._future is not None:
             raise JobError("We have already submitted the job!")
 
-        validate_qobj_against_schema(self._qobj)
+        _validate_qobj(self._qobj)
         self._future = self._executor.submit(self._fn, self._job_id, self._qobj)
 
     @requires_submit
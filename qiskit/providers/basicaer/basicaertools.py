@@ -16,9 +16,11 @@
 
 """
 
+import copy
 from string import ascii_uppercase, ascii_lowercase
 import numpy as np
 from qiskit.exceptions import QiskitError
+from qiskit.qobj import QasmQobjExperiment
 
 
 def single_gate_params(gate, params=None):
@@ -178,3 +180,36 @@ def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     # Combine indices into matrix multiplication string format
     # for numpy.einsum function
     return mat_left, mat_right, tens_in, tens_out
+
+
+def expand_parameter_binds(experiments):
+    """Expand experiments carrying a ``parameter_binds`` table in their config.
+
+    Such an experiment, assembled with ``lazy_parameter_binds=True``, stands for
+    one experiment per row of the table; the instruction parameters listed in
+    the table ``slots`` take the values of the row. The expanded experiments are
+    generated one at a time, sharing the instructions that are not parameterized.
+
+    Args:
+        experiments (list[QasmQobjExperiment]): the experiments of a qobj.
+
+    Yields:
+        QasmQobjExperiment: the experiments to run, in order.
+    """
+    for experiment in experiments:
+        table = getattr(experiment.config, 'parameter_binds', None)
+        if not table:
+            yield experiment
+            continue
+        slots = table['slots']
+        positions = sorted({position for position, _ in slots})
+        for values in table['values']:
+            instructions = list(experiment.instructions)
+            for position in positions:
+                instruction = copy.copy(instructions[position])
+                instruction.params = list(instruction.params)
+                instructions[position] = instruction
+            for (position, param_index), value in zip(slots, values):
+                instructions[position].params[param_index] = value
+            yield QasmQobjExperiment(config=experiment.config, header=experiment.header,
+                                     instructions=instructions)
@@ -36,12 +36,14 @@ import numpy as np
 from qiskit.util import local_hardware_info
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.providers import BaseBackend
-from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from qiskit.providers.basicaer.basicaerjob import BasicAerJob, _validate_qobj
 from qiskit.result import Result
+from qiskit.result.models import ExperimentResult
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
 from .basicaertools import einsum_matmul_index
+from .basicaertools import expand_parameter_binds
 
 logger = logging.getLogger(__name__)
 
@@ -247,6 +249,27 @@ class UnitarySimulatorPy(BaseBackend):
         job.submit()
         return job
 
+    def iter_results(self, qobj, backend_options=None):
+        """Run qobj synchronously, one experiment at a time.
+
+        Unlike :meth:`run`, the experiments are run in the calling process,
+        only as the returned generator is consumed, and the result of each is
+        yielded as soon as it is complete. The results can be collected in a
+        :class:`~qiskit.result.ResultBuilder`.
+
+        Args:
+            qobj (Qobj): payload of the experiment
+            backend_options (dict): backend options, as for :meth:`run`.
+
+        Yields:
+            ExperimentResult: the result of each experiment, in order.
+        """
+        _validate_qobj(qobj)
+        self._set_options(qobj_config=qobj.config,
+                          backend_options=backend_options)
+        for experiment_result in self._run_experiments(qobj):
+            yield ExperimentResult.from_dict(experiment_result)
+
     def _run_job(self, job_id, qobj):
         """Run experiments in qobj.
 
@@ -257,11 +280,8 @@ class UnitarySimulatorPy(BaseBackend):
         Returns:
             Result: Result object
         """
-        self._validate(qobj)
-        result_list = []
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        result_list = list(self._run_experiments(qobj))
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -275,6 +295,20 @@ class UnitarySimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
+    def _run_experiments(self, qobj):
+        """Run the experiments in qobj one at a time.
+
+        Args:
+            qobj (Qobj): job description
+
+        Yields:
+            dict: the result dictionary of each experiment, as returned by
+                :meth:`run_experiment`.
+        """
+        self._validate(qobj)
+        for experiment in expand_parameter_binds(qobj.experiments):
+            yield self.run_experiment(experiment)
+
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
 
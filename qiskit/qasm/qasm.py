@@ -36,6 +36,13 @@ class Qasm:
         """Return the filename."""
         return self._filename
 
+    def return_data(self):
+        """Return the program, read from the file if given one."""
+        if self._filename:
+            with open(self._filename) as ifile:
+                self._data = ifile.read()
+        return self._data
+
     def generate_tokens(self):
         """Returns a generator of the tokens."""
         if self._filename:
@@ -14,9 +14,7 @@
 
 """OpenQASM parser."""
 
-import os
-import shutil
-import tempfile
+import types
 
 import numpy as np
 import ply.yacc as yacc
@@ -25,6 +23,10 @@ from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# Parse tables of each parser class, generated by its first instance. Building
+# them is most of the cost of creating a parser.
+_PARSE_TABLES = {}
+
 
 class QasmParser:
     """OPENQASM Parser."""
@@ -37,15 +39,20 @@ class QasmParser:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
         self.precedence = (
             ('left', '+', '-'),
             ('left', '*', '/'),
             ('left', 'negative', 'positive'),
             ('right', '^'))
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False,
-                                outputdir=self.parse_dir)
+        tables = _PARSE_TABLES.get(type(self))
+        if tables is None:
+            self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
+            _PARSE_TABLES[type(self)] = _tables_module(self.parser)
+        else:
+            # The tables were generated from this grammar, so their signature
+            # does not need to be checked.
+            self.parser = yacc.yacc(module=self, debug=False, write_tables=False,
+                                    tabmodule=tables, optimize=True)
         self.qasm = None
         self.parse_deb = False
         self.global_symtab = {}                          # global symtab
@@ -58,8 +65,7 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
-            shutil.rmtree(self.parse_dir)
+        pass
 
     def update_symtab(self, obj):
         """Update a node in the symbol table.
@@ -1090,3 +1096,18 @@ class QasmParser:
         ast = self.parser.parse(data, debug=True)
         self.parser.parse(data, debug=True)
         ast.to_string(0)
+
+
+def _tables_module(parser):
+    """Return the tables of a parser as a module, in the format of the table
+    modules written by yacc, so that yacc can build other parsers from it."""
+    tables = types.ModuleType('qasm_parsetab')
+    tables.__file__ = __file__
+    tables._tabversion = yacc.__tabversion__
+    tables._lr_method = 'LALR'
+    tables._lr_signature = None
+    tables._lr_action = parser.action
+    tables._lr_goto = parser.goto
+    tables._lr_productions = [(p.str, p.name, p.len, p.func, p.file, p.line)
+                              for p in parser.productions]
+    return tables
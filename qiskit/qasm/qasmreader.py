@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Fast reader of OpenQASM 2 programs into QuantumCircuits.
+
+The reader tokenizes the program with a single regular expression and builds
+the circuit statement by statement, without an abstract syntax tree. It only
+supports the programs made of register declarations, the gates of
+``qelib1.inc`` that have a standard gate class, ``CX``, ``measure``,
+``reset``, ``barrier`` and ``if`` statements, which is what circuits exported
+by Qiskit and most other tools contain. For any other program, including
+programs with errors, it gives up and the full parser is used, so that the
+supported programs give the same circuits, and the other programs the same
+circuits or errors, as before.
+"""
+
+import functools
+import operator
+import os
+import re
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit.barrier import Barrier
+from qiskit.circuit.measure import Measure
+from qiskit.circuit.reset import Reset
+from qiskit.circuit.library.standard_gates.x import CXGate
+from qiskit.converters.ast_to_dag import AstInterpreter
+from .qasmlexer import CORE_LIBS_PATH
+
+_TOKEN = re.compile(r'''
+    (?P<real>(?:(?:[0-9]+|[0-9]*\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+)|(?:[0-9]*\.[0-9]+|[0-9]+\.))
+    |(?P<int>[1-9][0-9]*|0)
+    |(?P<assign>->)
+    |(?P<matches>==)
+    |(?P<string>"(?:[^\\"]|\\.)*")
+    |(?P<include>include)
+    |(?P<format>OPENQASM\s+\d+\.\d+)
+    |(?P<comment>//[^\n]*)
+    |(?P<cx>CX)
+    |(?P<u>U)
+    |(?P<id>[a-z][a-zA-Z0-9_]*)
+    |(?P<space>[ \t\r\n]+)
+    |(?P<literal>[=()\[\]{};<>,.+\-/*^"])
+    |(?P<error>.)
+''', re.VERBOSE | re.DOTALL)
+
+_KEYWORDS = {'barrier', 'creg', 'gate', 'if', 'measure', 'opaque', 'qreg', 'pi', 'reset'}
+
+_EXTERNAL_FUNCTIONS = {'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+                       'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+                       'exp': np.exp, 'ln': np.log, 'sqrt': np.sqrt}
+
+# Binary operators, as their precedence and function. '^' is right associative.
+_BINARY_OPERATORS = {'+': (1, operator.add), '-': (1, operator.sub),
+                     '*': (2, operator.mul), '/': (2, operator.truediv),
+                     '^': (4, operator.pow)}
+_PREFIX_PRECEDENCE = 3
+
+_GATE_DECLARATION = re.compile(r'^\s*gate\s+([a-z][a-zA-Z0-9_]*)\s*(?:\(([^)]*)\))?\s*([^{]*)\{',
+                               re.MULTILINE)
+
+
+# Token returned at the end of the program.
+_END = (None, None)
+
+
+class _Unsupported(Exception):
+    """Raised when the program is not one the reader supports."""
+
+
+def read_circuit(data):
+    """Build a circuit from an OpenQASM 2 program, if the reader supports it.
+
+    Args:
+        data (str): the OpenQASM 2 program.
+
+    Returns:
+        QuantumCircuit or None: the circuit, with the instructions in the order
+            of the program, or None if the program is not supported by the
+            reader and must be parsed by the full parser.
+    """
+    try:
+        return _Reader(data).read()
+    except _Unsupported:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _qelib1_gates():
+    """Return the numbers of parameters and qubits of the gates of qelib1.inc."""
+    with open(os.path.join(CORE_LIBS_PATH, 'qelib1.inc')) as qelib1:
+        declarations = _GATE_DECLARATION.findall(qelib1.read())
+    gates = {}
+    for name, params, qubits in declarations:
+        params = [param for param in params.split(',') if param.strip()]
+        gates[name] = (len(params), len(qubits.split(',')))
+    return gates
+
+
+def _tokenize(data):
+    """Yield the tokens of a program, as pairs of kind and text."""
+    for match in _TOKEN.finditer(data):
+        kind = match.lastgroup
+        if kind in ('space', 'comment'):
+            continue
+        text = match.group()
+        if kind == 'id' and text in _KEYWORDS:
+            kind = text
+        elif kind == 'error' or kind == 'string' and text != '"qelib1.inc"':
+            raise _Unsupported()
+        yield kind, text
+
+
+class _Reader:
+    """Reads a program, statement by statement, into a circuit."""
+
+    def __init__(self, data):
+        self._tokens = _tokenize(data)
+        self._next = None
+        self._circuit = QuantumCircuit()
+        self._registers = {}
+        self._bits = {}
+        self._gates = {}
+        self._symbols = set()
+        self._condition = None
+
+    def read(self):
+        """Read the program and return its circuit."""
+        statements = 0
+        while self._peek() is not _END:
+            self._statement()
+            statements += 1
+        if not statements:
+            raise _Unsupported()
+        return self._circuit
+
+    def _peek(self):
+        if self._next is None:
+            self._next = next(self._tokens, _END)
+        return self._next
+
+    def _pop(self):
+        token = self._peek()
+        if token is _END:
+            raise _Unsupported()
+        self._next = None
+        return token
+
+    def _expect(self, text):
+        if self._pop()[1] != text:
+            raise _Unsupported()
+
+    def _statement(self):
+        kind, text = self._pop()
+        if kind == 'format':
+            self._expect(';')
+        elif kind == 'include':
+            self._include()
+        elif kind in ('qreg', 'creg'):
+            self._declaration(kind)
+        elif kind == 'if':
+            self._if()
+        else:
+            self._quantum_op(kind, text)
+
+    def _include(self):
+        # Including qelib1.inc twice declares its gates twice, which is an error.
+        if self._pop()[1] != '"qelib1.inc"' or self._gates:
+            raise _Unsupported()
+        self._expect(';')
+        gates = _qelib1_gates()
+        if self._symbols & set(gates):
+            raise _Unsupported()
+        self._symbols.update(gates)
+        self._gates = {name: gates[name] + (gate_class,)
+                       for name, gate_class in AstInterpreter.standard_extension.items()
+                       if name in gates}
+
+    def _declaration(self, kind):
+        name, index = self._primary()
+        if (index is None or not index or name in self._symbols
+                or name in _EXTERNAL_FUNCTIONS):
+            raise _Unsupported()
+        self._expect(';')
+        register = (QuantumRegister if kind == 'qreg' else ClassicalRegister)(index, name)
+        self._circuit.add_register(register)
+        self._symbols.add(name)
+        self._registers[name] = register
+        self._bits[name] = list(register)
+
+    def _if(self):
+        self._expect('(')
+        kind, name = self._pop()
+        if kind != 'id' or not isinstance(self._registers.get(name), ClassicalRegister):
+            raise _Unsupported()
+        self._expect('==')
+        kind, value = self._pop()
+        if kind != 'int':
+            raise _Unsupported()
+        self._expect(')')
+        kind, text = self._pop()
+        if kind in ('if', 'barrier'):
+            raise _Unsupported()
+        self._condition = (self._registers[name], int(value))
+        self._quantum_op(kind, text)
+        self._condition = None
+
+    def _quantum_op(self, kind, text):
+        if kind == 'id':
+            self._gate(text)
+        elif kind == 'cx':
+            self._cx()
+        elif kind == 'measure':
+            self._measure()
+        elif kind == 'reset':
+            self._reset()
+        elif kind == 'barrier':
+            self._barrier()
+        else:
+            # U, gate and opaque declarations, and errors.
+            raise _Unsupported()
+
+    def _gate(self, name):
+        if name not in self._gates:
+            raise _Unsupported()
+        num_params, num_qubits, gate_class = self._gates[name]
+        params = []
+        if self._peek()[1] == '(':
+            self._pop()
+            if self._peek()[1] != ')':
+                params = self._expression_list()
+            self._expect(')')
+        if len(params) != num_params:
+            raise _Unsupported()
+        primaries = self._primary_list()
+        if len(primaries) != num_qubits:
+            raise _Unsupported()
+        qubits = self._verified_bits(primaries, QuantumRegister)
+        self._check_distinct(primaries)
+        self._expect(';')
+
+        sizes = set(len(bits) for bits in qubits if len(bits) > 1)
+        if len(sizes) > 1:
+            raise _Unsupported()
+        for index in range(max(sizes) if sizes else 1):
+            qargs = [bits[index] if len(bits) > 1 else bits[0] for bits in qubits]
+            self._append(gate_class(*params), qargs, [])
+
+    def _cx(self):
+        control = self._primary()
+        self._expect(',')
+        target = self._primary()
+        bits = self._verified_bits([control, target], QuantumRegister)
+        controls, targets = bits[0], bits[1]
+        self._check_distinct([control, target])
+        self._expect(';')
+        if len(controls) != len(targets) and len(controls) != 1 and len(targets) != 1:
+            raise _Unsupported()
+        if len(controls) == 1:
+            controls = controls * len(targets)
+        elif len(targets) == 1:
+            targets = targets * len(controls)
+        for control_qubit, target_qubit in zip(controls, targets):
+            self._append(CXGate(), [control_qubit, target_qubit], [])
+
+    def _measure(self):
+        qubit = self._primary()
+        self._expect('->')
+        clbit = self._primary()
+        self._expect(';')
+        qubits = self._verified_bits([qubit], QuantumRegister)[0]
+        clbits = self._verified_bits([clbit], ClassicalRegister)[0]
+        if len(qubits) != len(clbits):
+            raise _Unsupported()
+        for qubit, clbit in zip(qubits, clbits):
+            self._append(Measure(), [qubit], [clbit])
+
+    def _reset(self):
+        primary = self._primary()
+        self._expect(';')
+        qubits = self._verified_bits([primary], QuantumRegister)[0]
+        for qubit in qubits:
+            self._append(Reset(), [qubit], [])
+
+    def _barrier(self):
+        primaries = self._primary_list()
+        qubits = self._verified_bits(primaries, QuantumRegister)
+        self._check_distinct(primaries)
+        self._expect(';')
+        qubits = [qubit for bits in qubits for qubit in bits]
+        self._append(Barrier(len(qubits)), qubits, [])
+
+    def _append(self, instruction, qargs, cargs):
+        instruction.condition = self._condition
+        self._circuit._append(instruction, qargs, cargs)
+
+    def _primary(self):
+        """Read ``name`` or ``name[index]``, as a pair of name and index or None."""
+        kind, name = self._pop()
+        if kind != 'id':
+            raise _Unsupported()
+        if self._peek()[1] != '[':
+            return name, None
+        self._pop()
+        kind, index = self._pop()
+        if kind != 'int':
+            raise _Unsupported()
+        self._expect(']')
+        return name, int(index)
+
+    def _primary_list(self):
+        primaries = [self._primary()]
+        while self._peek()[1] == ',':
+            self._pop()
+            primaries.append(self._primary())
+        return primaries
+
+    def _verified_bits(self, primaries, register_type):
+        """Return the bits of each primary, checking they are in registers of the type."""
+        bits = []
+        for name, index in primaries:
+            register = self._registers.get(name)
+            if not isinstance(register, register_type):
+                raise _Unsupported()
+            if index is None:
+                bits.append(self._bits[name])
+            elif index < len(register):
+                bits.append([self._bits[name][index]])
+            else:
+                raise _Unsupported()
+        return bits
+
+    def _check_distinct(self, primaries):
+        """Check the primaries do not refer to the same bit more than once."""
+        if len(primaries) < 2:
+            return
+        seen = set()
+        for name, index in primaries:
+            if index is None:
+                indices = [(name, i) for i in range(len(self._registers[name]))]
+            else:
+                indices = [(name, index)]
+            for bit in indices:
+                if bit in seen:
+                    raise _Unsupported()
+                seen.add(bit)
+
+    def _expression_list(self):
+        expressions = [self._expression()]
+        while self._peek()[1] == ',':
+            self._pop()
+            expressions.append(self._expression())
+        return expressions
+
+    def _expression(self, min_precedence=0):
+        """Read and evaluate an expression, as the nodes of the AST do."""
+        kind, text = self._pop()
+        try:
+            if text in ('-', '+'):
+                operand = self._expression(_PREFIX_PRECEDENCE)
+                value = operator.neg(operand) if text == '-' else operator.pos(operand)
+            elif kind in ('int', 'real'):
+                value = float(text)
+            elif kind == 'pi':
+                value = float(np.pi)
+            elif text == '(':
+                value = self._expression()
+                self._expect(')')
+            elif text in _EXTERNAL_FUNCTIONS and self._peek()[1] == '(':
+                self._pop()
+                argument = self._expression()
+                self._expect(')')
+                value = _EXTERNAL_FUNCTIONS[text](argument)
+            else:
+                raise _Unsupported()
+            while True:
+                precedence, function = _BINARY_OPERATORS.get(self._peek()[1], (-1, None))
+                if precedence < min_precedence:
+                    return value
+                self._pop()
+                # '^' is right associative, the others are left associative.
+                right = self._expression(precedence if precedence == 4 else precedence + 1)
+                value = function(value, right)
+        except (ArithmeticError, TypeError, ValueError):
+            raise _Unsupported()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming writer of QuantumCircuits as OpenQASM 2 programs.
+
+The writer produces the same program as :meth:`QuantumCircuit.qasm`, but
+writes it to a file object in chunks of statements instead of building it as
+a single string. The definitions of the composite instructions are found in a
+first pass over the circuit, so that they can be written before the
+statements using them, and each is generated once. The statements of the
+instructions with the default ``qasm`` method are formatted by the writer,
+which formats each distinct parameter value and bit once.
+"""
+
+import warnings
+from numbers import Number
+
+from qiskit.circuit import Gate, Instruction
+from qiskit.circuit.tools import pi_check
+
+# The names of the gates of qelib1.inc, which composite instructions are renamed from.
+_EXISTING_GATE_NAMES = ['ch', 'cx', 'cy', 'cz', 'crx', 'cry', 'crz', 'ccx', 'cswap',
+                        'cu1', 'cu3', 'dcx', 'h', 'i', 'id', 'iden', 'iswap', 'ms',
+                        'r', 'rx', 'rxx', 'ry', 'ryy', 'rz', 'rzx', 'rzz', 's', 'sdg',
+                        'swap', 'x', 'y', 'z', 't', 'tdg', 'u1', 'u2', 'u3']
+
+# The number of statements written to the file at once.
+_CHUNK_SIZE = 1000
+
+
+def write_circuit(circuit, file):
+    """Write a circuit as an OpenQASM 2 program.
+
+    Args:
+        circuit (QuantumCircuit): the circuit.
+        file (file): the text file object to write the program to.
+    """
+    # pylint: disable=protected-access
+    data = circuit._data
+    file.write(circuit.header + "\n")
+    file.write(circuit.extension_lib + "\n")
+    # the last composite instructions found are defined first, as they always were
+    for definition in reversed(_composite_definitions(circuit)):
+        file.write(definition + "\n")
+    for register in circuit.qregs:
+        file.write(register.qasm() + "\n")
+    for register in circuit.cregs:
+        file.write(register.qasm() + "\n")
+
+    bits = {}
+    statements = {}
+    formatted = {}
+    unitary_gates = []
+    chunk = []
+    for instruction, qargs, cargs in data:
+        if type(instruction).qasm is Instruction.qasm:
+            statement = _statement(instruction, statements, formatted)
+        else:
+            statement = instruction.qasm()
+        if instruction.name == 'unitary':
+            unitary_gates.append(instruction)
+        operands = []
+        for bit in qargs + cargs:
+            operand = bits.get(bit)
+            if operand is None:
+                operand = bits[bit] = "%s[%d]" % (bit.register.name, bit.index)
+            operands.append(operand)
+        if instruction.name == 'measure':
+            chunk.append("%s %s -> %s;\n" % (statement, operands[0], operands[1]))
+        else:
+            chunk.append("%s %s;\n" % (statement, ",".join(operands)))
+        if len(chunk) >= _CHUNK_SIZE:
+            file.write("".join(chunk))
+            chunk = []
+    file.write("".join(chunk))
+
+    # this resets them, so if another call to qasm() is made the gate def is added again
+    for gate in unitary_gates:
+        gate._qasm_def_written = False
+
+
+def _composite_definitions(circuit):
+    """Return the gate definitions of the composite instructions of a circuit, in the
+    order they are found, renaming the instructions named as existing gates."""
+    # pylint: disable=protected-access
+    existing_gate_names = list(_EXISTING_GATE_NAMES)
+    existing_composite_circuits = []
+    seen = set()
+    definitions = []
+    for instruction, _, _ in circuit._data:
+        if (instruction.name == 'measure' or isinstance(instruction, Gate)
+                or instruction.name in ['barrier', 'reset']):
+            continue
+        # an instruction found again is either defined or equal to a defined one
+        if id(instruction) in seen:
+            continue
+        seen.add(id(instruction))
+        if instruction in existing_composite_circuits:
+            continue
+        if instruction.name in existing_gate_names:
+            old_name = instruction.name
+            instruction.name += "_" + str(id(instruction))
+
+            warnings.warn("A gate named {} already exists. "
+                          "We have renamed "
+                          "your gate to {}".format(old_name, instruction.name))
+
+        definitions.append(circuit._get_composite_circuit_qasm_from_instruction(instruction))
+        existing_composite_circuits.append(instruction)
+        existing_gate_names.append(instruction.name)
+    return definitions
+
+
+def _statement(instruction, statements, formatted):
+    """Return the statement of an instruction with the default qasm method, without its
+    operands, formatting it once for each name and numeric parameters."""
+    params = instruction.params
+    key = None
+    if all(isinstance(param, Number) for param in params):
+        key = (instruction.name, tuple((type(param), param) for param in params))
+        statement = statements.get(key)
+        if statement is not None:
+            return instruction._qasmif(statement)
+    statement = instruction.name
+    if params:
+        statement = "%s(%s)" % (statement, ",".join([_format_param(param, formatted)
+                                                     for param in params]))
+    if key is not None:
+        statements[key] = statement
+    return instruction._qasmif(statement)
+
+
+def _format_param(param, formatted):
+    """Format a parameter as pi_check(param, ndigits=8, output='qasm'), once for each
+    numeric value."""
+    if not isinstance(param, Number):
+        return pi_check(param, ndigits=8, output='qasm')
+    key = (type(param), param)
+    text = formatted.get(key)
+    if text is None:
+        text = formatted[key] = pi_check(param, ndigits=8, output='qasm')
+    return text
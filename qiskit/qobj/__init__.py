@@ -62,6 +62,7 @@ Validation
    :toctree: ../stubs/
 
    validate_qobj_against_schema
+   validate_qobj_structure
 """
 
 import warnings
@@ -83,6 +84,7 @@ from qiskit.qobj.qasm_qobj import QasmQobjExperimentConfig
 from qiskit.qobj.qasm_qobj import QobjHeader
 
 from .utils import validate_qobj_against_schema
+from .utils import validate_qobj_structure
 
 
 class Qobj(QasmQobj):
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Binary serialization of the dictionaries of Qobj and Result objects.
+
+The format is a small JSON document describing the structure of the
+dictionary, followed by the raw contiguous buffers of its numeric arrays::
+
+    b'QSKTBIN1' | uint64 length of the JSON document | JSON document | buffers
+
+In the JSON document every NumPy array, and every nested list of numbers
+with at least ``_MIN_ARRAY_SIZE`` elements, is replaced by a reference to
+its buffer. Complex numbers and tuples, which JSON cannot represent, are
+replaced by tagged objects. Large numeric payloads, such as statevectors,
+unitaries, pulse samples and level 0 and 1 measurement memory, are thus
+never converted element by element to text.
+
+The round trip of a nested list stored as a buffer normalizes the types of
+its elements to the common type NumPy gives them: a list of ints and floats
+is loaded back as a list of floats.
+"""
+
+import json
+import struct
+import warnings
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+
+_MAGIC = b'QSKTBIN1'
+_LENGTH = struct.Struct('<Q')
+_ALIGNMENT = 8
+
+# Nested lists of numbers with fewer elements than this stay in the JSON document
+_MIN_ARRAY_SIZE = 64
+
+_ARRAY_KEY = '__ndarray__'
+_COMPLEX_KEY = '__complex__'
+_TUPLE_KEY = '__tuple__'
+
+
+def dict_to_bytes(data):
+    """Serialize a dictionary, as returned by ``to_dict``, to bytes.
+
+    Args:
+        data (dict): the dictionary to serialize. It may contain NumPy
+            arrays, NumPy scalars, complex numbers and tuples besides the
+            types supported by JSON.
+
+    Returns:
+        bytes: the serialized dictionary.
+    """
+    arrays = []
+    body = _encode(data, arrays)
+
+    descriptions = []
+    buffers = []
+    offset = 0
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        descriptions.append([array.dtype.str, list(array.shape), offset])
+        buffers.append(array.data)
+        padding = -array.nbytes % _ALIGNMENT
+        if padding:
+            buffers.append(b'\0' * padding)
+        offset += array.nbytes + padding
+
+    document = json.dumps({'arrays': descriptions, 'body': body},
+                          separators=(',', ':')).encode('utf-8')
+    document += b' ' * (-(len(_MAGIC) + _LENGTH.size + len(document)) % _ALIGNMENT)
+    return b''.join([_MAGIC, _LENGTH.pack(len(document)), document] + buffers)
+
+
+def bytes_to_dict(data):
+    """Deserialize a dictionary serialized by :func:`dict_to_bytes`.
+
+    Arrays that were NumPy arrays are returned as (writeable) NumPy arrays,
+    nested lists are returned as nested lists.
+
+    Args:
+        data (bytes): the serialized dictionary.
+
+    Returns:
+        dict: the dictionary.
+
+    Raises:
+        QiskitError: if ``data`` is not in the expected format.
+    """
+    data = memoryview(data)
+    if bytes(data[:len(_MAGIC)]) != _MAGIC:
+        raise QiskitError('Data is not a binary serialized Qobj or Result.')
+    start = len(_MAGIC) + _LENGTH.size
+    (length,) = _LENGTH.unpack(data[len(_MAGIC):start])
+    document = json.loads(bytes(data[start:start + length]).decode('utf-8'))
+    buffers = data[start + length:]
+
+    arrays = []
+    for dtype, shape, offset in document['arrays']:
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape, dtype=np.int64))
+        if count:
+            array = np.frombuffer(buffers, dtype=dtype, count=count, offset=offset)
+            arrays.append(array.reshape(shape).copy())
+        else:
+            arrays.append(np.empty(shape, dtype=dtype))
+    return _decode(document['body'], arrays)
+
+
+def _encode(value, arrays):  # pylint: disable=too-many-return-statements
+    """Replace the values JSON cannot hold, or holds inefficiently, by references."""
+    if isinstance(value, dict):
+        return {key: _encode(item, arrays) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return _encode(value.tolist(), arrays)
+        arrays.append(value)
+        return {_ARRAY_KEY: len(arrays) - 1}
+    if isinstance(value, list):
+        if value and isinstance(value[0], (list, int, float, complex, np.number)):
+            array = _numeric_array(value)
+            if array is not None:
+                arrays.append(array)
+                return {_ARRAY_KEY: len(arrays) - 1, 'list': True}
+        return [_encode(item, arrays) for item in value]
+    if isinstance(value, tuple):
+        return {_TUPLE_KEY: [_encode(item, arrays) for item in value]}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, complex):
+        return {_COMPLEX_KEY: [value.real, value.imag]}
+    return value
+
+
+def _numeric_array(value):
+    """Return ``value`` as a numeric array if it is a large rectangular nested
+    list of numbers, else None."""
+    size = 1
+    item = value
+    while isinstance(item, list) and item:
+        size *= len(item)
+        item = item[0]
+    if size < _MIN_ARRAY_SIZE or isinstance(item, bool):
+        return None
+    try:
+        with warnings.catch_warnings():
+            # Ragged lists give object arrays, with a warning on recent NumPy
+            warnings.simplefilter('ignore')
+            array = np.asarray(value)
+    except ValueError:
+        return None
+    if array.dtype.kind not in 'iufc' or array.size != size:
+        return None
+    return array
+
+
+def _decode(value, arrays):
+    """Inverse of :func:`_encode`."""
+    if isinstance(value, dict):
+        if _ARRAY_KEY in value:
+            array = arrays[value[_ARRAY_KEY]]
+            return array.tolist() if value.get('list') else array
+        if _COMPLEX_KEY in value:
+            return complex(*value[_COMPLEX_KEY])
+        if _TUPLE_KEY in value:
+            return tuple(_decode(item, arrays) for item in value[_TUPLE_KEY])
+        return {key: _decode(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+    return value
@@ -27,6 +27,7 @@ from qiskit.qobj.qasm_qobj import QobjDictField
 from qiskit.qobj.qasm_qobj import QobjHeader
 from qiskit.qobj.qasm_qobj import QobjExperimentHeader
 from qiskit.qobj.qasm_qobj import validator
+from qiskit.qobj.binary import bytes_to_dict, dict_to_bytes
 
 
 class QobjMeasurementOption:
@@ -616,6 +617,30 @@ class PulseQobj:
         return cls(qobj_id=data.get('qobj_id'), config=config,
                    experiments=experiments, header=header)
 
+    def to_bytes(self):
+        """Serialize the PulseQobj to the format of :mod:`qiskit.qobj.binary`.
+
+        The samples of the pulse library are stored as raw buffers instead
+        of text. Lists of 64 or more numbers are loaded back with a single
+        type, so a list of ints and floats becomes floats.
+
+        Returns:
+            bytes: the serialized PulseQobj.
+        """
+        return dict_to_bytes(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a PulseQobj serialized with :meth:`to_bytes`.
+
+        Args:
+            data (bytes): the serialized PulseQobj.
+
+        Returns:
+            PulseQobj: The PulseQobj from the input bytes.
+        """
+        return cls.from_dict(bytes_to_dict(data))
+
     def __eq__(self, other):
         if isinstance(other, PulseQobj):
             if self.to_dict() == other.to_dict():
@@ -16,23 +16,46 @@
 
 """Module providing definitions of QASM Qobj classes."""
 
+import functools
 import os
 import pprint
 from types import SimpleNamespace
 
 import json
-import fastjsonschema
 
 from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.qobj.binary import bytes_to_dict, dict_to_bytes
 
 
 path_part = 'schemas/qobj_schema.json'
 path = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     path_part)
-with open(path, 'r') as fd:
-    json_schema = json.loads(fd.read())
-validator = fastjsonschema.compile(json_schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_validator():
+    """Load and compile the qobj JSON schema, once, on first use."""
+    import fastjsonschema
+
+    with open(path, 'r') as fd:
+        json_schema = json.loads(fd.read())
+    return fastjsonschema.compile(json_schema)
+
+
+def validator(data):
+    """Validate a qobj dictionary against the qobj JSON schema.
+
+    The schema is compiled the first time this is called, so importing
+    :mod:`qiskit.qobj` does not pay for it.
+
+    Args:
+        data (dict): the qobj dictionary, in the JSON wire format.
+
+    Returns:
+        dict: the validated dictionary.
+    """
+    return _compiled_validator()(data)
 
 
 class QasmQobjInstruction:
@@ -496,6 +519,30 @@ class QasmQobj:
         return cls(qobj_id=data.get('qobj_id'), config=config,
                    experiments=experiments, header=header)
 
+    def to_bytes(self):
+        """Serialize the QasmQobj to the format of :mod:`qiskit.qobj.binary`.
+
+        Unlike a JSON dump, this keeps the complex matrices of ``unitary``
+        instructions, as arrays. Lists of 64 or more numbers are loaded back
+        with a single type, so a list of ints and floats becomes floats.
+
+        Returns:
+            bytes: the serialized QasmQobj.
+        """
+        return dict_to_bytes(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a QasmQobj serialized with :meth:`to_bytes`.
+
+        Args:
+            data (bytes): the serialized QasmQobj.
+
+        Returns:
+            QasmQobj: The QasmQobj from the input bytes.
+        """
+        return cls.from_dict(bytes_to_dict(data))
+
     def __eq__(self, other):
         if isinstance(other, QasmQobj):
             if self.to_dict() == other.to_dict():
@@ -15,8 +15,8 @@
 """Qobj utilities and enums."""
 
 from enum import Enum, IntEnum
-
-from fastjsonschema.exceptions import JsonSchemaException
+import functools
+import numbers
 
 from qiskit.validation.jsonschema.exceptions import SchemaValidationError
 
@@ -49,9 +49,126 @@ def validate_qobj_against_schema(qobj):
     Raises:
         SchemaValidationError: if the qobj fails schema validation
     """
+    from fastjsonschema.exceptions import JsonSchemaException
+
     try:
         qobj.to_dict(validate=True)
     except JsonSchemaException as err:
         msg = ("Qobj validation failed. Specifically path: %s failed to fulfil"
                " %s" % (err.path, err.definition))
         raise SchemaValidationError(msg)
+
+
+@functools.lru_cache(maxsize=1)
+def get_validation_mode():
+    """Return the ``qobj_validation`` setting of the user config file.
+
+    The config file is read on the first call only.
+
+    Returns:
+        str: ``full`` (the default), ``structure`` or ``none``.
+    """
+    from qiskit import user_config
+    return user_config.get_config().get('qobj_validation', 'full')
+
+
+def validate_qobj_structure(qobj):
+    """Checks the structural invariants of a Qobj, without the JSON schema.
+
+    This is a cheap subset of :func:`validate_qobj_against_schema`, that
+    neither builds the dictionary of the qobj nor compiles the schema. It
+    checks that the qobj has a known type and at least one experiment, and
+    every experiment what :func:`validate_experiment_structure` checks. The
+    experiments built by :func:`~qiskit.compiler.assemble`, which checks them
+    as it builds them, are not checked again.
+
+    Args:
+        qobj (QasmQobj or PulseQobj): Qobj to be validated.
+
+    Raises:
+        SchemaValidationError: if the qobj breaks a structural invariant.
+    """
+    if getattr(qobj, 'type', None) not in QobjType.__members__.values():
+        raise SchemaValidationError(
+            "Qobj validation failed. Unknown qobj type %s" % getattr(qobj, 'type', None))
+    if not qobj.experiments:
+        raise SchemaValidationError(
+            "Qobj validation failed. The qobj has no experiments")
+    for index, experiment in enumerate(qobj.experiments):
+        if getattr(experiment, '_structure_validated', False):
+            continue
+        validate_experiment_structure(
+            experiment,
+            n_qubits=_experiment_bound(experiment, qobj, 'n_qubits'),
+            memory_slots=_experiment_bound(experiment, qobj, 'memory_slots'),
+            path='experiments[%d]' % index)
+
+
+def validate_experiment_structure(experiment, n_qubits=None, memory_slots=None,
+                                  path='experiment'):
+    """Checks the structural invariants of the instructions of an experiment.
+
+    Every instruction must have a name, and its qubits, memory slots and
+    register slots must be non-negative integers. Qubits must be smaller than
+    ``n_qubits`` and memory slots smaller than ``memory_slots`` when those are
+    given. The assembler runs these checks on every instruction it builds
+    that is not fully described by its name and parameters.
+
+    Args:
+        experiment (QasmQobjExperiment or PulseQobjExperiment): experiment to
+            be validated.
+        n_qubits (int): number of qubits of the experiment, if known.
+        memory_slots (int): number of memory slots of the experiment, if known.
+        path (str): location of the experiment, used in the error message.
+
+    Raises:
+        SchemaValidationError: if the experiment breaks a structural invariant.
+    """
+    for index, instruction in enumerate(experiment.instructions):
+        validate_instruction_structure(instruction, n_qubits, memory_slots,
+                                       path='%s.instructions[%d]' % (path, index))
+
+
+def validate_instruction_structure(instruction, n_qubits=None, memory_slots=None,
+                                   path='instruction'):
+    """Checks the structural invariants of an instruction of an experiment.
+
+    See :func:`validate_experiment_structure`.
+
+    Args:
+        instruction (QasmQobjInstruction or PulseQobjInstruction): instruction
+            to be validated.
+        n_qubits (int): number of qubits of the experiment, if known.
+        memory_slots (int): number of memory slots of the experiment, if known.
+        path (str): location of the instruction, used in the error message.
+
+    Raises:
+        SchemaValidationError: if the instruction breaks a structural invariant.
+    """
+    attributes = instruction.__dict__
+    if not isinstance(attributes.get('name'), str):
+        raise SchemaValidationError(
+            "Qobj validation failed. Specifically path: %s has no name" % path)
+    for key, bound in (('qubits', n_qubits), ('memory', memory_slots),
+                       ('memory_slot', memory_slots), ('register', None),
+                       ('register_slot', None), ('conditional', None)):
+        if key not in attributes:
+            continue
+        values = attributes[key]
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        for value in values:
+            if (not isinstance(value, numbers.Integral) or isinstance(value, bool)
+                    or value < 0 or (bound is not None and value >= bound)):
+                raise SchemaValidationError(
+                    "Qobj validation failed. Specifically path: %s.%s "
+                    "has the invalid index %s" % (path, key, value))
+
+
+def _experiment_bound(experiment, qobj, name):
+    """The value of ``name`` in the experiment config, header or qobj config."""
+    for container in (experiment.config, experiment.header, qobj.config):
+        value = getattr(container, name, None)
+        if value is not None:
+            return value
+    return None
@@ -469,6 +469,16 @@ class Operator(BaseOperator):
         if rank_mat % 2 != 0:
             raise QiskitError(
                 "Contracted matrix must have an even number of indices.")
+        if tensor.size >= _MIN_TENSORDOT_SIZE:
+            # For large tensors a matrix product over the contracted indices,
+            # which uses BLAS, is much faster than einsum
+            num_indices = len(indices)
+            positions = [index + shift for index in reversed(indices)]
+            mat_indices = list(range(num_indices, rank_mat))
+            if right_mul:
+                mat_indices = list(range(num_indices))
+            result = np.tensordot(mat, tensor, axes=(mat_indices, positions))
+            return np.moveaxis(result, list(range(num_indices)), positions)
         # Get einsum indices for tensor
         indices_tensor = list(range(rank))
         for j, index in enumerate(indices):
@@ -502,11 +512,21 @@ class Operator(BaseOperator):
         mat = None
         if hasattr(obj, 'to_matrix'):
             # If instruction is a gate first we see if it has a
-            # `to_matrix` definition and if so use that.
-            try:
-                mat = obj.to_matrix()
-            except QiskitError:
-                pass
+            # `to_matrix` definition and if so use that. The matrices of
+            # standard gates with numeric parameters are cached.
+            key = _matrix_key(obj)
+            mat = _MATRICES.get(key) if key is not None else None
+            if mat is None:
+                try:
+                    mat = obj.to_matrix()
+                except QiskitError:
+                    return None
+                if key is not None:
+                    mat = np.array(mat, dtype=complex)
+                    mat.setflags(write=False)
+                    if len(_MATRICES) >= _MAX_MATRICES:
+                        del _MATRICES[next(iter(_MATRICES))]
+                    _MATRICES[key] = mat
         return mat
 
     def _append_instruction(self, obj, qargs=None):
@@ -526,27 +546,153 @@ class Operator(BaseOperator):
             # If the instruction doesn't have a matrix defined we use its
             # circuit decomposition definition if it exists, otherwise we
             # cannot compose this gate and raise an error.
-            if obj.definition is None:
+            definition = obj._get_definition()
+            if definition is None:
                 raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
-            if not isinstance(obj.definition, QuantumCircuit):
+            if not isinstance(definition, QuantumCircuit):
                 raise QiskitError('Instruction "{}" '
                                   'definition is {} but expected QuantumCircuit.'.format(
-                                      obj.name, type(obj.definition)))
-            if obj.definition.global_phase:
+                                      obj.name, type(definition)))
+            if definition.global_phase:
                 dimension = 2 ** self.num_qubits
                 op = self.compose(
-                    ScalarOp(dimension, np.exp(1j * float(obj.definition.global_phase))),
+                    ScalarOp(dimension, np.exp(1j * float(definition.global_phase))),
                     qargs=qargs)
                 self._data = op.data
-            flat_instr = obj.definition.to_instruction()
-            for instr, qregs, cregs in flat_instr.definition.data:
+            # Consecutive gates with matrices acting on at most
+            # _MAX_FUSED_QUBITS qubits are multiplied together first, and
+            # composed with the operator as a single matrix.
+            positions = {bit: index for index, bit in enumerate(definition.qubits)}
+            fused = _FusedMatrix()
+            for instr, qregs, cregs in definition.data:
                 if cregs:
                     raise QiskitError(
                         'Cannot apply instruction with classical registers: {}'.format(
                             instr.name))
                 # Get the integer position of the flat register
                 if qargs is None:
-                    new_qargs = [tup.index for tup in qregs]
+                    new_qargs = [positions[tup] for tup in qregs]
                 else:
-                    new_qargs = [qargs[tup.index] for tup in qregs]
-                self._append_instruction(instr, qargs=new_qargs)
+                    new_qargs = [qargs[positions[tup]] for tup in qregs]
+                mat = self._instruction_to_matrix(instr)
+                if mat is not None and fused.append(mat, new_qargs):
+                    continue
+                fused.compose_into(self)
+                fused = _FusedMatrix()
+                if mat is None or not fused.append(mat, new_qargs):
+                    self._append_instruction(instr, qargs=new_qargs)
+            fused.compose_into(self)
+
+
+# The matrices of instructions with numeric parameters, by matrix key.
+_MATRICES = {}
+_MAX_MATRICES = 10000
+
+# The maximum number of qubits of the products of consecutive gates.
+_MAX_FUSED_QUBITS = 3
+
+# The minimum size of the tensors contracted with numpy.tensordot instead of einsum.
+_MIN_TENSORDOT_SIZE = 2 ** 12
+
+
+def _matrix_key(instruction):
+    """Return the key of the cached matrix of an instruction, or None if its matrix
+    is not cached."""
+    # pylint: disable=protected-access
+    if not instruction._cache_definitions:
+        return None
+    params = instruction.params
+    if not all(isinstance(param, Number) for param in params):
+        return None
+    return (type(instruction), instruction.name, instruction.num_qubits,
+            getattr(instruction, 'ctrl_state', None),
+            tuple((type(param), param) for param in params))
+
+
+class _FusedMatrix:
+    """The product of consecutive gate matrices on a few qubits."""
+
+    def __init__(self):
+        self.qubits = []
+        self.tensor = None
+
+    def append(self, mat, qargs):
+        """Multiply the product by a gate matrix, unless the product would act on more
+        than _MAX_FUSED_QUBITS qubits.
+
+        Returns:
+            bool: whether the matrix was multiplied.
+        """
+        new_qubits = [qubit for qubit in qargs if qubit not in self.qubits]
+        num_qubits = len(self.qubits) + len(new_qubits)
+        if num_qubits > _MAX_FUSED_QUBITS or mat.shape != (2 ** len(qargs),) * 2:
+            return False
+        if new_qubits:
+            # The new qubits are the most significant qubits of the product
+            dim = 2 ** len(self.qubits)
+            current = np.eye(dim) if self.tensor is None else self.tensor.reshape(dim, dim)
+            self.qubits += new_qubits
+            self.tensor = np.kron(np.eye(2 ** len(new_qubits)), current).reshape(
+                (2,) * (2 * num_qubits))
+        indices = [num_qubits - 1 - self.qubits.index(qubit) for qubit in qargs]
+        self.tensor = Operator._einsum_matmul(
+            self.tensor, np.reshape(mat, (2,) * (2 * len(qargs))), indices)
+        return True
+
+    def compose_into(self, operator):
+        """Compose an operator with the product, in place."""
+        if self.tensor is None:
+            return
+        dim = 2 ** len(self.qubits)
+        qargs = self.qubits
+        if len(qargs) == operator.num_qubits and qargs == list(range(len(qargs))):
+            qargs = None
+        operator._data = operator.compose(self.tensor.reshape(dim, dim), qargs=qargs).data
+
+
+def _stacked_unitaries(circuits, num_qubits):
+    """Return the unitary matrices of many small circuits at once.
+
+    The gates of the circuits are expanded to matrices on all the qubits, and
+    the ``k``-th gates of all the circuits are multiplied as a stack of
+    matrices in a single step.
+
+    Args:
+        circuits (list[list[tuple]]): the circuits, as lists of
+            ``(instruction, qubit positions)`` pairs.
+        num_qubits (int): the number of qubits of each circuit.
+
+    Returns:
+        np.ndarray: the array of the unitary matrices of the circuits, of shape
+        ``(len(circuits), 2 ** num_qubits, 2 ** num_qubits)``.
+
+    Raises:
+        QiskitError: if an instruction of the circuits cannot be applied.
+    """
+    dim = 2 ** num_qubits
+    expanded = {}
+
+    def expand(instruction, qubits):
+        key = _matrix_key(instruction)
+        if key is not None:
+            key = (key, tuple(qubits))
+            if key in expanded:
+                return expanded[key]
+        operator = Operator(np.eye(dim))
+        operator._append_instruction(instruction, qargs=list(qubits))
+        if key is not None:
+            expanded[key] = operator.data
+        return operator.data
+
+    order = sorted(range(len(circuits)), key=lambda index: -len(circuits[index]))
+    ordered = [circuits[index] for index in order]
+    unitaries = np.tile(np.eye(dim, dtype=complex), (len(circuits), 1, 1))
+    active = len(ordered)
+    for step in range(len(ordered[0]) if ordered else 0):
+        while len(ordered[active - 1]) <= step:
+            active -= 1
+        mats = np.array([expand(*circuit[step]) for circuit in ordered[:active]])
+        unitaries[:active] = np.matmul(mats, unitaries[:active])
+    result = np.empty_like(unitaries)
+    result[order] = unitaries
+    return result
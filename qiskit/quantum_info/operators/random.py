@@ -18,7 +18,8 @@ Methods to create random operators.
 
 import numpy as np
 from numpy.random import default_rng
-from scipy import stats
+
+# scipy.stats is slow to import, so the functions using it import it themselves.
 
 from qiskit.quantum_info.operators import Operator, Stinespring
 from qiskit.exceptions import QiskitError
@@ -42,6 +43,7 @@ def random_unitary(dims, seed=None):
     Returns:
         Operator: a unitary operator.
     """
+    from scipy import stats
     if seed is None:
         random_state = np.random.default_rng()
     elif isinstance(seed, np.random.Generator):
@@ -70,6 +72,7 @@ def random_hermitian(dims, traceless=False, seed=None):
     Returns:
         Operator: a Hermitian operator.
     """
+    from scipy import stats
     if seed is None:
         rng = np.random.default_rng()
     elif isinstance(seed, np.random.Generator):
@@ -122,6 +125,7 @@ def random_quantum_channel(input_dims=None,
     Raises:
         QiskitError: if rank or dimensions are invalid.
     """
+    from scipy import stats
     # Determine total input and output dimensions
     if input_dims is None and output_dims is None:
         raise QiskitError(
@@ -27,6 +27,7 @@ arXiv:1811.12926 [quant-ph] (2018).
 """
 import math
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 import scipy.linalg as la
@@ -42,6 +43,10 @@ from qiskit.quantum_info.synthesis.one_qubit_decompose import OneQubitEulerDecom
 
 _CUTOFF_PRECISION = 1e-12
 
+# Eigenvalues of the real part of M2 closer than this are treated as degenerate
+_DEGENERACY_TOLERANCE = 1e-1
+_IMAG_WEIGHT = 0.6180339887498949
+
 
 def euler_angles_1q(unitary_matrix):
     """DEPRECATED: Compute Euler angles for a single-qubit gate.
@@ -137,6 +142,67 @@ _ipz = np.array([[1j, 0],
                  [0, -1j]], dtype=complex)
 
 
+def _magic_basis_square(unitary_matrices):
+    """For a stack of 4x4 unitaries, return them rescaled into SU(4) and changed to
+    the magic basis, ``Up``, and the symmetric products ``M2 = Up^T.Up``."""
+    U = unitary_matrices.astype(complex)
+    U *= (np.linalg.det(U)**(-0.25))[:, np.newaxis, np.newaxis]
+    Up = _Bd @ U @ _B
+    M2 = np.transpose(Up, (0, 2, 1)) @ Up
+    return Up, M2
+
+
+def _diagonalize_symmetric_unitaries(M2):
+    """Decompose each matrix of a stack of symmetric unitaries as ``M2 = P.D.P^T``
+    where P ∈ SO(4) up to sign and D is diagonal with unit-magnitude elements.
+
+    The real and imaginary parts of a symmetric unitary are real symmetric
+    matrices that commute, so they share an orthonormal eigenbasis. It is found
+    deterministically from the eigenvectors of the real part; inside each cluster
+    of close eigenvalues, where those eigenvectors are ill-conditioned, the basis
+    is rotated to diagonalize a fixed combination of both parts. Only matrices for
+    which this is not accurate enough fall back to diagonalizing random real
+    combinations of both parts.
+
+    Returns:
+        tuple: the ``(n, 4)`` array of eigenvalues D and the ``(n, 4, 4)`` array of
+        eigenvectors P.
+
+    Raises:
+        QiskitError: if a matrix could not be diagonalized.
+    """
+    evals, P = np.linalg.eigh(M2.real)
+    for k, M2k in enumerate(M2):
+        start = 0
+        for end in range(1, 5):
+            if end < 4 and evals[k, end] - evals[k, end - 1] < _DEGENERACY_TOLERANCE:
+                continue
+            if end - start > 1:
+                block = P[k, :, start:end]
+                combination = M2k.real + _IMAG_WEIGHT * M2k.imag
+                _, rotation = np.linalg.eigh(block.T.dot(combination).dot(block))
+                P[k, :, start:end] = block.dot(rotation)
+            start = end
+    D = np.einsum('nji,njk,nki->ni', P, M2, P)
+    for k, M2k in enumerate(M2):
+        if not np.allclose((P[k] * D[k]).dot(P[k].T), M2k, rtol=1.0e-13, atol=1.0e-13):
+            D[k], P[k] = _diagonalize_randomized(M2k)
+    return D, P
+
+
+def _diagonalize_randomized(M2):
+    """Diagonalize a single symmetric unitary through random real combinations of
+    its real and imaginary parts. The seeds are fixed, so this is reproducible."""
+    for i in range(100):
+        state = np.random.default_rng(i)
+        M2real = state.normal()*M2.real + state.normal()*M2.imag
+        _, P = la.eigh(M2real)
+        D = P.T.dot(M2).dot(P).diagonal()
+        if np.allclose(P.dot(np.diag(D)).dot(P.T), M2, rtol=1.0e-13, atol=1.0e-13):
+            return D, P
+    raise QiskitError("TwoQubitWeylDecomposition: failed to diagonalize M2")
+
+
 class TwoQubitWeylDecomposition:
     """ Decompose two-qubit unitary U = (K1l⊗K1r).Exp(i a xx + i b yy + i c zz).(K2l⊗K2r) ,
     where U ∈ U(4), (K1l|K1r|K2l|K2r) ∈ SU(2), and we stay in the "Weyl Chamber"
@@ -153,29 +219,40 @@ class TwoQubitWeylDecomposition:
 
         The overall decomposition scheme is taken from Drury and Love, arXiv:0806.4015 [quant-ph].
         """
+        Up, M2 = _magic_basis_square(np.asarray(unitary_matrix)[np.newaxis])
+        D, P = _diagonalize_symmetric_unitaries(M2)
+        self._from_eigenbasis(Up[0], D[0], P[0])
+
+    @classmethod
+    def batch(cls, unitary_matrices):
+        """Decompose many two-qubit unitaries at once.
+
+        The normalization into SU(4), the change to the magic basis and the
+        diagonalization are done on the stacked ``(n, 4, 4)`` array in single
+        NumPy calls; only the flip into the Weyl chamber is done per matrix.
+
+        Args:
+            unitary_matrices (list[ndarray] or ndarray): the 4x4 unitaries,
+                or an array of shape ``(n, 4, 4)``.
+
+        Returns:
+            list[TwoQubitWeylDecomposition]: the decompositions, in the same order.
+        """
+        unitary_matrices = np.asarray(unitary_matrices, dtype=complex).reshape(-1, 4, 4)
+        Up, M2 = _magic_basis_square(unitary_matrices)
+        D, P = _diagonalize_symmetric_unitaries(M2)
+        decompositions = []
+        for Upi, Di, Pi in zip(Up, D, P):
+            decomposition = cls.__new__(cls)
+            decomposition._from_eigenbasis(Upi, Di, Pi)
+            decompositions.append(decomposition)
+        return decompositions
+
+    def _from_eigenbasis(self, Up, D, P):
+        """Finish the decomposition from the diagonalization ``M2 = P.D.P^T``."""
         pi2 = np.pi/2
         pi4 = np.pi/4
 
-        # Make U be in SU(4)
-        U = unitary_matrix.copy()
-        U *= la.det(U)**(-0.25)
-
-        Up = _Bd.dot(U).dot(_B)
-        M2 = Up.T.dot(Up)
-
-        # M2 is a symmetric complex matrix. We need to decompose it as M2 = P D P^T where
-        # P ∈ SO(4), D is diagonal with unit-magnitude elements.
-        # D, P = la.eig(M2)  # this can fail for certain kinds of degeneracy
-        for i in range(100):  # FIXME: this randomized algorithm is horrendous
-            state = np.random.default_rng(i)
-            M2real = state.normal()*M2.real + state.normal()*M2.imag
-            _, P = la.eigh(M2real)
-            D = P.T.dot(M2).dot(P).diagonal()
-            if np.allclose(P.dot(np.diag(D)).dot(P.T), M2, rtol=1.0e-13, atol=1.0e-13):
-                break
-        else:
-            raise QiskitError("TwoQubitWeylDecomposition: failed to diagonalize M2")
-
         d = -np.angle(D)/2
         d[3] = -d[0]-d[1]-d[2]
         cs = np.mod((d[:3]+d[3])/2, 2*np.pi)
@@ -284,11 +361,17 @@ class TwoQubitBasisDecomposer():
         basis_fidelity (float): Fidelity to be assumed for applications of KAK Gate. Default 1.0.
         euler_basis (str): Basis string to be provided to OneQubitEulerDecomposer for 1Q synthesis.
             Valid options are ['ZYZ', 'ZXZ', 'XYX', 'U3', 'U1X', 'RR']. Default 'U3'.
+        cache_size (int): Number of decompositions remembered by the decomposer, keyed on
+            the target unitary up to global phase and rounded to 10 decimals. Repeated
+            targets, e.g. the same two-qubit block appearing many times in a circuit,
+            are then only decomposed once. 0 disables the cache. Default 1024.
     """
 
-    def __init__(self, gate, basis_fidelity=1.0, euler_basis=None):
+    def __init__(self, gate, basis_fidelity=1.0, euler_basis=None, cache_size=1024):
         self.gate = gate
         self.basis_fidelity = basis_fidelity
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
 
         basis = self.basis = TwoQubitWeylDecomposition(Operator(gate).data)
         if euler_basis is not None:
@@ -449,6 +532,55 @@ class TwoQubitBasisDecomposer():
         that each basis application has a finite fidelity.
         """
         basis_fidelity = basis_fidelity or self.basis_fidelity
+        target = self._target_matrix(target)
+        key = self._cache_key(target, basis_fidelity)
+        circuit = self._cache_get(key)
+        if circuit is None:
+            circuit = self._synthesize(TwoQubitWeylDecomposition(target), basis_fidelity)
+            self._cache_put(key, circuit)
+        return circuit.copy()
+
+    def decompose_many(self, targets, basis_fidelity=None):
+        """Decompose a sequence of two-qubit unitaries.
+
+        Equal targets are decomposed once, and the Weyl decompositions of the
+        targets not found in the cache are computed together with
+        :meth:`TwoQubitWeylDecomposition.batch`.
+
+        Args:
+            targets (list): the two-qubit unitaries, in any form accepted by
+                :meth:`__call__`.
+            basis_fidelity (float): fidelity assumed for the basis gate. If None,
+                the fidelity of the decomposer is used.
+
+        Returns:
+            list[QuantumCircuit]: the decompositions, in the order of ``targets``.
+        """
+        basis_fidelity = basis_fidelity or self.basis_fidelity
+        targets = [self._target_matrix(target) for target in targets]
+        keys = [self._cache_key(target, basis_fidelity) for target in targets]
+
+        circuits = {}
+        missing = {}
+        for key, target in zip(keys, targets):
+            if key in circuits or key in missing:
+                continue
+            circuit = self._cache_get(key)
+            if circuit is None:
+                missing[key] = target
+            else:
+                circuits[key] = circuit
+        if missing:
+            decompositions = TwoQubitWeylDecomposition.batch(list(missing.values()))
+            for key, decomposition in zip(missing, decompositions):
+                circuits[key] = self._synthesize(decomposition, basis_fidelity)
+                self._cache_put(key, circuits[key])
+
+        return [circuits[key].copy() for key in keys]
+
+    @staticmethod
+    def _target_matrix(target):
+        """Convert ``target`` to a 4x4 complex array and check it is unitary."""
         if hasattr(target, 'to_operator'):
             # If input is a BaseOperator subclass this attempts to convert
             # the object to an Operator so that we can extract the underlying
@@ -465,8 +597,34 @@ class TwoQubitBasisDecomposer():
             raise QiskitError("TwoQubitBasisDecomposer: expected 4x4 matrix for target")
         if not is_unitary_matrix(target):
             raise QiskitError("TwoQubitBasisDecomposer: target matrix is not unitary.")
+        return target
 
-        target_decomposed = TwoQubitWeylDecomposition(target)
+    @staticmethod
+    def _cache_key(target, basis_fidelity):
+        """Hashable key of ``target`` up to global phase, rounded to 10 decimals.
+
+        The synthesized circuits do not carry the global phase of the target, so
+        the phase is removed by making the largest entry real and positive.
+        """
+        largest = target.flat[np.argmax(np.abs(target))]
+        canonical = np.round(target * (abs(largest) / largest), 10) + 0.0
+        return canonical.tobytes(), basis_fidelity
+
+    def _cache_get(self, key):
+        circuit = self._cache.get(key)
+        if circuit is not None:
+            self._cache.move_to_end(key)
+        return circuit
+
+    def _cache_put(self, key, circuit):
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = circuit
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _synthesize(self, target_decomposed, basis_fidelity):
+        """Build the circuit with the best expected fidelity for a Weyl decomposition."""
         traces = self.traces(target_decomposed)
         expected_fidelities = [trace_to_fid(traces[i]) * basis_fidelity**i for i in range(4)]
 
@@ -23,11 +23,15 @@ Experiment Results (:mod:`qiskit.result`)
    :toctree: ../stubs/
 
    Result
+   ResultBuilder
    ResultError
    Counts
+   MappedMemory
 """
 
 from .result import Result
+from .builder import ResultBuilder
 from .exceptions import ResultError
 from .utils import marginal_counts
 from .counts import Counts
+from .mapped_memory import MappedMemory
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Incremental construction of Results, optionally spilled to disk."""
+
+from collections.abc import Sequence
+import os
+import uuid
+
+from qiskit.qobj.binary import bytes_to_dict, dict_to_bytes
+from qiskit.result.mapped_memory import MappedMemory
+from qiskit.result.models import ExperimentResult
+from qiskit.result.result import Result
+
+# Key of the reference to the file of a MappedMemory in a spilled experiment result
+_MAPPED_MEMORY_KEY = '__mapped_memory__'
+
+
+class ResultBuilder:
+    """Builds a :class:`~qiskit.result.Result` one experiment result at a time.
+
+    Experiment results can be added as soon as they are available, for
+    example from the generator returned by the ``iter_results`` method of the
+    ``BasicAer`` simulators, and the results added so far can be iterated on
+    while more are added.
+
+    If ``spill_dir`` is given, every experiment result is written to its own
+    file in that directory when it is added, and is only read back when it is
+    accessed. The memory used by the builder, and by the result it builds,
+    then does not grow with the size of the data of the experiments. The
+    files are not deleted by the builder.
+
+    Example::
+
+        from qiskit.result import ResultBuilder
+
+        builder = ResultBuilder(backend.name(), '1.0', qobj.qobj_id, 'job-id',
+                                spill_dir='/tmp/results')
+        for experiment_result in backend.iter_results(qobj):
+            builder.add(experiment_result)
+            analyze(experiment_result)
+        result = builder.result()
+    """
+
+    def __init__(self, backend_name, backend_version, qobj_id, job_id,
+                 spill_dir=None, **kwargs):
+        """Create an empty builder.
+
+        Args:
+            backend_name (str): backend name.
+            backend_version (str): backend version, in the form X.Y.Z.
+            qobj_id (str): user-generated Qobj id.
+            job_id (str): unique execution id from the backend.
+            spill_dir (str): directory where the experiment results are
+                written. If None, they are kept in memory.
+            kwargs: the other fields of the result, like ``date``, ``status``
+                and ``header``, passed to :class:`~qiskit.result.Result`.
+        """
+        self.backend_name = backend_name
+        self.backend_version = backend_version
+        self.qobj_id = qobj_id
+        self.job_id = job_id
+        self.spill_dir = spill_dir
+        self._kwargs = kwargs
+        self._success = True
+        if spill_dir is None:
+            self._results = []
+        else:
+            os.makedirs(spill_dir, exist_ok=True)
+            self._results = SpilledExperimentResults(
+                os.path.join(spill_dir, '%s-%s' % (job_id, uuid.uuid4().hex)))
+
+    def add(self, experiment_result):
+        """Add the result of the next experiment.
+
+        Args:
+            experiment_result (ExperimentResult or dict): the experiment
+                result, or its dictionary form.
+        """
+        if isinstance(experiment_result, dict):
+            experiment_result = ExperimentResult.from_dict(experiment_result)
+        self._success = self._success and bool(getattr(experiment_result, 'success', False))
+        self._results.append(experiment_result)
+
+    def extend(self, experiment_results):
+        """Add the results of the next experiments.
+
+        Args:
+            experiment_results (iterable): experiment results or their
+                dictionary forms, as accepted by :meth:`add`.
+        """
+        for experiment_result in experiment_results:
+            self.add(experiment_result)
+
+    def __len__(self):
+        return len(self._results)
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def result(self, **kwargs):
+        """Return the :class:`~qiskit.result.Result` of the experiments added so far.
+
+        The result shares its experiment results with the builder: with
+        ``spill_dir``, they are read from disk when accessed, as a new copy
+        every time (see :class:`~qiskit.result.builder.SpilledExperimentResults`).
+
+        Args:
+            kwargs: fields of the result overriding the ones given to the
+                builder, for example ``status`` or ``time_taken``.
+
+        Returns:
+            Result: the result.
+        """
+        fields = dict(self._kwargs)
+        fields.update(kwargs)
+        fields.setdefault('success', self._success)
+        results = self._results if self.spill_dir is not None else list(self._results)
+        return Result(self.backend_name, self.backend_version, self.qobj_id,
+                      self.job_id, results=results, **fields)
+
+
+class SpilledExperimentResults(Sequence):
+    """A sequence of experiment results stored in files.
+
+    Every experiment result is stored in the binary format of
+    :meth:`~qiskit.result.Result.to_bytes`, in a file named after ``prefix``
+    and its position, and is read back every time it is accessed. Each access
+    therefore returns a new copy: changes made to it are only kept once it is
+    assigned back, with ``results[index] = experiment_result``. The memory of
+    an experiment stored in a :class:`~qiskit.result.MappedMemory` is not
+    copied into its file, which refers to the file of the memory instead.
+    """
+
+    def __init__(self, prefix):
+        """Create an empty sequence.
+
+        Args:
+            prefix (str): path prefix of the files.
+        """
+        self.prefix = prefix
+        self._paths = []
+
+    def append(self, experiment_result):
+        """Write an experiment result at the end of the sequence.
+
+        Args:
+            experiment_result (ExperimentResult): the experiment result.
+        """
+        path = '%s-%d.qres' % (self.prefix, len(self._paths))
+        self._write(path, experiment_result)
+        self._paths.append(path)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        with open(self._paths[index], 'rb') as fd:
+            data = bytes_to_dict(fd.read())
+        memory = data['data'].get('memory')
+        if isinstance(memory, dict) and _MAPPED_MEMORY_KEY in memory:
+            data['data']['memory'] = MappedMemory(memory[_MAPPED_MEMORY_KEY])
+        return ExperimentResult.from_dict(data)
+
+    def __setitem__(self, index, experiment_result):
+        """Overwrite the experiment result at a position.
+
+        Args:
+            index (int): the position.
+            experiment_result (ExperimentResult): the new experiment result.
+
+        Raises:
+            TypeError: if ``index`` is not an integer.
+        """
+        if not isinstance(index, int):
+            raise TypeError('Spilled experiment results can only be replaced one at a time.')
+        self._write(self._paths[index], experiment_result)
+
+    @staticmethod
+    def _write(path, experiment_result):
+        data = experiment_result.to_dict()
+        memory = getattr(experiment_result.data, 'memory', None)
+        if isinstance(memory, MappedMemory):
+            data['data']['memory'] = {_MAPPED_MEMORY_KEY: memory.path}
+        with open(path, 'wb') as fd:
+            fd.write(dict_to_bytes(data))
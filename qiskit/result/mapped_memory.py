@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Measurement level 0 and 1 memory stored in a memory-mapped file."""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+
+
+class MappedMemory:
+    """Measurement level 0 or level 1 memory stored in a memory-mapped file.
+
+    The memory is stored in a ``.npy`` file in the format of the results
+    schema: an array of floats whose last axis holds the real and imaginary
+    parts of each entry. Since this is also the layout of an array of complex
+    numbers, :attr:`data` is a complex view of the file, of the shape returned
+    by :meth:`~qiskit.result.Result.get_memory`, and only the parts of it that
+    are accessed are read from disk. For example, ``memory[100:200, 3]`` reads
+    the entries of memory slot 3 for 100 shots.
+
+    The methods :meth:`iter_chunks`, :meth:`average` and :meth:`integrate`
+    process the memory a block of shots at a time, so they never hold more
+    than one block in memory.
+    """
+
+    def __init__(self, path, mode='r'):
+        """Open the memory stored in a file.
+
+        Args:
+            path (str): path of the ``.npy`` file.
+            mode (str): mode of the memory map, ``'r'`` for read only or
+                ``'r+'`` for read and write.
+
+        Raises:
+            QiskitError: if the file does not hold measurement memory.
+        """
+        self.path = path
+        self._raw = np.load(path, mmap_mode=mode)
+        if (self._raw.ndim < 2 or self._raw.shape[-1] != 2
+                or self._raw.dtype != np.float64):
+            raise QiskitError('%s does not hold measurement memory.' % path)
+        self._data = self._raw.view(np.complex128)[..., 0]
+
+    @classmethod
+    def from_memory(cls, memory, path, chunk_shots=1024):
+        """Write measurement memory to a file and open it.
+
+        Args:
+            memory (list or np.ndarray): the memory, either in the format of
+                the results schema, a nested list or array of floats whose
+                innermost dimension has length 2, or as a complex array.
+            path (str): path of the ``.npy`` file to write.
+            chunk_shots (int): number of entries of the first axis converted
+                at once, when ``memory`` is a nested list.
+
+        Returns:
+            MappedMemory: the memory, opened for reading.
+
+        Raises:
+            QiskitError: if ``memory`` is not level 0 or level 1 memory.
+        """
+        is_complex = isinstance(memory, np.ndarray) and np.iscomplexobj(memory)
+        if is_complex:
+            shape = memory.shape + (2,)
+        else:
+            if not len(memory):  # pylint: disable=len-as-condition
+                raise QiskitError('Cannot store empty measurement memory.')
+            shape = (len(memory),) + np.shape(memory[0])
+        if len(shape) < 2 or shape[-1] != 2:
+            raise QiskitError('Inner most nested list is not of length 2.')
+
+        raw = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+        data = raw.view(np.complex128)[..., 0]
+        for start in range(0, shape[0], chunk_shots):
+            chunk = memory[start:start + chunk_shots]
+            if is_complex:
+                data[start:start + chunk_shots] = chunk
+            else:
+                raw[start:start + chunk_shots] = np.asarray(chunk, dtype=np.float64)
+        raw.flush()
+        del data, raw
+        return cls(path)
+
+    @property
+    def data(self):
+        """np.ndarray: the complex memory, as a view of the file."""
+        return self._data
+
+    @property
+    def raw(self):
+        """np.ndarray: the memory in the format of the results schema, as a
+        view of the file."""
+        return self._raw
+
+    @property
+    def shape(self):
+        """tuple: the shape of the complex memory."""
+        return self._data.shape
+
+    @property
+    def ndim(self):
+        """int: the number of dimensions of the complex memory."""
+        return self._data.ndim
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __array__(self, dtype=None):
+        return np.array(self._data, dtype=dtype)
+
+    def __repr__(self):
+        return "MappedMemory(%r, shape=%s)" % (self.path, self.shape)
+
+    def iter_chunks(self, chunk_shots=1024):
+        """Iterate over the memory a block of entries of the first axis at a time.
+
+        Args:
+            chunk_shots (int): number of entries of the first axis per block.
+
+        Yields:
+            np.ndarray: complex array with the memory of the block, in memory.
+        """
+        for start in range(0, len(self), chunk_shots):
+            yield np.array(self._data[start:start + chunk_shots])
+
+    def average(self, chunk_shots=1024):
+        """Average the memory over its first axis (the shots for
+        ``meas_return='single'`` memory).
+
+        Args:
+            chunk_shots (int): number of shots processed at once.
+
+        Returns:
+            np.ndarray: complex array of shape ``self.shape[1:]``.
+        """
+        total = np.zeros(self.shape[1:], dtype=np.complex128)
+        for chunk in self.iter_chunks(chunk_shots):
+            total += chunk.sum(axis=0)
+        return total / len(self)
+
+    def integrate(self, kernel, chunk_shots=1024, path=None):
+        """Integrate level 0 memory into level 1 memory with a kernel.
+
+        Every trace, along the last axis, is multiplied by the kernel and
+        summed.
+
+        Args:
+            kernel (np.ndarray): weights of the samples of a trace, of shape
+                ``(memory_slot_size,)`` for all the memory slots, or
+                ``(memory_slots, memory_slot_size)`` for one kernel per memory
+                slot.
+            chunk_shots (int): number of entries of the first axis processed
+                at once.
+            path (str): if given, the level 1 memory is written to a file at
+                this path instead of being returned as an array.
+
+        Returns:
+            np.ndarray or MappedMemory: the level 1 memory, of shape
+                ``self.shape[:-1]``.
+
+        Raises:
+            QiskitError: if the shape of the kernel does not match the traces.
+        """
+        kernel = np.asarray(kernel)
+        if kernel.shape[-1] != self.shape[-1] or kernel.ndim > 2:
+            raise QiskitError('The kernel of shape %s does not match traces of length %d.'
+                              % (kernel.shape, self.shape[-1]))
+        if path is None:
+            integrated = np.empty(self.shape[:-1], dtype=np.complex128)
+        else:
+            raw = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                            shape=self.shape[:-1] + (2,))
+            integrated = raw.view(np.complex128)[..., 0]
+        start = 0
+        for chunk in self.iter_chunks(chunk_shots):
+            integrated[start:start + len(chunk)] = (chunk * kernel).sum(axis=-1)
+            start += len(chunk)
+        if path is None:
+            return integrated
+        raw.flush()
+        del integrated, raw
+        return MappedMemory(path)
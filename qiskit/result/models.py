@@ -19,6 +19,7 @@ import copy
 from qiskit.qobj.utils import MeasReturnType, MeasLevel
 from qiskit.qobj import QobjExperimentHeader
 from qiskit.exceptions import QiskitError
+from qiskit.result.mapped_memory import MappedMemory
 
 
 class ExperimentResultData:
@@ -35,8 +36,9 @@ class ExperimentResultData:
             snapshots (dict): A dictionary where the key is the snapshot
                 slot and the value is a dictionary of the snapshots for
                 that slot.
-            memory (list): A list of results per shot if the run had
-                memory enabled
+            memory (list or MappedMemory): A list of results per shot if the
+                run had memory enabled. Measurement level 0 and 1 memory can
+                also be a :class:`~qiskit.result.MappedMemory` stored in a file.
             statevector (list or numpy.array): A list or numpy array of the
                 statevector result
             unitary (list or numpy.array): A list or numpy arrray of the
@@ -65,6 +67,8 @@ class ExperimentResultData:
                       'unitary']:
             if hasattr(self, field):
                 out_dict[field] = getattr(self, field)
+        if isinstance(out_dict.get('memory'), MappedMemory):
+            out_dict['memory'] = out_dict['memory'].raw
         return out_dict
 
     @classmethod
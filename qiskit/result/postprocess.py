@@ -17,6 +17,7 @@
 import numpy as np
 
 from qiskit.exceptions import QiskitError
+from qiskit.result.mapped_memory import MappedMemory
 
 
 def _hex_to_bin(hexstring):
@@ -99,17 +100,21 @@ def format_level_0_memory(memory):
     """ Format an experiment result memory object for measurement level 0.
 
     Args:
-        memory (list): Memory from experiment with `meas_level==1`. `avg` or
-            `single` will be inferred from shape of result memory.
+        memory (list or MappedMemory): Memory from experiment with `meas_level==0`.
+            `avg` or `single` will be inferred from shape of result memory.
 
     Returns:
-        np.ndarray: Measurement level 0 complex numpy array
+        np.ndarray: Measurement level 0 complex numpy array. For a
+            :class:`~qiskit.result.MappedMemory`, a view of its file.
 
     Raises:
         QiskitError: If the returned numpy array does not have 2 (avg) or 3 (single)
             indices.
     """
-    formatted_memory = _list_to_complex_array(memory)
+    if isinstance(memory, MappedMemory):
+        formatted_memory = memory.data
+    else:
+        formatted_memory = _list_to_complex_array(memory)
     # infer meas_return from shape of returned data.
     if not 2 <= len(formatted_memory.shape) <= 3:
         raise QiskitError('Level zero memory is not of correct shape.')
@@ -120,17 +125,21 @@ def format_level_1_memory(memory):
     """ Format an experiment result memory object for measurement level 1.
 
     Args:
-        memory (list): Memory from experiment with `meas_level==1`. `avg` or
-            `single` will be inferred from shape of result memory.
+        memory (list or MappedMemory): Memory from experiment with `meas_level==1`.
+            `avg` or `single` will be inferred from shape of result memory.
 
     Returns:
-        np.ndarray: Measurement level 1 complex numpy array
+        np.ndarray: Measurement level 1 complex numpy array. For a
+            :class:`~qiskit.result.MappedMemory`, a view of its file.
 
     Raises:
         QiskitError: If the returned numpy array does not have 1 (avg) or 2 (single)
             indices.
     """
-    formatted_memory = _list_to_complex_array(memory)
+    if isinstance(memory, MappedMemory):
+        formatted_memory = memory.data
+    else:
+        formatted_memory = _list_to_complex_array(memory)
     # infer meas_return from shape of returned data.
     if not 1 <= len(formatted_memory.shape) <= 2:
         raise QiskitError('Level one memory is not of correct shape.')
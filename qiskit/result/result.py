@@ -15,6 +15,9 @@
 """Model for schema-conformant Results."""
 
 import copy
+import os
+
+import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.pulse.schedule import Schedule
@@ -23,8 +26,10 @@ from qiskit.quantum_info.states import statevector
 from qiskit.result.models import ExperimentResult
 from qiskit.result import postprocess
 from qiskit.result.counts import Counts
+from qiskit.result.mapped_memory import MappedMemory
 from qiskit.qobj.utils import MeasLevel
 from qiskit.qobj import QobjHeader
+from qiskit.qobj.binary import bytes_to_dict, dict_to_bytes
 
 
 class Result:
@@ -52,6 +57,7 @@ class Result:
         self.job_id = job_id
         self.success = success
         self.results = results
+        self._name_index = None
         if date is not None:
             self.date = date
         if status is not None:
@@ -109,6 +115,30 @@ class Result:
             in_data['header'] = QobjHeader.from_dict(in_data.pop('header'))
         return cls(**in_data)
 
+    def to_bytes(self):
+        """Serialize the Result to the format of :mod:`qiskit.qobj.binary`.
+
+        Statevectors, unitaries and level 0 and 1 memory are stored as raw
+        buffers instead of text. Lists of 64 or more numbers are loaded back
+        with a single type, so a list of ints and floats becomes floats.
+
+        Returns:
+            bytes: the serialized Result.
+        """
+        return dict_to_bytes(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a Result serialized with :meth:`to_bytes`.
+
+        Args:
+            data (bytes): the serialized Result.
+
+        Returns:
+            Result: The Result from the input bytes.
+        """
+        return cls.from_dict(bytes_to_dict(data))
+
     def data(self, experiment=None):
         """Get the raw data for an experiment.
 
@@ -168,8 +198,9 @@ class Result:
         ['00000', '01000', '10100', '10100', '11101', '11100', '00101', ..., '01010']
 
         Args:
-            experiment (str or QuantumCircuit or Schedule or int or None): the index of the
-                experiment, as specified by ``data()``.
+            experiment (str or QuantumCircuit or Schedule or int or list or None): the index
+                of the experiment, as specified by ``data()``. If a list of indices is
+                given, a list with the memory of each of these experiments is returned.
 
         Returns:
             List[str] or np.ndarray: Either the list of each outcome, formatted according to
@@ -188,6 +219,8 @@ class Result:
         Raises:
             QiskitError: if there is no memory data for the circuit.
         """
+        if isinstance(experiment, (list, tuple, range)):
+            return [self.get_memory(key) for key in experiment]
         try:
             exp_result = self._get_experiment(experiment)
 
@@ -198,7 +231,9 @@ class Result:
 
             meas_level = exp_result.meas_level
 
-            memory = self.data(experiment)['memory']
+            memory = getattr(exp_result.data, 'memory', None)
+            if memory is None:
+                raise QiskitError('No memory for experiment "{0}".'.format(experiment))
 
             if meas_level == MeasLevel.CLASSIFIED:
                 return postprocess.format_level_2_memory(memory, header)
@@ -212,12 +247,45 @@ class Result:
         except KeyError:
             raise QiskitError('No memory for experiment "{0}".'.format(experiment))
 
+    def map_memory(self, directory, experiments=None):
+        """Move the measurement level 0 and 1 memory of experiments to files.
+
+        The memory of every such experiment is written to a ``.npy`` file in
+        ``directory`` and replaced by a :class:`~qiskit.result.MappedMemory`
+        of that file, so that it is no longer held in memory.
+        :meth:`get_memory` then returns a view of the file, from which only
+        the slices accessed are read. The experiment results spilled to disk
+        by a :class:`~qiskit.result.ResultBuilder` are rewritten to refer to
+        the file of their memory.
+
+        Args:
+            directory (str): directory of the files, created if needed.
+            experiments (list or None): the indices of the experiments, as
+                specified by ``data()``. If None, all the experiments.
+        """
+        if experiments is None:
+            experiments = range(len(self.results))
+        os.makedirs(directory, exist_ok=True)
+        for key in experiments:
+            index = self._experiment_index(key)
+            exp = self._get_experiment(index)
+            memory = getattr(exp.data, 'memory', None)
+            if (memory is None or isinstance(memory, MappedMemory)
+                    or exp.meas_level == MeasLevel.CLASSIFIED):
+                continue
+            path = os.path.join(directory, '%s-%d.npy' % (self.job_id, index))
+            exp.data.memory = MappedMemory.from_memory(memory, path)
+            # Experiment results spilled by a ResultBuilder are copies, which
+            # must be written back.
+            self.results[index] = exp
+
     def get_counts(self, experiment=None):
         """Get the histogram data of an experiment.
 
         Args:
-            experiment (str or QuantumCircuit or Schedule or int or None): the index of the
-                experiment, as specified by ``get_data()``.
+            experiment (str or QuantumCircuit or Schedule or int or list or None): the index
+                of the experiment, as specified by ``get_data()``. If a list of indices is
+                given, a list with the counts of each of these experiments is returned.
 
         Returns:
             dict[str:int] or list[dict[str:int]]: a dictionary or a list of
@@ -231,6 +299,8 @@ class Result:
         """
         if experiment is None:
             exp_keys = range(len(self.results))
+        elif isinstance(experiment, (list, tuple, range)):
+            return [self.get_counts(key) for key in experiment]
         else:
             exp_keys = [experiment]
 
@@ -242,16 +312,17 @@ class Result:
             except (AttributeError, QiskitError):  # header is not available
                 header = None
 
-            if 'counts' in self.data(key).keys():
+            data = exp.data.to_dict()
+            if 'counts' in data:
                 if header:
                     counts_header = {
                         k: v for k, v in header.items() if k in {
                             'time_taken', 'creg_sizes', 'memory_slots'}}
                 else:
                     counts_header = {}
-                dict_list.append(Counts(self.data(key)['counts'], **counts_header))
-            elif 'statevector' in self.data(key).keys():
-                vec = postprocess.format_statevector(self.data(key)['statevector'])
+                dict_list.append(Counts(data['counts'], **counts_header))
+            elif 'statevector' in data:
+                vec = postprocess.format_statevector(data['statevector'])
                 dict_list.append(statevector.Statevector(vec).probabilities_dict(decimals=15))
             else:
                 raise QiskitError('No counts for experiment "{0}"'.format(key))
@@ -262,6 +333,83 @@ class Result:
         else:
             return dict_list
 
+    def get_counts_array(self, experiments=None):
+        """Get the histograms of several experiments as a dense array.
+
+        Outcome ``i`` of experiment ``experiments[j]`` is counted in entry
+        ``[j, i]``, where the outcome is the integer whose binary
+        representation is the measured memory slots (``memory_slots[0]``
+        being the least significant bit).
+
+        Args:
+            experiments (list or None): the indices of the experiments, as
+                specified by ``data()``. If None, all the experiments.
+
+        Returns:
+            np.ndarray: array of integers of shape
+                ``(len(experiments), 2**memory_slots)``, where ``memory_slots``
+                is the largest number of memory slots of the experiments.
+
+        Raises:
+            QiskitError: if there are no counts for one of the experiments.
+        """
+        if experiments is None:
+            experiments = range(len(self.results))
+        int_counts = []
+        num_outcomes = 1
+        for key in experiments:
+            exp = self._get_experiment(key)
+            counts = getattr(exp.data, 'counts', None)
+            if counts is None:
+                raise QiskitError('No counts for experiment "{0}"'.format(key))
+            counts = Counts(counts).int_outcomes() if counts else {}
+            memory_slots = getattr(getattr(exp, 'header', None), 'memory_slots', None)
+            if memory_slots is not None:
+                num_outcomes = max(num_outcomes, 2 ** memory_slots)
+            if counts:
+                num_outcomes = max(num_outcomes, max(counts) + 1)
+            int_counts.append(counts)
+
+        counts_array = np.zeros((len(int_counts), num_outcomes), dtype=int)
+        for row, counts in enumerate(int_counts):
+            if counts:
+                counts_array[row, list(counts)] = list(counts.values())
+        return counts_array
+
+    def get_memory_array(self, experiments=None):
+        """Get the memory of several experiments stacked in a dense array.
+
+        Args:
+            experiments (list or None): the indices of the experiments, as
+                specified by ``data()``. If None, all the experiments.
+
+        Returns:
+            np.ndarray: for measurement levels 0 and 1, the arrays returned by
+                :meth:`get_memory` stacked along a new first axis. For
+                measurement level 2, an array of integers of shape
+                ``(len(experiments), shots)`` with the outcome of each shot as
+                in :meth:`get_counts_array`.
+
+        Raises:
+            QiskitError: if there is no memory for one of the experiments, or
+                if the memories of the experiments do not have the same shape.
+        """
+        if experiments is None:
+            experiments = range(len(self.results))
+        memories = []
+        for key in experiments:
+            exp = self._get_experiment(key)
+            memory = getattr(exp.data, 'memory', None)
+            if memory is None:
+                raise QiskitError('No memory for experiment "{0}".'.format(key))
+            if exp.meas_level == MeasLevel.CLASSIFIED:
+                memories.append([int(shot, 0) for shot in memory])
+            else:
+                memories.append(self.get_memory(key))
+        if len({np.shape(memory) for memory in memories}) > 1:
+            raise QiskitError('The memories of the experiments have different shapes.')
+        return np.array(memories)
+
     def get_statevector(self, experiment=None, decimals=None):
         """Get the final statevector of an experiment.
 
@@ -327,21 +475,7 @@ class Result:
                     'one available')
             key = 0
 
-        # Key is a QuantumCircuit/Schedule or str: retrieve result by name.
-        if isinstance(key, (QuantumCircuit, Schedule)):
-            key = key.name
-        # Key is an integer: return result by index.
-        if isinstance(key, int):
-            exp = self.results[key]
-        else:
-            try:
-                # Look into `result[x].header.name` for the names.
-                exp = next(result for result in self.results
-                           if getattr(getattr(result, 'header', None),
-                                      'name', '') == key)
-            except StopIteration:
-                raise QiskitError('Data for experiment "%s" could not be found.' %
-                                  key)
+        exp = self.results[self._experiment_index(key)]
 
         # Check that the retrieved experiment was successful
         if getattr(exp, 'success', False):
@@ -350,3 +484,56 @@ class Result:
         result_status = getattr(self, 'status', 'Result was not successful')
         exp_status = getattr(exp, 'status', 'Experiment was not successful')
         raise QiskitError(result_status, ", ", exp_status)
+
+    def _experiment_index(self, key):
+        """Return the position in ``self.results`` of an experiment.
+
+        Args:
+            key (str or QuantumCircuit or Schedule or int): the index of the
+                experiment, as specified by ``data()``.
+
+        Returns:
+            int: the position of the experiment result.
+
+        Raises:
+            QiskitError: if there is no experiment named ``key``.
+        """
+        # Key is a QuantumCircuit/Schedule or str: retrieve result by name.
+        if isinstance(key, (QuantumCircuit, Schedule)):
+            key = key.name
+        # Key is an integer: return result by index.
+        if isinstance(key, int):
+            return key
+        index = self._find_experiment_index(key)
+        if index is None:
+            raise QiskitError('Data for experiment "%s" could not be found.' % key)
+        return index
+
+    def _find_experiment_index(self, name):
+        """Return the position of the first experiment result named ``name``, or None.
+
+        The lookup uses a map from names to positions in ``self.results``,
+        built on first use. The map is rebuilt when ``self.results`` changes
+        length or when the experiment it points to has been renamed.
+        """
+        name_index = self.__dict__.get('_name_index')
+        if name_index is None or name_index[0] != len(self.results):
+            name_index = self._build_name_index()
+        index = name_index[1].get(name)
+        if index is None or _experiment_name(self.results[index]) != name:
+            name_index = self._build_name_index()
+            index = name_index[1].get(name)
+        return index
+
+    def _build_name_index(self):
+        """Build the map of experiment names, looked up in ``header.name``."""
+        names = {}
+        for index, result in enumerate(self.results):
+            names.setdefault(_experiment_name(result), index)
+        self._name_index = (len(self.results), names)
+        return self._name_index
+
+
+def _experiment_name(result):
+    """The name of an experiment result, from its header."""
+    return getattr(getattr(result, 'header', None), 'name', '')
@@ -197,7 +197,7 @@ def _basis_search(equiv_lib, source_basis, target_basis, heuristic):
     open_heap = []
 
     # Map from bases in closed_set to predecessor with lowest cost_from_source.
-    # Values are Tuple[prev_basis, gate_name, params, circuit].
+    # Values are Tuple[prev_basis, gate_name, gate_num_qubits, get_equivalence].
     came_from = {}
 
     basis_count = iter_count()  # Used to break ties in priority.
@@ -229,8 +229,9 @@ def _basis_search(equiv_lib, source_basis, target_basis, heuristic):
             rtn = []
             last_basis = current_basis
             while last_basis != source_basis:
-                prev_basis, gate_name, gate_num_qubits, params, equiv = came_from[last_basis]
+                prev_basis, gate_name, gate_num_qubits, get_equiv = came_from[last_basis]
 
+                params, equiv = get_equiv()
                 rtn.append((gate_name, gate_num_qubits, params, equiv))
                 last_basis = prev_basis
             rtn.reverse()
@@ -245,20 +246,18 @@ def _basis_search(equiv_lib, source_basis, target_basis, heuristic):
         closed_set.add(current_basis)
 
         for gate_name, gate_num_qubits in current_basis:
-            equivs = equiv_lib._get_equivalences((gate_name, gate_num_qubits))
+            # The bases of lazy equivalences are known without building them,
+            # so only the equivalences of the path found are built.
+            equiv_bases = equiv_lib._get_equivalence_bases((gate_name, gate_num_qubits))
 
             basis_remain = current_basis - {(gate_name, gate_num_qubits)}
-            neighbors = [
-                (frozenset(basis_remain | set((inst.name, inst.num_qubits)
-                                              for inst, qargs, cargs in equiv.data)),
-                 params,
-                 equiv)
-                for params, equiv in equivs]
+            neighbors = [(basis_remain | equiv_basis, get_equiv)
+                         for equiv_basis, get_equiv in equiv_bases]
 
             # Weight total path length of transformation weakly.
             tentative_cost_from_source = cost_from_source[current_basis] + 1e-3
 
-            for neighbor, params, equiv in neighbors:
+            for neighbor, get_equiv in neighbors:
                 if neighbor in closed_set:
                     continue
 
@@ -266,7 +265,7 @@ def _basis_search(equiv_lib, source_basis, target_basis, heuristic):
                     continue
 
                 open_set.add(neighbor)
-                came_from[neighbor] = (current_basis, gate_name, gate_num_qubits, params, equiv)
+                came_from[neighbor] = (current_basis, gate_name, gate_num_qubits, get_equiv)
                 cost_from_source[neighbor] = tentative_cost_from_source
                 est_total_cost[neighbor] = tentative_cost_from_source \
                     + heuristic(neighbor, target_basis)
@@ -46,14 +46,16 @@ class Decompose(TransformationPass):
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes(self.gate):
             # opaque or built-in gates are not decomposable
-            if not node.op.definition:
+            definition = node.op._get_definition()
+            if not definition:
                 continue
             # TODO: allow choosing among multiple decomposition rules
-            rule = node.op.definition.data
+            rule = definition.data
 
             if len(rule) == 1 and len(node.qargs) == len(rule[0][1]):
-                dag.substitute_node(node, rule[0][0], inplace=True)
+                # the definition may be shared, so the DAG gets a copy of its instruction
+                dag.substitute_node(node, rule[0][0].copy(), inplace=True)
             else:
-                decomposition = circuit_to_dag(node.op.definition)
+                decomposition = circuit_to_dag(definition)
                 dag.substitute_node_with_dag(node, decomposition)
         return dag
@@ -34,7 +34,7 @@ class Unroll3qOrMore(TransformationPass):
         """
         for node in dag.multi_qubit_ops():
             # TODO: allow choosing other possible decompositions
-            rule = node.op.definition.data
+            rule = node.op._get_definition().data
             if not rule:
                 if rule == []:  # empty node
                     dag.remove_op_node(node)
@@ -42,7 +42,7 @@ class Unroll3qOrMore(TransformationPass):
                 raise QiskitError("Cannot unroll all 3q or more gates. "
                                   "No rule to expand instruction %s." %
                                   node.op.name)
-            decomposition = circuit_to_dag(node.op.definition)
+            decomposition = circuit_to_dag(node.op._get_definition())
             decomposition = self.run(decomposition)  # recursively unroll
             dag.substitute_node_with_dag(node, decomposition)
         return dag
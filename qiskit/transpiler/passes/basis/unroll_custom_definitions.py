@@ -66,7 +66,7 @@ class UnrollCustomDefinitions(TransformationPass):
                     continue
 
             try:
-                rule = node.op.definition.data
+                rule = node.op._get_definition().data
             except TypeError as err:
                 raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
             except AttributeError:
@@ -83,7 +83,7 @@ class UnrollCustomDefinitions(TransformationPass):
                                   "Instruction %s not found in equivalence library "
                                   "and no rule found to expand." %
                                   (str(self._basis_gates), node.op.name))
-            decomposition = circuit_to_dag(node.op.definition)
+            decomposition = circuit_to_dag(node.op._get_definition())
             unrolled_dag = UnrollCustomDefinitions(self._equiv_lib,
                                                    self._basis_gates).run(
                                                        decomposition)
@@ -67,7 +67,7 @@ class Unroller(TransformationPass):
                     continue
             # TODO: allow choosing other possible decompositions
             try:
-                rule = node.op.definition.data
+                rule = node.op._get_definition().data
             except TypeError as err:
                 raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
 
@@ -77,12 +77,14 @@ class Unroller(TransformationPass):
             # different that the width of the node.
             while rule and len(rule) == 1 and len(node.qargs) == len(rule[0][1]):
                 if rule[0][0].name in self.basis:
-                    if node.op.definition and node.op.definition.global_phase:
-                        dag.global_phase += node.op.definition.global_phase
-                    dag.substitute_node(node, rule[0][0], inplace=True)
+                    definition = node.op._get_definition()
+                    if definition and definition.global_phase:
+                        dag.global_phase += definition.global_phase
+                    # the definition may be shared, so the DAG gets a copy of its instruction
+                    dag.substitute_node(node, rule[0][0].copy(), inplace=True)
                     break
                 try:
-                    rule = rule[0][0].definition.data
+                    rule = rule[0][0]._get_definition().data
                 except (TypeError, AttributeError) as err:
                     raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
 
@@ -95,10 +97,11 @@ class Unroller(TransformationPass):
                     raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
                                       "No rule to expand instruction %s." %
                                       (str(self.basis), node.op.name))
-                decomposition = circuit_to_dag(node.op.definition)
+                definition = node.op._get_definition()
+                decomposition = circuit_to_dag(definition)
                 unrolled_dag = self.run(decomposition)  # recursively unroll ops
-                if node.op.definition and node.op.definition.global_phase:
-                    dag.global_phase += node.op.definition.global_phase
+                if definition and definition.global_phase:
+                    dag.global_phase += definition.global_phase
                 if unrolled_dag.global_phase:
                     dag.global_phase += unrolled_dag.global_phase
                     unrolled_dag.global_phase = 0
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+This module contains the error tables the layout passes score layouts with.
+"""
+
+
+def _backend_errors(backend_prop, symmetric=True):
+    """Extract the cx and readout errors from the backend properties.
+
+    Args:
+        backend_prop (BackendProperties or None): the backend properties.
+        symmetric (bool): also give the error of each cx to the reversed edge.
+
+    Returns:
+        tuple: dict of edge to cx error and dict of qubit to readout error.
+    """
+    cx_errors = {}
+    readout_errors = {}
+    if backend_prop is None:
+        return cx_errors, readout_errors
+    for gate in backend_prop.gates:
+        if gate.gate == 'cx':
+            for param in gate.parameters:
+                if param.name == 'gate_error':
+                    cx_errors[tuple(gate.qubits)] = param.value
+                    if symmetric:
+                        cx_errors[tuple(reversed(gate.qubits))] = param.value
+    for qubit, qubit_props in enumerate(backend_prop.qubits):
+        for nduv in qubit_props:
+            if nduv.name == 'readout_error':
+                readout_errors[qubit] = nduv.value
+    return cx_errors, readout_errors
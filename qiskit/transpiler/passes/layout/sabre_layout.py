@@ -16,13 +16,16 @@
 """
 
 import logging
+import math
 import numpy as np
 
 from qiskit.converters import dag_to_circuit
+from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.passes.layout.set_layout import SetLayout
 from qiskit.transpiler.passes.layout.full_ancilla_allocation import FullAncillaAllocation
 from qiskit.transpiler.passes.layout.enlarge_with_ancilla import EnlargeWithAncilla
 from qiskit.transpiler.passes.layout.apply_layout import ApplyLayout
+from qiskit.transpiler.passes.layout._backend_errors import _backend_errors
 from qiskit.transpiler.passes.routing import SabreSwap
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.layout import Layout
@@ -44,6 +47,11 @@ class SabreLayout(AnalysisPass):
     This method exploits the reversibility of quantum circuits, and tries to
     include global circuit information in the choice of initial_layout.
 
+    As the quality of the result depends a lot on the random first trial
+    layout, the search can be repeated from ``num_starts`` independent random
+    layouts. The starts are evaluated in parallel processes, each candidate
+    layout is scored by routing the circuit with it, and the best one is kept.
+
     **References:**
 
     [1] Li, Gushu, Yufei Ding, and Yuan Xie. "Tackling the qubit mapping problem
@@ -52,7 +60,8 @@ class SabreLayout(AnalysisPass):
     """
 
     def __init__(self, coupling_map, routing_pass=None, seed=None,
-                 max_iterations=3):
+                 max_iterations=3, num_starts=1, score='swaps',
+                 backend_properties=None):
         """SabreLayout initializer.
 
         Args:
@@ -60,12 +69,35 @@ class SabreLayout(AnalysisPass):
             routing_pass (BasePass): the routing pass to use while iterating.
             seed (int): seed for setting a random first trial layout.
             max_iterations (int): number of forward-backward iterations.
+            num_starts (int): number of random first trial layouts to start
+                the search from. The starts are run in parallel and the best
+                resulting layout is kept. For a fixed ``seed`` the result is
+                deterministic.
+            score (str): how the layouts found from different starts are
+                compared, either ``'swaps'`` for the number of swaps needed to
+                route the circuit, or ``'fidelity'`` for the estimated success
+                probability of the routed circuit, which requires
+                ``backend_properties``.
+            backend_properties (BackendProperties): properties of the backend,
+                used for the ``'fidelity'`` score.
+
+        Raises:
+            TranspilerError: if the score is not valid.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
+        self.num_starts = num_starts
+        if score not in ('swaps', 'fidelity'):
+            raise TranspilerError("Invalid score %s for SabreLayout, must be "
+                                  "'swaps' or 'fidelity'." % score)
+        if score == 'fidelity' and backend_properties is None:
+            raise TranspilerError("The 'fidelity' score of SabreLayout requires "
+                                  "backend_properties.")
+        self.score = score
+        self.backend_properties = backend_properties
 
     def run(self, dag):
         """Run the SabreLayout pass on `dag`.
@@ -79,32 +111,67 @@ class SabreLayout(AnalysisPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        # Choose a random initial_layout.
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
+
+        circ = dag_to_circuit(dag)
+        if self.num_starts <= 1:
+            self.property_set['layout'] = self._run_start(self.seed, circ)
+            return
+
+        # The first start uses the pass seed, so the search can only improve
+        # on the single start one. The seeds of the others derive from it.
         rng = np.random.default_rng(self.seed)
+        seeds = [self.seed] + [int(start_seed) for start_seed in
+                               rng.integers(np.iinfo(np.int32).max,
+                                            size=self.num_starts - 1)]
+        # The error tables are the same for every start, so extract them once.
+        errors = None
+        if self.score == 'fidelity':
+            errors = _backend_errors(self.backend_properties)
+        candidates = parallel_map(_run_scored_start, seeds, task_args=(self, circ, errors))
+
+        # min() keeps the first of equally scored layouts, which is the one
+        # from the lowest start and does not depend on the process timings.
+        best = min(range(len(candidates)), key=lambda idx: candidates[idx][0])
+        logger.info('Best of %d starts: start %d, score: %s',
+                    self.num_starts, best, candidates[best][0])
+        self.property_set['layout'] = candidates[best][1]
+
+    def _run_start(self, seed, circ):
+        """Do the forward-backward iterations from a random first layout.
+
+        Args:
+            seed (int): seed for the first trial layout and the default
+                routing pass.
+            circ (QuantumCircuit): the circuit to find a layout for.
+
+        Returns:
+            Layout: the initial layout found.
+        """
+        # Choose a random initial_layout.
+        rng = np.random.default_rng(seed)
 
         physical_qubits = rng.choice(self.coupling_map.size(),
-                                     len(dag.qubits), replace=False)
+                                     len(circ.qubits), replace=False)
         physical_qubits = rng.permutation(physical_qubits)
-        initial_layout = Layout({q: dag.qubits[i]
+        initial_layout = Layout({q: circ.qubits[i]
                                  for i, q in enumerate(physical_qubits)})
 
-        if self.routing_pass is None:
-            self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=self.seed)
+        routing_pass = self.routing_pass
+        if routing_pass is None:
+            routing_pass = SabreSwap(self.coupling_map, 'decay', seed=seed)
 
         # Do forward-backward iterations.
-        circ = dag_to_circuit(dag)
         for i in range(self.max_iterations):
             for _ in ('forward', 'backward'):
-                pm = self._layout_and_route_passmanager(initial_layout)
+                pm = self._layout_and_route_passmanager(initial_layout, routing_pass)
                 new_circ = pm.run(circ)
 
                 # Update initial layout and reverse the unmapped circuit.
                 pass_final_layout = pm.property_set['final_layout']
                 final_layout = self._compose_layouts(initial_layout,
-                                                     pass_final_layout,
-                                                     circ.qregs)
+                                                     pass_final_layout)
                 initial_layout = final_layout
                 circ = circ.reverse_ops()
 
@@ -114,9 +181,51 @@ class SabreLayout(AnalysisPass):
             logger.info('new initial layout')
             logger.info(initial_layout)
 
-        self.property_set['layout'] = initial_layout
+        return initial_layout
+
+    def _score_layout(self, seed, circ, initial_layout, errors=None):
+        """Score a layout by routing the circuit with it. Lower is better.
+
+        Args:
+            seed (int): seed of the default routing pass.
+            circ (QuantumCircuit): the circuit to route.
+            initial_layout (Layout): the layout to score.
+            errors (tuple): the cx and readout error tables of the fidelity
+                score. Extracted from the backend properties if not given.
+
+        Returns:
+            float: the number of swaps inserted, or minus the logarithm of
+            the estimated fidelity of the routed circuit.
+        """
+        routing_pass = self.routing_pass
+        if routing_pass is None:
+            routing_pass = SabreSwap(self.coupling_map, 'decay', seed=seed)
+        routed = self._layout_and_route_passmanager(initial_layout, routing_pass).run(circ)
+
+        if self.score == 'swaps':
+            return routed.count_ops().get('swap', 0)
 
-    def _layout_and_route_passmanager(self, initial_layout):
+        if errors is None:
+            errors = _backend_errors(self.backend_properties)
+        cx_errors, readout_errors = errors
+
+        log_fidelity = 0.0
+        for instruction, qargs, _ in routed.data:
+            physical = tuple(qubit.index for qubit in qargs)
+            if instruction.name == 'measure':
+                error = readout_errors.get(physical[0], 0.0)
+            elif len(physical) == 2 and instruction.name != 'barrier':
+                error = cx_errors.get(physical, 0.0)
+                if instruction.name == 'swap':
+                    error = 1.0 - (1.0 - error) ** 3
+            else:
+                continue
+            if error >= 1.0:
+                return math.inf
+            log_fidelity += math.log(1.0 - error)
+        return -log_fidelity
+
+    def _layout_and_route_passmanager(self, initial_layout, routing_pass):
         """Return a passmanager for a full layout and routing.
 
         We use a factory to remove potential statefulness of passes.
@@ -125,11 +234,11 @@ class SabreLayout(AnalysisPass):
                             FullAncillaAllocation(self.coupling_map),
                             EnlargeWithAncilla(),
                             ApplyLayout(),
-                            self.routing_pass]
+                            routing_pass]
         pm = PassManager(layout_and_route)
         return pm
 
-    def _compose_layouts(self, initial_layout, pass_final_layout, qregs):
+    def _compose_layouts(self, initial_layout, pass_final_layout):
         """Return the real final_layout resulting from the composition
         of an initial_layout with the final_layout reported by a pass.
 
@@ -138,10 +247,23 @@ class SabreLayout(AnalysisPass):
         "final_layout" they report must be amended to account for the actual
         initial_layout that was selected.
         """
-        trivial_layout = Layout.generate_trivial_layout(*qregs)
-        pass_final_layout = Layout({trivial_layout[v.index]: p
-                                    for v, p in pass_final_layout.get_virtual_bits().items()})
-        qubit_map = Layout.combine_into_edge_map(initial_layout, trivial_layout)
-        final_layout = {v: pass_final_layout[qubit_map[v]]
-                        for v, _ in initial_layout.get_virtual_bits().items()}
+        # The routed circuit is on a single device register, so the index of
+        # each of its qubits is the physical qubit it started from.
+        final_physical = {v.index: p for v, p in pass_final_layout.get_virtual_bits().items()}
+        final_layout = {v: final_physical[p]
+                        for v, p in initial_layout.get_virtual_bits().items()}
         return Layout(final_layout)
+
+
+def _run_scored_start(seed, layout_pass, circ, errors):
+    """Run one start of ``layout_pass`` and score the layout found.
+
+    This is a module level function so that it can be used with
+    :func:`~qiskit.tools.parallel.parallel_map`.
+
+    Returns:
+        tuple: (score, Layout)
+    """
+    initial_layout = layout_pass._run_start(seed, circ)
+    score = layout_pass._score_layout(seed, circ, initial_layout, errors)
+    return score, initial_layout
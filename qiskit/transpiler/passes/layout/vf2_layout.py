@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A pass for choosing a Layout of a circuit onto a Coupling graph, as a
+subgraph isomorphism problem solved by the VF2 algorithm. It tries to find a
+solution that fully satisfies the circuit, i.e. no further swap is needed. If
+no solution is found, no ``property_set['layout']`` is set.
+"""
+import math
+from time import time
+
+import networkx as nx
+from networkx.algorithms.isomorphism import GraphMatcher, DiGraphMatcher
+
+from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.basepasses import AnalysisPass
+from qiskit.transpiler.passes.layout._backend_errors import _backend_errors
+
+
+class _LimitReached(Exception):
+    """Raised from inside the matcher to stop the search."""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class _LimitedMatcherMixin:
+    """Adds a call and a time budget to a networkx VF2 matcher.
+
+    Every candidate pair checked by the VF2 state machine goes through
+    ``syntactic_feasibility``, so this counts the calls to it.
+    """
+
+    def __init__(self, G1, G2, call_limit=None, time_limit=None):  # pylint: disable=invalid-name
+        self.call_limit = call_limit
+        self.time_limit = time_limit
+        self.call_current = 0
+        self.time_start = time()
+        super().__init__(G1, G2)
+
+    def syntactic_feasibility(self, G1_node, G2_node):  # pylint: disable=invalid-name
+        """Wrap the VF2 feasibility check to add the limits."""
+        self.call_current += 1
+        if self.call_limit is not None and self.call_current > self.call_limit:
+            raise _LimitReached('call limit reached')
+        if self.time_limit is not None and time() - self.time_start > self.time_limit:
+            raise _LimitReached('time limit reached')
+        return super().syntactic_feasibility(G1_node, G2_node)
+
+
+class _LimitedGraphMatcher(_LimitedMatcherMixin, GraphMatcher):
+    """VF2 matcher on undirected graphs with a call and a time budget."""
+
+
+class _LimitedDiGraphMatcher(_LimitedMatcherMixin, DiGraphMatcher):
+    """VF2 matcher on directed graphs with a call and a time budget."""
+
+
+class VF2Layout(AnalysisPass):
+    """If possible, chooses a perfect Layout using VF2 subgraph isomorphism.
+
+    The interaction graph of the circuit (virtual qubits connected by
+    two-qubit gates) is matched onto the coupling graph with the VF2
+    algorithm. When ``backend_prop`` is given, the physical qubits are
+    offered to the search from the most to the least reliable one, and the
+    matches found are scored by the estimated fidelity of the two-qubit gates
+    and readouts they imply; the best scoring one is kept.
+    """
+
+    def __init__(self, coupling_map, backend_prop=None, strict_direction=False,
+                 call_limit=None, time_limit=None, max_trials=None):
+        """If possible, chooses a perfect Layout using VF2 subgraph isomorphism.
+
+        If not possible, does not set the layout property. In all the cases,
+        the property `VF2Layout_stop_reason` will be added with one of the
+        following values:
+
+        * solution found: If a perfect layout was found.
+        * nonexistent solution: If no perfect layout was found and every combination was checked.
+        * call limit reached: If no perfect layout was found and the call limit was reached.
+        * time limit reached: If no perfect layout was found and the time limit was reached.
+
+        Args:
+            coupling_map (Coupling): Directed graph representing a coupling map.
+            backend_prop (BackendProperties): backend properties used to order
+                and score the candidate layouts. If None, the first perfect
+                layout found is used.
+            strict_direction (bool): If True, considers the direction of the coupling map.
+                                     Default is False.
+            call_limit (int): Amount of candidate pairs the VF2 search checks before
+                giving up. None means no call limit.
+            time_limit (int): Amount of seconds that the pass will try to find a solution.
+                None means no time limit.
+            max_trials (int): Maximum number of perfect layouts to score when
+                ``backend_prop`` is given. None means all of them, within the limits.
+        """
+        super().__init__()
+        self.coupling_map = coupling_map
+        self.backend_prop = backend_prop
+        self.strict_direction = strict_direction
+        self.call_limit = call_limit
+        self.time_limit = time_limit
+        self.max_trials = max_trials
+
+    def run(self, dag):
+        """Run the VF2Layout pass on `dag`."""
+        qubits = dag.qubits
+        qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+
+        interactions = {}
+        for gate in dag.two_qubit_ops():
+            pair = (qubit_indices[gate.qargs[0]], qubit_indices[gate.qargs[1]])
+            if not self.strict_direction:
+                pair = tuple(sorted(pair))
+            interactions[pair] = interactions.get(pair, 0) + 1
+
+        graph_type = nx.DiGraph if self.strict_direction else nx.Graph
+        interaction_graph = graph_type()
+        interaction_graph.add_edges_from(interactions)
+
+        cx_errors, readout_errors = self._errors()
+
+        # VF2 tries the nodes of the coupling graph in insertion order, so
+        # adding the most reliable qubits first makes it find good layouts first.
+        def _qubit_error(physical):
+            incident = [error for edge, error in cx_errors.items() if physical in edge]
+            mean_cx = sum(incident) / len(incident) if incident else 0.0
+            return readout_errors.get(physical, 0.0) + mean_cx
+
+        coupling_graph = graph_type()
+        coupling_graph.add_nodes_from(sorted(self.coupling_map.physical_qubits,
+                                             key=_qubit_error))
+        coupling_graph.add_edges_from(self.coupling_map.get_edges())
+
+        matcher_type = _LimitedDiGraphMatcher if self.strict_direction else _LimitedGraphMatcher
+        matcher = matcher_type(coupling_graph, interaction_graph,
+                               call_limit=self.call_limit, time_limit=self.time_limit)
+
+        best_mapping = None
+        best_score = None
+        stop_reason = 'nonexistent solution'
+        trials = 0
+        try:
+            for mapping in matcher.subgraph_monomorphisms_iter():
+                trials += 1
+                mapping = {virtual: physical for physical, virtual in mapping.items()}
+                if self.backend_prop is None:
+                    best_mapping = mapping
+                    break
+                score = self._score(mapping, interactions, cx_errors, readout_errors)
+                if best_score is None or score < best_score:
+                    best_mapping, best_score = mapping, score
+                if self.max_trials is not None and trials >= self.max_trials:
+                    break
+        except _LimitReached as limit:
+            stop_reason = limit.reason
+
+        if best_mapping is not None and len(qubits) <= len(self.coupling_map.physical_qubits):
+            stop_reason = 'solution found'
+            # Qubits without two-qubit gates go to the best remaining qubits.
+            free_physical = [physical for physical in coupling_graph.nodes
+                             if physical not in best_mapping.values()]
+            free_virtual = [virtual for virtual in range(len(qubits))
+                            if virtual not in best_mapping]
+            best_mapping.update(zip(free_virtual, free_physical))
+            self.property_set['layout'] = Layout({physical: qubits[virtual]
+                                                  for virtual, physical in best_mapping.items()})
+
+        self.property_set['VF2Layout_stop_reason'] = stop_reason
+
+    def _errors(self):
+        """Extract the cx and readout errors from the backend properties.
+
+        Returns:
+            tuple: dict of edge to cx error and dict of qubit to readout error.
+        """
+        return _backend_errors(self.backend_prop, symmetric=not self.strict_direction)
+
+    @staticmethod
+    def _score(mapping, interactions, cx_errors, readout_errors):
+        """Minus the logarithm of the estimated fidelity of a layout. Lower is better."""
+        score = 0.0
+        for (virtual_0, virtual_1), count in interactions.items():
+            error = cx_errors.get((mapping[virtual_0], mapping[virtual_1]), 0.0)
+            if error >= 1.0:
+                return math.inf
+            score -= count * math.log(1.0 - error)
+        for physical in mapping.values():
+            error = readout_errors.get(physical, 0.0)
+            if error >= 1.0:
+                return math.inf
+            score -= math.log(1.0 - error)
+        return score
@@ -17,9 +17,8 @@
 """Replace each block of consecutive gates by a single Unitary node."""
 
 
-from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.quantum_info.operators import Operator
+from qiskit.quantum_info.operators.operator import _stacked_unitaries
 from qiskit.quantum_info.synthesis import TwoQubitBasisDecomposer
 from qiskit.extensions import UnitaryGate
 from qiskit.circuit.library.standard_gates import CXGate
@@ -111,49 +110,46 @@ class ConsolidateBlocks(TransformationPass):
                 # so update the blocks list to include this block
                 blocks = blocks[:block_count] + [[node]] + blocks[block_count:]
 
-        # create the dag from the updated list of blocks
+        # find the qubits of the blocks to consolidate, and compute their unitaries at once,
+        # for the blocks of each number of qubits
         basis_gate_name = self.decomposer.gate.name
-        for block in blocks:
+        block_qargs = {}
+        block_circuits = {}
+        for index, block in enumerate(blocks):
             if len(block) == 1 and (block[0].name != basis_gate_name
                                     or block[0].op.is_parameterized()):
+                continue
+            qargs = set()
+            for nd in block:
+                qargs |= set(nd.qargs)
+            block_index_map = self._block_qargs_to_indices(qargs, global_index_map)
+            block_qargs[index] = sorted(qargs, key=lambda x: block_index_map[x])
+            block_circuits.setdefault(len(qargs), []).append(
+                (index, [(nd.op, [block_index_map[i] for i in nd.qargs]) for nd in block]))
+        block_unitaries = {}
+        for num_qubits, circuits in block_circuits.items():
+            unitaries = _stacked_unitaries([circuit for _, circuit in circuits], num_qubits)
+            for (index, _), unitary in zip(circuits, unitaries):
+                block_unitaries[index] = unitary
+
+        # create the dag from the updated list of blocks
+        for index, block in enumerate(blocks):
+            if index not in block_unitaries:
                 # an intermediate node that was added into the overall list
                 new_dag.apply_operation_back(block[0].op, block[0].qargs,
                                              block[0].cargs)
             else:
-                # find the qubits involved in this block
-                block_qargs = set()
-                block_cargs = set()
-                for nd in block:
-                    block_qargs |= set(nd.qargs)
-                    if nd.condition:
-                        block_cargs |= set(nd.condition[0])
-                # convert block to a sub-circuit, then simulate unitary and add
-                q = QuantumRegister(len(block_qargs))
-                # if condition in node, add clbits to circuit
-                if len(block_cargs) > 0:
-                    c = ClassicalRegister(len(block_cargs))
-                    subcirc = QuantumCircuit(q, c)
-                else:
-                    subcirc = QuantumCircuit(q)
-                block_index_map = self._block_qargs_to_indices(block_qargs,
-                                                               global_index_map)
-                basis_count = 0
-                for nd in block:
-                    if nd.op.name == basis_gate_name:
-                        basis_count += 1
-                    subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+                unitary = UnitaryGate(block_unitaries[index])
+                basis_count = sum(1 for nd in block if nd.op.name == basis_gate_name)
 
                 max_2q_depth = 20  # If depth > 20, there will be 1q gates to consolidate.
                 if (
                         self.force_consolidate
                         or unitary.num_qubits > 2
                         or self.decomposer.num_basis_gates(unitary) < basis_count
-                        or len(subcirc) > max_2q_depth
+                        or len(block) > max_2q_depth
                 ):
-                    new_dag.apply_operation_back(
-                        UnitaryGate(unitary),
-                        sorted(block_qargs, key=lambda x: block_index_map[x]))
+                    new_dag.apply_operation_back(unitary, block_qargs[index])
                 else:
                     for nd in block:
                         new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
@@ -67,39 +67,27 @@ class BasicSwap(TransformationPass):
         trivial_layout = Layout.generate_trivial_layout(canonical_register)
         current_layout = trivial_layout.copy()
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
-
-            for gate in subdag.two_qubit_ops():
-                physical_q0 = current_layout[gate.qargs[0]]
-                physical_q1 = current_layout[gate.qargs[1]]
+        for node in dag.topological_op_nodes():
+            if len(node.qargs) == 2 and node.name not in ['snapshot', 'barrier']:
+                physical_q0 = current_layout[node.qargs[0]]
+                physical_q1 = current_layout[node.qargs[1]]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    # Insert a new layer with the SWAP(s).
-                    swap_layer = DAGCircuit()
-                    swap_layer.add_qreg(canonical_register)
-
+                    # Insert the SWAP(s).
                     path = self.coupling_map.shortest_undirected_path(physical_q0, physical_q1)
                     for swap in range(len(path) - 2):
                         connected_wire_1 = path[swap]
                         connected_wire_2 = path[swap + 1]
 
-                        qubit_1 = current_layout[connected_wire_1]
-                        qubit_2 = current_layout[connected_wire_2]
-
                         # create the swap operation
-                        swap_layer.apply_operation_back(SwapGate(),
-                                                        qargs=[qubit_1, qubit_2],
-                                                        cargs=[])
+                        new_dag.apply_operation_back(SwapGate(),
+                                                     qargs=[canonical_register[connected_wire_1],
+                                                            canonical_register[connected_wire_2]],
+                                                     cargs=[])
 
-                    # layer insertion
-                    order = current_layout.reorder_bits(new_dag.qubits)
-                    new_dag.compose(swap_layer, qubits=order)
-
-                    # update current_layout
-                    for swap in range(len(path) - 2):
-                        current_layout.swap(path[swap], path[swap + 1])
+                        # update current_layout
+                        current_layout.swap(connected_wire_1, connected_wire_2)
 
-            order = current_layout.reorder_bits(new_dag.qubits)
-            new_dag.compose(subdag, qubits=order)
+            qargs = [canonical_register[current_layout[qubit]] for qubit in node.qargs]
+            new_dag.apply_operation_back(node.op.copy(), qargs=qargs, cargs=node.cargs)
 
         return new_dag
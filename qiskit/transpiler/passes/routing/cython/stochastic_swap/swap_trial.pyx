@@ -17,6 +17,7 @@
 
 cimport cython
 from libcpp.unordered_set cimport unordered_set as cset
+from libcpp.vector cimport vector
 from .utils cimport NLayout, EdgeCollection
 
 @cython.boundscheck(False)
@@ -42,6 +43,26 @@ cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
         cost += dist[ii,jj]
     return cost
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void swap_layout(vector[unsigned int] & l2p, vector[unsigned int] & p2l,
+                             unsigned int idx1, unsigned int idx2) nogil:
+    """ Swaps two physical indices of a layout held as C++ vectors.
+
+    Args:
+        l2p (vector): Logical to physical mapping.
+        p2l (vector): Physical to logical mapping.
+        idx1 (int): Physical index 1.
+        idx2 (int): Physical index 2.
+    """
+    cdef unsigned int temp1 = p2l[idx1]
+    cdef unsigned int temp2 = p2l[idx2]
+    p2l[idx1] = temp2
+    p2l[idx2] = temp1
+    l2p[temp2] = idx1
+    l2p[temp1] = idx2
+
+
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -67,108 +88,88 @@ cdef compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
-               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
-               int[::1] edges, double[:, ::1] scale, object rng):
-    """ A single iteration of the tchastic swap mapping routine.
+cdef unsigned int swap_trial_core(unsigned int num_qubits, vector[unsigned int] & l2p,
+                                  vector[unsigned int] & p2l,
+                                  cset[unsigned int] & input_qubit_set,
+                                  int[::1] gates, double[:, ::1] scale,
+                                  double[:, ::1] cdist, int[::1] edges,
+                                  vector[unsigned int] & opt_edges) nogil:
+    """ The GIL free body of a single stochastic swap trial.
+
+    The layout given by ``l2p`` and ``p2l`` is updated in place, and the
+    chosen swap edges are appended to ``opt_edges``.
 
     Args:
         num_qubits (int): The number of physical qubits.
-        int_layout (NLayout): The numeric (integer) representation of 
-                              the initial_layout.
-        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        l2p (vector): Logical to physical mapping of the trial layout.
+        p2l (vector): Physical to logical mapping of the trial layout.
+        input_qubit_set (cset): Set of qubits available for swapping.
         gates (ndarray): Int array with integers giving qubits on which
                          two-qubits gates act on.
-        cdist2 (ndarray): Array of doubles that gives the square of the 
-                          distance graph.
+        scale (ndarray): The randomly perturbed cdist2 array.
         cdist (ndarray): Array of doubles that gives the distance graph.
         edges (ndarray): Int array of edges in coupling map.
-        scale (ndarray): A double array that holds the perturbed cdist2 array.
-        rng (default_rng): An instance of the NumPy default_rng.
+        opt_edges (vector): Output vector of optimal edges.
 
     Returns:
-        double: Best distance achieved in this trial.
-        EdgeCollection: Collection of optimal edges found.
-        NLayout: The optimal layout found.
         int: The number of depth steps required in mapping.
     """
-    cdef EdgeCollection opt_edges = EdgeCollection()
-    cdef NLayout optimal_layout, new_layout, trial_layout = int_layout.copy()
-    
     cdef unsigned int num_gates = gates.shape[0]//2
     cdef unsigned int num_edges = edges.shape[0]//2
-    
-    cdef unsigned int need_copy, cost_reduced
+
+    cdef unsigned int cost_reduced
     cdef unsigned int depth_step = 1
     cdef unsigned int depth_max = 2 * num_qubits + 1
     cdef double min_cost, new_cost, dist
-    
+
     cdef unsigned int start_edge, end_edge, start_qubit, end_qubit
-    cdef unsigned int optimal_start, optimal_end, optimal_start_qubit, optimal_end_qubit
-    
+    cdef unsigned int optimal_start = 0, optimal_end = 0
+    cdef unsigned int optimal_start_qubit = 0, optimal_end_qubit = 0
+
     cdef size_t idx
-    
-    # Compute randomized distance
-    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
-                                             size=num_qubits*(num_qubits+1)//2)
-    
-    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
-    
-    # Convert int qubit array to c++ set
     cdef cset[unsigned int] qubit_set
-    cdef cset[unsigned int] input_qubit_set
-    
-    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
-        input_qubit_set.insert(int_qubit_subset[idx])
-    
+
     # Loop over depths from 1 up to a maximum depth
     while depth_step < depth_max:
         qubit_set = input_qubit_set
         # While there are still qubits available
         while not qubit_set.empty():
             # Compute the objective function
-            min_cost = compute_cost(scale, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+            min_cost = compute_cost(scale, &l2p[0], gates, num_gates)
             # Try to decrease objective function
             cost_reduced = 0
 
             # Loop over edges of coupling graph
-            need_copy = 1
             for idx in range(num_edges):
                 start_edge = edges[2*idx]
                 end_edge = edges[2*idx+1]
-                start_qubit = trial_layout.phys_to_logic[start_edge]
-                end_qubit =  trial_layout.phys_to_logic[end_edge]
+                start_qubit = p2l[start_edge]
+                end_qubit = p2l[end_edge]
                 # Are the qubits available?
-                if  qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
+                if qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
                     # Try this edge to reduce the cost
-                    if need_copy:
-                        new_layout = trial_layout.copy()
-                        need_copy = 0
-                    new_layout.swap(start_edge, end_edge)
+                    swap_layout(l2p, p2l, start_edge, end_edge)
                     # Compute the objective function
-                    new_cost = compute_cost(scale, new_layout.logic_to_phys,
-                                   gates, num_gates)
+                    new_cost = compute_cost(scale, &l2p[0], gates, num_gates)
                     # Record progress if we succeed
                     if new_cost < min_cost:
-                        cost_reduced = True
+                        cost_reduced = 1
                         min_cost = new_cost
-                        optimal_layout = new_layout
                         optimal_start = start_edge
                         optimal_end = end_edge
                         optimal_start_qubit = start_qubit
                         optimal_end_qubit = end_qubit
-                        need_copy = 1
-                    else:
-                        new_layout.swap(start_edge, end_edge)
+                    # Candidates are always tried against the current layout
+                    swap_layout(l2p, p2l, start_edge, end_edge)
 
             # After going over all edges
             # Were there any good swap choices?
             if cost_reduced:
                 qubit_set.erase(optimal_start_qubit)
                 qubit_set.erase(optimal_end_qubit)
-                trial_layout = optimal_layout
-                opt_edges.add(optimal_start, optimal_end)
+                swap_layout(l2p, p2l, optimal_start, optimal_end)
+                opt_edges.push_back(optimal_start)
+                opt_edges.push_back(optimal_end)
             else:
                 break
 
@@ -176,8 +177,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # failed to improve the cost.
 
         # Compute the coupling graph distance
-        dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+        dist = compute_cost(cdist, &l2p[0], gates, num_gates)
         # If all gates can be applied now, we are finished.
         # Otherwise we need to consider a deeper swap circuit
         if dist == num_gates:
@@ -186,8 +186,80 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # Increment the depth
         depth_step += 1
 
-    # Either we have succeeded at some depth d < dmax or failed
-    dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
-    
+    return depth_step
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
+               int[::1] edges, double[:, ::1] scale, object rng):
+    """ A single iteration of the tchastic swap mapping routine.
+
+    The random perturbation is drawn from ``rng`` while holding the GIL,
+    the search itself runs with the GIL released so that independent
+    trials can be evaluated concurrently from several threads, provided
+    each thread passes its own ``scale`` array.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        scale (ndarray): A double array that holds the perturbed cdist2 array.
+        rng (default_rng): An instance of the NumPy default_rng.
+
+    Returns:
+        double: Best distance achieved in this trial.
+        EdgeCollection: Collection of optimal edges found.
+        NLayout: The optimal layout found.
+        int: The number of depth steps required in mapping.
+    """
+    cdef EdgeCollection opt_edges = EdgeCollection()
+    cdef NLayout trial_layout = NLayout(int_layout.l2p_len, int_layout.p2l_len)
+
+    cdef unsigned int num_gates = gates.shape[0]//2
+    cdef unsigned int depth_step
+    cdef double dist
+    cdef size_t idx
+
+    # Compute randomized distance
+    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
+                                             size=num_qubits*(num_qubits+1)//2)
+
+    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
+
+    # Work on C++ copies of the layout so that no Python objects are
+    # touched while the GIL is released.
+    cdef vector[unsigned int] l2p, p2l
+    l2p.resize(int_layout.l2p_len)
+    p2l.resize(int_layout.p2l_len)
+    for idx in range(int_layout.l2p_len):
+        l2p[idx] = int_layout.logic_to_phys[idx]
+    for idx in range(int_layout.p2l_len):
+        p2l[idx] = int_layout.phys_to_logic[idx]
+
+    # Convert int qubit array to c++ set
+    cdef cset[unsigned int] input_qubit_set
+    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
+        input_qubit_set.insert(int_qubit_subset[idx])
+
+    with nogil:
+        depth_step = swap_trial_core(num_qubits, l2p, p2l, input_qubit_set,
+                                     gates, scale, cdist, edges, opt_edges._edges)
+        # Either we have succeeded at some depth d < dmax or failed
+        dist = compute_cost(cdist, &l2p[0], gates, num_gates)
+
+    for idx in range(int_layout.l2p_len):
+        trial_layout.logic_to_phys[idx] = l2p[idx]
+    for idx in range(int_layout.p2l_len):
+        trial_layout.phys_to_logic[idx] = p2l[idx]
+
     return dist, opt_edges, trial_layout, depth_step
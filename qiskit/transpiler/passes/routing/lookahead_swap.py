@@ -101,7 +101,7 @@ class LookaheadSwap(TransformationPass):
         current_layout = trivial_layout.copy()
 
         mapped_gates = []
-        ordered_virtual_gates = list(dag.serial_layers())
+        ordered_virtual_gates = list(dag.serial_op_node_layers())
         gates_remaining = ordered_virtual_gates.copy()
 
         while gates_remaining:
@@ -131,7 +131,8 @@ class LookaheadSwap(TransformationPass):
         mapped_dag = _copy_circuit_metadata(dag, self.coupling_map)
 
         for node in mapped_gates:
-            mapped_dag.apply_operation_back(op=node.op, qargs=node.qargs, cargs=node.cargs)
+            mapped_dag.apply_operation_back(op=node.op.copy(), qargs=node.qargs,
+                                            cargs=node.cargs)
 
         return mapped_dag
 
@@ -249,7 +250,7 @@ def _map_free_gates(layout, gates, coupling_map):
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
         if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+            qubits = gate['nodes'][0].qargs
 
             if not qubits:
                 continue
@@ -319,7 +320,7 @@ def _copy_circuit_metadata(source_dag, coupling_map):
 
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate['nodes'][0])
 
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
     mapped_qargs = [device_qreg[layout[a]] for a in mapped_op_node.qargs]
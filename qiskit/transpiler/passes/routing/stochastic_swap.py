@@ -17,6 +17,7 @@
 from logging import getLogger
 from math import inf
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from qiskit.circuit.quantumregister import QuantumRegister
@@ -49,7 +50,7 @@ class StochasticSwap(TransformationPass):
            the circuit.
     """
 
-    def __init__(self, coupling_map, trials=20, seed=None):
+    def __init__(self, coupling_map, trials=20, seed=None, num_threads=None):
         """StochasticSwap initializer.
 
         The coupling map is a connected graph
@@ -61,11 +62,17 @@ class StochasticSwap(TransformationPass):
                 map.
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_threads (int): number of threads used to run the trials of
+                a layer concurrently. If ``None`` or ``1`` the trials are run
+                serially from a single random stream. Otherwise each trial
+                is seeded independently from ``seed``, so the output depends
+                only on the seed and not on the number of threads.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.trials = trials
         self.seed = seed
+        self.num_threads = num_threads
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
@@ -189,27 +196,32 @@ class StochasticSwap(TransformationPass):
 
         edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
         cdist = coupling._dist_matrix
-        for trial in range(trials):
-            logger.debug("layer_permutation: trial %s", trial)
-            # This is one Trial --------------------------------------
-            dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
-                                                                     int_qubit_subset,
-                                                                     int_gates, cdist2,
-                                                                     cdist, edges, scale,
-                                                                     self.rng)
-
-            logger.debug("layer_permutation: final distance for this trial = %s", dist)
-            if dist == len(gates) and depth_step < best_depth:
-                logger.debug("layer_permutation: got circuit with improved depth %s",
-                             depth_step)
-                best_edges = optim_edges
-                best_layout = trial_layout
-                best_depth = min(best_depth, depth_step)
-
-            # Break out of trial loop if we found a depth 1 circuit
-            # since we can't improve it further
-            if best_depth == 1:
-                break
+        if self.num_threads is not None and self.num_threads > 1:
+            best_depth, best_edges, best_layout = self._parallel_trials(
+                num_qubits, int_layout, int_qubit_subset, int_gates, cdist2,
+                cdist, edges, len(gates), trials)
+        else:
+            for trial in range(trials):
+                logger.debug("layer_permutation: trial %s", trial)
+                # This is one Trial --------------------------------------
+                dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
+                                                                         int_qubit_subset,
+                                                                         int_gates, cdist2,
+                                                                         cdist, edges, scale,
+                                                                         self.rng)
+
+                logger.debug("layer_permutation: final distance for this trial = %s", dist)
+                if dist == len(gates) and depth_step < best_depth:
+                    logger.debug("layer_permutation: got circuit with improved depth %s",
+                                 depth_step)
+                    best_edges = optim_edges
+                    best_layout = trial_layout
+                    best_depth = min(best_depth, depth_step)
+
+                # Break out of trial loop if we found a depth 1 circuit
+                # since we can't improve it further
+                if best_depth == 1:
+                    break
 
         # If we have no best circuit for this layer, all of the
         # trials have failed
@@ -229,46 +241,91 @@ class StochasticSwap(TransformationPass):
         best_lay = best_layout.to_layout(qregs)
         return True, best_circuit, best_depth, best_lay
 
-    def _layer_update(self, i, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _parallel_trials(self, num_qubits, int_layout, int_qubit_subset,
+                         int_gates, cdist2, cdist, edges, num_gates, trials):
+        """Run the randomized trials of a layer on a pool of threads.
+
+        Every trial gets its own seed drawn up front from ``self.rng`` and its
+        own scaling matrix, and the trials are evaluated in batches of
+        ``self.num_threads``. The winner is the lowest numbered trial with the
+        smallest depth, and a batch containing a depth 1 solution ends the
+        search, which makes the result independent of the number of threads.
+
+        Args:
+            num_qubits (int): number of physical qubits.
+            int_layout (NLayout): numeric form of the current layout.
+            int_qubit_subset (ndarray): qubits available for swapping.
+            int_gates (ndarray): flattened two-qubit gates of the layer.
+            cdist2 (ndarray): squared distance matrix of the coupling map.
+            cdist (ndarray): distance matrix of the coupling map.
+            edges (ndarray): flattened edges of the coupling map.
+            num_gates (int): number of two-qubit gates in the layer.
+            trials (int): number of trials to run.
+
+        Returns:
+            Tuple: best_depth, best_edges, best_layout
+        """
+        trial_seeds = self.rng.integers(np.iinfo(np.int64).max, size=trials)
+
+        def _run_trial(trial):
+            logger.debug("layer_permutation: trial %s", trial)
+            scale = np.zeros((num_qubits, num_qubits))
+            return swap_trial(num_qubits, int_layout, int_qubit_subset, int_gates,
+                              cdist2, cdist, edges, scale,
+                              np.random.default_rng(trial_seeds[trial]))
+
+        best_depth = inf
+        best_edges = None
+        best_layout = None
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            for batch_start in range(0, trials, self.num_threads):
+                batch = range(batch_start, min(batch_start + self.num_threads, trials))
+                for dist, optim_edges, trial_layout, depth_step in \
+                        executor.map(_run_trial, batch):
+                    logger.debug("layer_permutation: final distance for this trial = %s",
+                                 dist)
+                    if dist == num_gates and depth_step < best_depth:
+                        logger.debug("layer_permutation: got circuit with improved depth %s",
+                                     depth_step)
+                        best_edges = optim_edges
+                        best_layout = trial_layout
+                        best_depth = depth_step
+                if best_depth == 1:
+                    break
+        return best_depth, best_edges, best_layout
+
+    def _layer_update(self, dagcircuit_output, layer, best_layout, best_depth,
+                      best_circuit):
+        """Append a mapped layer to the output DAGCircuit.
 
         Args:
-            i (int): layer number
+            dagcircuit_output (DAGCircuit): the output DAGCircuit that the
+                _mapper method is building.
+            layer (dict): the layer to map, as returned by the
+                DAGCircuit op_node_layers() method
             best_layout (Layout): layout returned from _layer_permutation
             best_depth (int): depth returned from _layer_permutation
             best_circuit (DAGCircuit): swap circuit returned from _layer_permutation
-            layer_list (list): list of DAGCircuit objects for each layer,
-                output of DAGCircuit layers() method
-
-        Returns:
-            DAGCircuit: a DAGCircuit object to append to the output DAGCircuit
-                that the _mapper method is building.
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", layout)
         logger.debug("layer_update: self.trivial_layout = %s", self.trivial_layout)
-        dagcircuit_output = DAGCircuit()
-        for qubit in layout.get_virtual_bits().keys():
-            if qubit.register not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(qubit.register)
 
         # Output any swaps
         if best_depth > 0:
             logger.debug("layer_update: there are swaps in this layer, "
                          "depth %d", best_depth)
-            dagcircuit_output.compose(best_circuit)
+            # the swap gates of best_circuit are built for this layer only, so
+            # they are moved to the output without copying them
+            for node in best_circuit.topological_op_nodes():
+                dagcircuit_output.apply_operation_back(node.op, node.qargs, node.cargs)
         else:
             logger.debug("layer_update: there are no swaps in this layer")
-        # Output this layer
-        layer_circuit = layer_list[i]["graph"]
-        for creg in layer_circuit.cregs.values():
-            dagcircuit_output.add_creg(creg)
-
-        order = layout.reorder_bits(dagcircuit_output.qubits)
-        dagcircuit_output.compose(layer_circuit, qubits=order)
 
-        return dagcircuit_output
+        # Output this layer
+        for node in layer["nodes"]:
+            qargs = [self.trivial_layout[layout[qubit]] for qubit in node.qargs]
+            dagcircuit_output.apply_operation_back(node.op.copy(), qargs, node.cargs)
 
     def _mapper(self, circuit_graph, coupling_graph, trials=20):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
@@ -288,8 +345,8 @@ class StochasticSwap(TransformationPass):
             TranspilerError: if there was any error during the mapping
                 or with the parameters.
         """
-        # Schedule the input circuit by calling layers()
-        layerlist = list(circuit_graph.layers())
+        # Schedule the input circuit by calling op_node_layers()
+        layerlist = list(circuit_graph.op_node_layers())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
             logger.debug("    %d: %s", i, v["partition"])
@@ -326,7 +383,7 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(circuit_graph.serial_op_node_layers(layer["nodes"]))
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
@@ -350,24 +407,22 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.compose(
-                        self._layer_update(j,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist))
+                    self._layer_update(dagcircuit_output,
+                                       serial_layer,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit)
 
             else:
                 # Update the record of qubit positions for each iteration
                 layout = best_layout
 
                 # Update the DAG
-                dagcircuit_output.compose(
-                    self._layer_update(i,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist))
+                self._layer_update(dagcircuit_output,
+                                   layer,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit)
 
         # This is the final edgemap. We might use it to correctly replace
         # any measurements that needed to be removed earlier.
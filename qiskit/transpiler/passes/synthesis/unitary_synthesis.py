@@ -96,7 +96,17 @@ class UnitarySynthesis(TransformationPass):
         if kak_gate is not None:
             decomposer2q = TwoQubitBasisDecomposer(kak_gate, euler_basis=euler_basis)
 
-        for node in dag.named_nodes('unitary'):
+        nodes = dag.named_nodes('unitary')
+
+        # Decompose all the two-qubit unitaries together, so that repeated
+        # blocks are synthesized once.
+        synth_circuits_2q = []
+        if decomposer2q is not None:
+            synth_circuits_2q = decomposer2q.decompose_many(
+                [node.op.to_matrix() for node in nodes if len(node.qargs) == 2])
+        synth_circuits_2q = iter(synth_circuits_2q)
+
+        for node in nodes:
 
             synth_dag = None
             if len(node.qargs) == 1:
@@ -106,7 +116,7 @@ class UnitarySynthesis(TransformationPass):
             elif len(node.qargs) == 2:
                 if decomposer2q is None:
                     continue
-                synth_dag = circuit_to_dag(decomposer2q(node.op.to_matrix()))
+                synth_dag = circuit_to_dag(next(synth_circuits_2q))
             else:
                 synth_dag = circuit_to_dag(
                     isometry.Isometry(node.op.to_matrix(), 0, 0).definition)
@@ -31,6 +31,7 @@ class UserConfig:
     [default]
     circuit_drawer = mpl
     circuit_mpl_style = default
+    qobj_validation = full
 
     """
     def __init__(self, filename=None):
@@ -88,6 +89,17 @@ class UserConfig:
                         "0, 1, 2, or 3.")
                 self.settings['transpile_optimization_level'] = (
                     transpile_optimization_level)
+            # Parse qobj_validation
+            qobj_validation = self.config_parser.get('default',
+                                                     'qobj_validation',
+                                                     fallback=None)
+            if qobj_validation:
+                if qobj_validation not in ['full', 'structure', 'none']:
+                    raise exceptions.QiskitUserConfigError(
+                        "%s is not a valid qobj validation mode. Must be "
+                        "either 'full', 'structure' or 'none'"
+                        % qobj_validation)
+                self.settings['qobj_validation'] = qobj_validation
             # Parse package warnings
             package_warnings = self.config_parser.getboolean(
                 'default', 'suppress_packaging_warnings', fallback=False)
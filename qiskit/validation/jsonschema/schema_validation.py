@@ -17,7 +17,6 @@
 import json
 import os
 import logging
-import jsonschema
 
 from .exceptions import SchemaValidationError, _SummaryValidationError
 
@@ -80,7 +79,10 @@ def _get_validator(name, schema=None, check_schema=True,
     Raises:
         SchemaValidationError: Raised if validation fails.
     """
+    import jsonschema
+
     if schema is None:
+        _load_default_schema(name)
         try:
             schema = _SCHEMAS[name]
         except KeyError:
@@ -101,18 +103,24 @@ def _get_validator(name, schema=None, check_schema=True,
     return validator
 
 
+def _load_default_schema(name):
+    """Load the default schema ``name`` into `_SCHEMAS`, if there is one.
+
+    The default schemas are loaded on first use rather than on import, as
+    loading them and importing jsonschema is slow.
+    """
+    if name not in _SCHEMAS and name in _DEFAULT_SCHEMA_PATHS:
+        schema_base_path = os.path.join(os.path.dirname(__file__), '../..')
+        _load_schema(os.path.join(schema_base_path, _DEFAULT_SCHEMA_PATHS[name]), name)
+
+
 def _load_schemas_and_validators():
     """Load all default schemas into `_SCHEMAS`."""
-    schema_base_path = os.path.join(os.path.dirname(__file__), '../..')
-    for name, path in _DEFAULT_SCHEMA_PATHS.items():
-        _load_schema(os.path.join(schema_base_path, path), name)
+    for name in _DEFAULT_SCHEMA_PATHS:
+        _load_default_schema(name)
         _get_validator(name)
 
 
-# Load all schemas on import
-_load_schemas_and_validators()
-
-
 def validate_json_against_schema(json_dict, schema,
                                  err_msg=None):
     """Validates JSON dict against a schema.
@@ -131,10 +139,12 @@ def validate_json_against_schema(json_dict, schema,
         SchemaValidationError: Raised if validation fails.
     """
 
+    import jsonschema
+
     if isinstance(schema, str):
         schema_name = schema
-        schema = _SCHEMAS[schema_name]
         validator = _get_validator(schema_name)
+        schema = _SCHEMAS[schema_name]
         errors = list(validator.iter_errors(json_dict))
         if errors:
             best_match_error = jsonschema.exceptions.best_match(errors)
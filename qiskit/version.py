@@ -18,7 +18,8 @@
 
 import os
 import subprocess
-import pkg_resources
+import sys
+import types
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -84,6 +85,8 @@ __version__ = get_version_info()
 
 
 def _get_qiskit_versions():
+    import pkg_resources
+
     out_dict = {}
     out_dict['qiskit-terra'] = __version__
     try:
@@ -114,4 +117,24 @@ def _get_qiskit_versions():
     return out_dict
 
 
-__qiskit_version__ = _get_qiskit_versions()
+class _VersionModule(types.ModuleType):
+    """This module, with ``__qiskit_version__`` computed on first access.
+
+    Collecting the versions imports the other Qiskit packages and
+    pkg_resources, which ``import qiskit`` should not pay for.
+    """
+
+    def __getattr__(self, name):
+        if name == '__qiskit_version__':
+            value = _get_qiskit_versions()
+            setattr(self, name, value)
+            return value
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+
+# Declared for static analysis only: the name is removed again so that the
+# first access goes through _VersionModule.__getattr__, which replaces it.
+__qiskit_version__ = {}
+del __qiskit_version__
+
+sys.modules[__name__].__class__ = _VersionModule
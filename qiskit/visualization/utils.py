@@ -126,16 +126,6 @@ def _get_layered_instructions(circuit, reverse_bits=False,
     return qregs, cregs, ops
 
 
-def _sorted_nodes(dag_layer):
-    """Convert DAG layer into list of nodes sorted by node_id
-    qiskit-terra #2802
-    """
-    dag_instructions = dag_layer['graph'].op_nodes()
-    # sort into the order they were input
-    dag_instructions.sort(key=lambda nd: nd._node_id)
-    return dag_instructions
-
-
 def _get_gate_span(qregs, instruction):
     """Get the list of qubits drawing this gate would cover
     qiskit-terra #2802
@@ -180,25 +170,22 @@ class _LayerSpooler(list):
 
         if self.justification == 'left':
 
-            for dag_layer in dag.layers():
+            for dag_layer in dag.op_node_layers():
                 current_index = len(self) - 1
-                dag_nodes = _sorted_nodes(dag_layer)
-                for node in dag_nodes:
+                # op_node_layers() keeps the nodes in the order they were input
+                # (qiskit-terra #2802)
+                for node in dag_layer['nodes']:
                     self.add(node, current_index)
 
         else:
-            dag_layers = []
-
-            for dag_layer in dag.layers():
-                dag_layers.append(dag_layer)
+            dag_layers = list(dag.op_node_layers())
 
             # going right to left!
             dag_layers.reverse()
 
             for dag_layer in dag_layers:
                 current_index = 0
-                dag_nodes = _sorted_nodes(dag_layer)
-                for node in dag_nodes:
+                for node in dag_layer['nodes']:
                     self.add(node, current_index)
 
     def is_found_in(self, node, nodes):
@@ -18,11 +18,13 @@ import unittest
 import io
 from logging import StreamHandler, getLogger
 import sys
+from unittest.mock import patch
 
 import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
 from qiskit.compiler import transpile, assemble
 from qiskit.providers.basicaer import QasmSimulatorPy
 from qiskit.test import Path
@@ -290,6 +292,54 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_lazy_parameter_binds(self):
+        """Test a qobj with a parameter binds table runs every bind"""
+        theta = Parameter('theta')
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.u3(theta, 0, 0, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr, cr)
+        binds = [{theta: 0}, {theta: np.pi}, {theta: np.pi / 2}]
+
+        expanded = assemble(circuit, parameter_binds=binds, shots=1000,
+                            seed_simulator=self.seed)
+        lazy = assemble(circuit, parameter_binds=binds, shots=1000,
+                        seed_simulator=self.seed, lazy_parameter_binds=True)
+        expanded_counts = self.backend.run(expanded).result().get_counts()
+        lazy_result = self.backend.run(lazy).result()
+
+        self.assertEqual(len(lazy_result.results), 3)
+        self.assertEqual(lazy_result.get_counts(), expanded_counts)
+        self.assertEqual(lazy_result.get_counts(0), {'00': 1000})
+        self.assertEqual(lazy_result.get_counts(1), {'11': 1000})
+
+    def test_iter_results(self):
+        """Test that iter_results runs the experiments as they are consumed"""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuits = []
+        for index in range(3):
+            circuit = QuantumCircuit(qr, cr, name='circuit%d' % index)
+            if index:
+                circuit.u3(np.pi, 0, 0, qr[index - 1])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        qobj = assemble(circuits, shots=100, seed_simulator=self.seed)
+
+        with patch.object(self.backend, 'run_experiment',
+                          wraps=self.backend.run_experiment) as run_experiment:
+            results = self.backend.iter_results(qobj)
+            first = next(results)
+            self.assertEqual(run_experiment.call_count, 1)
+            self.assertEqual(first.header.name, 'circuit0')
+            self.assertEqual(first.data.counts, {'0x0': 100})
+            rest = list(results)
+            self.assertEqual(run_experiment.call_count, 3)
+        self.assertEqual([result.data.counts for result in rest],
+                         [{'0x1': 100}, {'0x2': 100}])
+
 
 if __name__ == '__main__':
     unittest.main()
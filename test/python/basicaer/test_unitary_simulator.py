@@ -20,6 +20,9 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import U3Gate
+from qiskit.compiler import assemble
 from qiskit.providers.basicaer import UnitarySimulatorPy
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.test import ReferenceCircuits
@@ -119,6 +122,21 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_lazy_parameter_binds(self):
+        """Test the unitary simulator expands a parameter binds table"""
+        theta = Parameter('theta')
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(theta, 0.1, 0.2, qr[0])
+        angles = [0, 0.3, 1.2]
+        qobj = assemble(circuit, parameter_binds=[{theta: angle} for angle in angles],
+                        lazy_parameter_binds=True)
+        result = self.backend.run(qobj).result()
+        for index, angle in enumerate(angles):
+            expected = U3Gate(angle, 0.1, 0.2).to_matrix()
+            self.assertTrue(matrix_equal(result.get_unitary(index), expected,
+                                         ignore_phase=True))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -440,3 +440,82 @@ class LoadFromQasmTest(QiskitTestCase):
         expected_result = Unroller(basis).run(expected_dag)
 
         self.assertEqual(circuit_result, expected_result)
+
+
+class TestQasmReader(QiskitTestCase):
+    """Test the fast reader of OpenQASM 2 programs against the full parser."""
+
+    def assertSameAsParser(self, qasm_str):
+        """Check the reader supports the program and gives the parser's circuit."""
+        from qiskit.qasm import Qasm
+        from qiskit.qasm.qasmreader import read_circuit
+        from qiskit.converters import ast_to_dag, dag_to_circuit
+        circuit = read_circuit(qasm_str)
+        self.assertIsNotNone(circuit)
+        expected = dag_to_circuit(ast_to_dag(Qasm(data=qasm_str).parse()))
+        self.assertEqual(circuit, expected)
+        self.assertEqual(circuit.qregs, expected.qregs)
+        self.assertEqual(circuit.cregs, expected.cregs)
+
+    def test_qasm_files(self):
+        """Test the reader on the example files."""
+        for path in [self._get_resource_path('all_gates.qasm', Path.QASMS),
+                     self._get_resource_path('example_if.qasm', Path.QASMS),
+                     self._get_resource_path('random_n5_d5.qasm', Path.QASMS),
+                     self._get_resource_path('qasm/entangled_registers.qasm', Path.EXAMPLES)]:
+            with self.subTest(path=path), open(path) as qasm_file:
+                self.assertSameAsParser(qasm_file.read())
+
+    def test_broadcast_and_conditions(self):
+        """Test broadcasting over registers and conditional operations."""
+        self.assertSameAsParser('OPENQASM 2.0;\ninclude "qelib1.inc";\n'
+                                'qreg q[3];\nqreg r[3];\ncreg c[3];\n'
+                                'h q;\ncx q, r;\ncx q[0], r;\nccx q[0], r, q[1];\n'
+                                'barrier q[0], r;\nmeasure q -> c;\n'
+                                'if (c == 5) u2(0, pi) r;\nif(c==0) reset q;\n')
+
+    def test_parameter_expressions(self):
+        """Test the evaluation of parameter expressions."""
+        self.assertSameAsParser('OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\n'
+                                'u3(-pi/2, 2^3^0.5 - .5e-1, -(1+2)*3) q[0];\n'
+                                'rz(sin(pi/4) + cos(0.)*exp(1) - ln(2)/sqrt(2)) q[0];\n'
+                                'u1(tan(1) + asin(1.) - acos(0.5) * atan(2)) q[0];\n')
+
+    def test_unsupported_programs(self):
+        """Test the reader gives up on custom gates and invalid programs."""
+        from qiskit.qasm.qasmreader import read_circuit
+        header = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\n'
+        for body in ['gate my_gate a { x a; }\nmy_gate q[0];',
+                     'opaque my_gate a;',
+                     'U(0, 0, 0) q[0];',
+                     'cx q[0], q[0];',
+                     'x q[2];',
+                     'rx(theta) q[0];',
+                     'x(0.1) q[0];',
+                     'qreg q[1];',
+                     'creg c[1];\nmeasure q -> c;',
+                     'x q[0]']:
+            with self.subTest(body=body):
+                self.assertIsNone(read_circuit(header + body))
+        self.assertIsNone(read_circuit('OPENQASM 2.0;\nqreg q[1];\nx q[0];'))
+        self.assertIsNone(read_circuit(''))
+
+    def test_instruction_order(self):
+        """Test from_qasm_str orders instructions the same way with and without gate
+        definitions."""
+        body = ('qreg q[2];\ncreg c[2];\nh q[1];\nx q[0];\nmeasure q[1] -> c[1];\n'
+                'cx q[1], q[0];\ny q[1];\nz q[0];\n')
+        header = 'OPENQASM 2.0;\ninclude "qelib1.inc";\n'
+        circuit = QuantumCircuit.from_qasm_str(header + body)
+        with_gate = QuantumCircuit.from_qasm_str(header + 'gate my_gate a { x a; }\n' + body)
+        self.assertEqual([instr.name for instr, _, _ in circuit.data],
+                         ['x', 'h', 'measure', 'cx', 'z', 'y'])
+        self.assertEqual(circuit.data, with_gate.data)
+        self.assertEqual(circuit.qasm(), with_gate.qasm())
+
+    def test_custom_gates_use_parser(self):
+        """Test from_qasm_str still supports programs the reader gives up on."""
+        circuit = QuantumCircuit.from_qasm_str('OPENQASM 2.0;\ninclude "qelib1.inc";\n'
+                                               'gate my_gate a { x a; }\nqreg q[1];\n'
+                                               'my_gate q[0];\n')
+        self.assertEqual(circuit.data[0][0].name, 'my_gate')
@@ -192,6 +192,56 @@ class TestCircuitOperations(QiskitTestCase):
         self.assertEqual(len(qc.cregs), 1)
         self.assertEqual(len(copied.cregs), 2)
 
+    def test_copy_does_not_share_instructions(self):
+        """Test in place changes to instructions do not leak between copies."""
+        theta = Parameter('θ')
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        qc = QuantumCircuit(qr, cr)
+        qc.rx(theta, 0)
+        qc.x(0)
+        copied = qc.copy()
+        composed = qc.compose(qc)
+
+        qc.data[1][0].c_if(cr, 1)
+        copied.data[0][0].params[0] = 5
+        copied.data[1][1].append(qr[0])
+
+        self.assertIsNone(copied.data[1][0].condition)
+        self.assertIsNone(composed.data[1][0].condition)
+        self.assertIsNone(composed.data[3][0].condition)
+        self.assertEqual(qc.data[0][0].params, [theta])
+        self.assertEqual(qc.data[1][1], [qr[0]])
+
+    def test_binding_does_not_leak_through_shared_instructions(self):
+        """Test binding a circuit sharing instructions does not modify the others."""
+        theta = Parameter('θ')
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.rx(theta, 0)
+        combined = qc.combine(qc)
+        extended = QuantumCircuit(1).extend(qc)
+        self.assertIs(combined.data[0][0], qc.data[0][0])
+
+        combined.assign_parameters({theta: 1}, inplace=True)
+        bound = extended.bind_parameters({theta: 2})
+        extended.assign_parameters({theta: 3}, inplace=True)
+
+        self.assertEqual(qc.data[1][0].params, [theta])
+        self.assertEqual(qc.parameters, {theta})
+        self.assertEqual(float(combined.data[3][0].params[0]), 1)
+        self.assertEqual(float(bound.data[1][0].params[0]), 2)
+        self.assertEqual(float(extended.data[1][0].params[0]), 3)
+
+    def test_to_instruction_keeps_conditions(self):
+        """Test converting a circuit to an instruction does not change its conditions."""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1, 'cr')
+        qc = QuantumCircuit(qr, cr)
+        qc.x(0).c_if(cr, 1)
+        qc.to_instruction()
+        self.assertIs(qc.data[0][0].condition[0], cr)
+
     def test_measure_active(self):
         """Test measure_active
         Applies measurements only to non-idle qubits. Creates a ClassicalRegister of size equal to
@@ -596,3 +646,46 @@ class TestCircuitBuilding(QiskitTestCase):
     def test_append_dimension_mismatch(self):
         """Test appending to incompatible wires.
         """
+
+
+class TestAppendMany(QiskitTestCase):
+    """QuantumCircuit.append_many tests."""
+
+    def test_same_as_append(self):
+        """Test append_many builds the same circuit as append."""
+        qr = QuantumRegister(3, 'q')
+        cr = ClassicalRegister(2, 'c')
+        theta = Parameter('θ')
+        expected = QuantumCircuit(qr, cr)
+        expected.h(0)
+        expected.cx(0, 2)
+        expected.rz(theta, 1)
+        expected.measure(2, 1)
+
+        for validate in (True, False):
+            with self.subTest(validate=validate):
+                circuit = QuantumCircuit(qr, cr)
+                circuit.append_many([(expected.data[0][0], [0]),
+                                     (expected.data[1][0], [qr[0], -1]),
+                                     (expected.data[2][0], (1,)),
+                                     (expected.data[3][0], [2], [cr[1]])],
+                                    validate=validate)
+                self.assertEqual(circuit, expected)
+                self.assertEqual(circuit.parameters, {theta})
+
+    def test_invalid_batch(self):
+        """Test an invalid instruction raises and leaves the circuit unchanged."""
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.x(0)
+        other = QuantumRegister(1, 'other')
+        for invalid in [(SGate(), [2]),
+                        (SGate(), [0, 1]),
+                        (SGate(), [other[0]]),
+                        (SGate(), [0.5]),
+                        (Gate('g', 2, []), [1, -1]),
+                        (QuantumCircuit(1), [0])]:
+            with self.subTest(invalid=invalid):
+                with self.assertRaises(CircuitError):
+                    circuit.append_many([(SGate(), [1]), invalid])
+                self.assertEqual(len(circuit), 1)
@@ -617,5 +617,95 @@ class TestCircuitProperties(QiskitTestCase):
         self.assertEqual(circ.num_qubits, 18)
 
 
+class TestTrackedCircuitMetrics(QiskitTestCase):
+    """Test the metrics of circuits tracking them match the untracked ones."""
+
+    def assertSameMetrics(self, tracked):
+        """Check the tracked metrics against a full scan of the instructions."""
+        untracked = tracked.copy()
+        untracked.track_metrics(False)
+        for method in ['size', 'depth', 'count_ops', 'num_nonlocal_gates',
+                       'num_connected_components', 'num_unitary_factors']:
+            with self.subTest(method=method):
+                self.assertEqual(getattr(tracked, method)(), getattr(untracked, method)())
+        self.assertEqual(list(tracked.count_ops()), list(untracked.count_ops()))
+
+    def test_random_circuits(self):
+        """Test the metrics of random circuits, checked as they are built."""
+        from qiskit.circuit.random import random_circuit
+        for seed in range(20):
+            reference = random_circuit(4, 5, max_operands=3, measure=True,
+                                       conditional=True, seed=seed)
+            circuit = QuantumCircuit(*reference.qregs, *reference.cregs)
+            circuit.track_metrics()
+            for index, (instruction, qargs, cargs) in enumerate(reference.data):
+                circuit.append(instruction, qargs, cargs)
+                if index % 4 == 0:
+                    circuit.barrier()
+                    self.assertSameMetrics(circuit)
+            self.assertSameMetrics(circuit)
+
+    def test_condition_on_joined_register(self):
+        """Test conditions on a register whose bits are already connected."""
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.track_metrics()
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[2]).c_if(cr, 1)
+        circuit.x(qr[2]).c_if(cr, 2)
+        self.assertEqual(circuit.num_connected_components(), 2)
+        self.assertSameMetrics(circuit)
+
+    def test_modified_data(self):
+        """Test the metrics are recomputed after the data is modified in place."""
+        from qiskit.circuit.library import HGate
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.track_metrics()
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.h(2)
+        self.assertEqual(circuit.depth(), 3)
+        del circuit.data[1]
+        self.assertEqual(circuit.depth(), 1)
+        self.assertEqual(circuit.num_connected_components(), 2)
+        circuit.data[0] = (HGate(), [qr[0]], [])
+        self.assertEqual(circuit.num_nonlocal_gates(), 0)
+        circuit.data.insert(0, (HGate(), [qr[2]], []))
+        self.assertSameMetrics(circuit)
+        circuit.add_register(QuantumRegister(1))
+        circuit.cx(2, 3)
+        self.assertSameMetrics(circuit)
+
+    def test_condition_after_update(self):
+        """Test the metrics are recomputed after a processed instruction gets a condition."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.track_metrics()
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        instructions = circuit.x(qr[1])
+        self.assertEqual(circuit.depth(), 2)
+        self.assertEqual(circuit.num_connected_components(), 3)
+        instructions.c_if(cr, 1)
+        self.assertEqual(circuit.depth(), 3)
+        self.assertEqual(circuit.num_connected_components(), 1)
+        self.assertSameMetrics(circuit)
+
+    def test_copy(self):
+        """Test copies of a circuit track their own metrics."""
+        circuit = QuantumCircuit(2)
+        circuit.track_metrics()
+        circuit.h(0)
+        self.assertEqual(circuit.depth(), 1)
+        copied = circuit.copy()
+        copied.cx(0, 1)
+        self.assertEqual(copied.depth(), 2)
+        self.assertEqual(circuit.depth(), 1)
+        self.assertEqual(circuit.count_ops(), {'h': 1})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,7 @@
 
 """Test Qiskit's QuantumCircuit class."""
 
+import io
 from math import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
@@ -186,3 +187,44 @@ my_gate_{0} qr[0];\n""".format(my_gate_inst3_id, my_gate_inst2_id)
         qasm_str = circuit.qasm()
         circuit2 = QuantumCircuit.from_qasm_str(qasm_str)
         self.assertEqual(circuit, circuit2)
+
+    def test_circuit_qasm_params(self):
+        """Test circuit qasm() method formats parameters as fractions of pi.
+        """
+        circuit = QuantumCircuit(1)
+        circuit.u3(pi / 2, -3 * pi / 4, 0.1234567891, 0)
+        circuit.rz(-2 * pi, 0)
+        circuit.rz(5 * pi / 7, 0)
+        circuit.rz(3, 0)
+        circuit.rz(1 + 2j, 0)
+
+        expected_qasm = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[1];
+u3(pi/2,-3*pi/4,0.12345679) q[0];
+rz(-2*pi) q[0];
+rz(5*pi/7) q[0];
+rz(3) q[0];
+rz(1+2j) q[0];\n"""
+        self.assertEqual(circuit.qasm(), expected_qasm)
+
+    def test_write_qasm(self):
+        """Test writing the qasm of a circuit with composite circuits to a file object.
+        """
+        composite_circ = QuantumCircuit(2, name="composite_circ")
+        composite_circ.h(0)
+        composite_circ.cx(0, 1)
+        composite_circ_instr = composite_circ.to_instruction()
+
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        qc = QuantumCircuit(qr, cr)
+        for _ in range(1500):
+            qc.append(composite_circ_instr, [1, 0])
+            qc.rz(0.5, 0)
+        qc.measure(qr, cr)
+
+        file = io.StringIO()
+        qc.write_qasm(file)
+        self.assertEqual(file.getvalue(), qc.qasm())
+        self.assertEqual(file.getvalue().count('gate composite_circ'), 1)
@@ -15,6 +15,9 @@
 
 """Test Qiskit's EquivalenceLibrary class."""
 
+import subprocess
+import sys
+
 import numpy as np
 
 from qiskit.test import QiskitTestCase
@@ -397,6 +400,103 @@ class TestEquivalenceLibraryWithParameters(QiskitTestCase):
         self.assertEqual(entry[1], second_expected)
 
 
+class TestLazyEquivalences(QiskitTestCase):
+    """Test cases for equivalences added with add_lazy_equivalence."""
+
+    def _lazy_factory(self, calls):
+        def factory():
+            calls.append(1)
+            theta = Parameter('theta')
+            equiv = QuantumCircuit(1)
+            equiv.rx(theta, 0)
+            return OneQubitOneParamGate(theta), equiv
+        return factory
+
+    def test_factory_called_on_first_get(self):
+        """The factory is only called the first time the entry is queried."""
+        eq_lib = EquivalenceLibrary()
+        calls = []
+        eq_lib.add_lazy_equivalence('1q1p', 1, self._lazy_factory(calls), [('rx', 1)])
+
+        self.assertEqual(calls, [])
+        self.assertTrue(eq_lib.has_entry(OneQubitOneParamGate(Parameter('phi'))))
+        self.assertEqual(calls, [])
+
+        entry = eq_lib.get_entry(OneQubitOneParamGate(0.5))
+        eq_lib.get_entry(OneQubitOneParamGate(0.25))
+
+        expected = QuantumCircuit(1)
+        expected.rx(0.5, 0)
+        self.assertEqual(entry, [expected])
+        self.assertEqual(calls, [1])
+
+    def test_insertion_order_preserved(self):
+        """Lazy and eager equivalences are returned in insertion order."""
+        eq_lib = EquivalenceLibrary()
+        theta = Parameter('theta')
+        first = QuantumCircuit(1)
+        first.ry(theta, 0)
+        eq_lib.add_equivalence(OneQubitOneParamGate(theta), first)
+        eq_lib.add_lazy_equivalence('1q1p', 1, self._lazy_factory([]))
+        third = QuantumCircuit(1)
+        third.rz(theta, 0)
+        eq_lib.add_equivalence(OneQubitOneParamGate(theta), third)
+
+        entry = eq_lib.get_entry(OneQubitOneParamGate(theta))
+
+        self.assertEqual([circuit.data[0][0].name for circuit in entry], ['ry', 'rx', 'rz'])
+
+    def test_basis_without_building(self):
+        """The basis of a lazy equivalence is known without calling its factory."""
+        eq_lib = EquivalenceLibrary()
+        calls = []
+        eq_lib.add_lazy_equivalence('1q1p', 1, self._lazy_factory(calls), [('rx', 1)])
+
+        bases = eq_lib._get_equivalence_bases(('1q1p', 1))
+
+        self.assertEqual([basis for basis, _ in bases], [frozenset([('rx', 1)])])
+        self.assertEqual(calls, [])
+        params, circuit = bases[0][1]()
+        self.assertEqual(len(params), 1)
+        self.assertEqual(circuit.data[0][0].name, 'rx')
+        self.assertEqual(calls, [1])
+
+    def test_raise_if_basis_mismatch(self):
+        """A lazy equivalence built with another basis than declared raises."""
+        eq_lib = EquivalenceLibrary()
+        eq_lib.add_lazy_equivalence('1q1p', 1, self._lazy_factory([]), [('ry', 1)])
+
+        with self.assertRaises(CircuitError):
+            eq_lib.get_entry(OneQubitOneParamGate(0.5))
+
+    def test_raise_if_gate_mismatch(self):
+        """A lazy equivalence built for another gate than declared raises."""
+        eq_lib = EquivalenceLibrary()
+        eq_lib.add_lazy_equivalence('1q2p', 1, self._lazy_factory([]))
+
+        with self.assertRaises(CircuitError):
+            eq_lib.get_entry(OneQubitTwoParamGate(0.5, 0.25))
+
+    def test_standard_library_declared_bases(self):
+        """The declared bases of the standard equivalences match their circuits."""
+        from qiskit.circuit.library.standard_gates.equivalence_library import (
+            StandardEquivalenceLibrary as std)
+        for key in std._get_all_keys():
+            for basis, get_equiv in std._get_equivalence_bases(key):
+                _, circuit = get_equiv()
+                self.assertEqual(basis, frozenset((inst.name, inst.num_qubits)
+                                                  for inst, _, _ in circuit.data))
+
+    def test_import_builds_no_equivalence(self):
+        """Importing the session library does not build the standard equivalences."""
+        code = ('from qiskit.circuit.library.standard_gates.equivalence_library '
+                'import StandardEquivalenceLibrary as std; '
+                'print(sum(equiv.factory is None for entry in std._map.values() '
+                'for equiv in entry.equivalences))')
+        output = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', code])
+        self.assertEqual(output.split()[-1], b'0')
+
+
 class TestSessionEquivalenceLibrary(QiskitTestCase):
     """Test cases for SessionEquivalenceLibrary."""
 
@@ -21,14 +21,14 @@ from ddt import ddt, data
 from qiskit import QuantumCircuit
 from qiskit.quantum_info import Operator
 from qiskit.test import QiskitTestCase
-from qiskit.circuit import ParameterVector, Gate, ControlledGate
+from qiskit.circuit import Parameter, ParameterVector, Gate, ControlledGate
 
 
 from qiskit.circuit.library import (
     HGate, CHGate, IGate, RGate, RXGate, CRXGate, RYGate, CRYGate, RZGate,
     CRZGate, SGate, SdgGate, CSwapGate, TGate, TdgGate, U1Gate, CU1Gate,
     U2Gate, U3Gate, CU3Gate, XGate, CXGate, CCXGate, YGate, CYGate,
-    ZGate, CZGate, RYYGate
+    ZGate, CZGate, RYYGate, RCCXGate, MCXVChain
 )
 
 from qiskit.circuit.library.standard_gates.equivalence_library import (
@@ -116,6 +116,78 @@ class TestGateDefinitions(QiskitTestCase):
         self.assertTrue(Operator(circ).equiv(Operator(decomposed_circ)))
 
 
+class TestSharedDefinitions(QiskitTestCase):
+    """Test the definitions shared by the standard gates with numeric parameters."""
+
+    def test_shared_numeric_definitions(self):
+        """Test gates with equal numeric parameters share their definition."""
+        self.assertIs(RZGate(0.3)._get_definition(), RZGate(0.3)._get_definition())
+        self.assertIs(CCXGate()._get_definition(), CCXGate()._get_definition())
+        self.assertIsNot(RZGate(0.3)._get_definition(), RZGate(0.4)._get_definition())
+        self.assertIsNot(RZGate(1)._get_definition(), RZGate(1.0)._get_definition())
+        self.assertIsNot(CRZGate(0.3)._get_definition(), RZGate(0.3)._get_definition())
+
+    def test_copy_shares_definition(self):
+        """Test copies of a gate share its definition."""
+        gate = CU1Gate(0.5)
+        self.assertIs(gate.copy()._get_definition(), gate._get_definition())
+        circuit = QuantumCircuit(2)
+        circuit.append(gate, [0, 1])
+        self.assertIs(circuit.copy()[0][0]._get_definition(), gate._get_definition())
+
+    def test_modifying_definition(self):
+        """Test modifying the definition of a gate does not modify the shared definition."""
+        gate = RZGate(0.3)
+        definition = gate.definition
+        self.assertIsNot(definition, RZGate(0.3)._get_definition())
+        self.assertIs(gate.definition, definition)
+        definition.x(0)
+        definition[0][0].params[0] = 0.5
+        self.assertEqual([inst.name for inst, _, _ in gate.definition], ['u1', 'x'])
+        other = RZGate(0.3).definition
+        self.assertEqual([inst.name for inst, _, _ in other], ['u1'])
+        self.assertEqual(other[0][0].params, [0.3])
+
+    def test_symbolic_definitions_not_shared(self):
+        """Test gates with symbolic parameters get their own definition."""
+        theta = Parameter('θ')
+        self.assertIsNot(RZGate(theta).definition, RZGate(theta).definition)
+
+        circuit = QuantumCircuit(1)
+        circuit.rz(theta, 0)
+        bound = circuit.bind_parameters({theta: 0.3})
+        self.assertEqual(float(bound.decompose()[0][0].params[0]), 0.3)
+        self.assertEqual(RZGate(0.3).definition[0][0].params[0], 0.3)
+
+    def test_inverse_keeps_shared_definition(self):
+        """Test inverting or reversing a gate does not modify the shared definition."""
+        gate = RCCXGate()
+        expected = [(inst.name, qargs) for inst, qargs, _ in gate.definition]
+        inverse = gate.inverse()
+        reverse = gate.reverse_ops()
+        self.assertIsNot(inverse.definition, gate.definition)
+        self.assertIsNot(reverse.definition, gate.definition)
+        self.assertEqual([(inst.name, qargs) for inst, qargs, _ in RCCXGate().definition],
+                         expected)
+        self.assertTrue(Operator(inverse).equiv(Operator(gate).adjoint()))
+
+    def test_setting_definition(self):
+        """Test setting the definition of a gate does not modify the shared definition."""
+        gate = RZGate(0.3)
+        shared = gate._get_definition()
+        definition = QuantumCircuit(1)
+        definition.rz(0.3, 0)
+        gate.definition = definition
+        self.assertIs(RZGate(0.3)._get_definition(), shared)
+        self.assertIsNot(gate.copy().definition, gate.definition)
+
+    def test_dirty_ancillas_not_shared(self):
+        """Test the MCX v-chain gates with clean and dirty ancillas are defined anew."""
+        clean = MCXVChain(3).definition
+        dirty = MCXVChain(3, dirty_ancillas=True).definition
+        self.assertNotEqual(len(clean), len(dirty))
+
+
 class TestGateEquivalenceEqual(QiskitTestCase):
     """Test the decomposition of a gate in terms of other gates
     yields the same matrix as the hardcoded matrix definition."""
@@ -1392,6 +1392,56 @@ class TestNLocal(QiskitTestCase):
 
         self.assertCircuitEqual(nlocal, circuit)
 
+    @data((1, 3), (3, 1), (2, 2))
+    @unpack
+    def test_changing_reps(self, reps, new_reps):
+        """Test changing the repetitions of a built circuit, which keeps the first layers."""
+        theta = Parameter('θ')
+        params = ParameterVector('p')
+        entanglement = QuantumCircuit(2)
+        entanglement.crx(2 * theta, 0, 1)
+
+        def build(num_reps):
+            nlocal = NLocal(3, rotation_blocks=RYGate(theta), entanglement_blocks=entanglement,
+                            reps=num_reps, insert_barriers=True)
+            nlocal.ordered_parameters = params
+            return nlocal
+
+        nlocal = build(reps)
+        first = nlocal.data[0][0]
+        nlocal.reps = new_reps
+
+        self.assertIs(nlocal.data[0][0], first)
+        self.assertCircuitEqual(nlocal, build(new_reps), transpiled=False)
+        self.assertEqual(nlocal.parameters, set(params[:nlocal.num_parameters_settable]))
+
+        nlocal.reps = reps
+        self.assertCircuitEqual(nlocal, build(reps), transpiled=False)
+
+    def test_parameter_binder(self):
+        """Test the parameter binder takes the values in the order of assign_parameters."""
+        theta = Parameter('θ')
+        nlocal = NLocal(2, rotation_blocks=RYGate(theta), entanglement_blocks=CXGate(), reps=2)
+        ordered = nlocal.ordered_parameters
+        nlocal.ordered_parameters = [ordered[1], ordered[0], 0.4] + ordered[3:5] + [ordered[0]]
+        values = [0.1, 0.2, 0.3, 0.5]
+
+        bound = nlocal.parameter_binder()(values)
+        self.assertEqual(bound.parameters, set())
+        self.assertTrue(Operator(bound).equiv(nlocal.assign_parameters(values)))
+
+    def test_changing_reps_after_modification(self):
+        """Test changing the repetitions rebuilds the circuit if its data was modified."""
+        nlocal = NLocal(2, rotation_blocks=XGate(), entanglement_blocks=SwapGate(), reps=2)
+        nlocal.data[0] = (RXGate(0.1), [nlocal.qubits[0]], [])
+        nlocal.reps = 1
+
+        reference = QuantumCircuit(2)
+        reference.x([0, 1])
+        reference.swap(0, 1)
+        reference.x([0, 1])
+        self.assertCircuitEqual(nlocal, reference, transpiled=False)
+
 
 @ddt
 class TestTwoLocal(QiskitTestCase):
@@ -1778,6 +1828,19 @@ class TestDataEncoding(QiskitTestCase):
 
         self.assertTrue(Operator(encoding).equiv(ref))
 
+    def test_parameter_binder(self):
+        """Test binding a feature map to many data points with its parameter binder."""
+        encoding = ZZFeatureMap(3, reps=2)
+        binder = encoding.parameter_binder()
+        points = [[0.2, 1, np.pi], [-0.5, 0.3, 2.1]]
+        circuits = binder(points)
+
+        self.assertEqual(len(circuits), 2)
+        for point, circuit in zip(points, circuits):
+            with self.subTest(point=point):
+                self.assertEqual(circuit.parameters, set())
+                self.assertTrue(Operator(circuit).equiv(encoding.assign_parameters(point)))
+
 
 @ddt
 class TestDiagonalGate(QiskitTestCase):
@@ -26,7 +26,7 @@ import qiskit
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Gate, Instruction
-from qiskit.circuit import Parameter, ParameterVector, ParameterExpression
+from qiskit.circuit import Parameter, ParameterVector, ParameterExpression, ParameterBinder
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.compiler import assemble, transpile
 from qiskit.execute import execute
@@ -138,6 +138,25 @@ class TestParameters(QiskitTestCase):
         self.assertIs(theta, next(iter(vparams)))
         self.assertIs(rxg, vparams[theta][0][0])
 
+    def test_parameter_table_slots(self):
+        """Test the parameter table keeps each slot of a repeated instruction once."""
+        from qiskit.circuit.library.standard_gates.rz import RZGate
+        theta = Parameter('θ')
+        phi = Parameter('φ')
+        qc = QuantumCircuit(1)
+        rzg = RZGate(theta)
+        qc.append(rzg, [0])
+        qc.append(rzg, [0])
+        qc.u3(theta, phi, theta + phi, 0)
+        u3g = qc.data[-1][0]
+
+        table = qc._parameter_table
+        self.assertEqual(list(table[theta]), [(rzg, 0), (u3g, 0), (u3g, 2)])
+        self.assertIn((u3g, 1), table[phi])
+        self.assertNotIn((u3g, 0), table[phi])
+        self.assertEqual(table.slots_for([phi, theta, Parameter('x')]),
+                         [(u3g, 1), (u3g, 2), (rzg, 0), (u3g, 0)])
+
     def test_is_parameterized(self):
         """Test checking if a gate is parameterized (bound/unbound)"""
         from qiskit.circuit.library.standard_gates.h import HGate
@@ -820,6 +839,31 @@ class TestParameterExpressions(QiskitTestCase):
         with self.assertRaisesRegex(CircuitError, 'Name conflict'):
             expr.subs({x: y_second})
 
+    def test_affine_expressions(self):
+        """Verify affine expressions print, bind and compare as their sympy expressions."""
+        x = Parameter('x')
+        y = Parameter('y')
+
+        self.assertEqual(str(2 * (x + 1) - y / 2), '2*x - y/2 + 2')
+        self.assertEqual(str((x / 3).bind({x: 1})), '1/3')
+        self.assertEqual(str((x * 0 + 1).bind({x: 0.5})), '1')
+        self.assertEqual(float((0.5 * x - y).bind({x: 3, y: 0.25})), 1.25)
+        self.assertEqual(str((2 * x + 1).subs({x: y - 1})), '2*y - 1')
+        self.assertEqual((x + y).bind({y: 0}), x)
+        self.assertNotEqual(x + y, y)
+        self.assertEqual((x - x).parameters, {x})
+
+    def test_affine_expressions_hash(self):
+        """Verify equal expressions have the same hash."""
+        x = Parameter('x')
+        y = Parameter('y')
+
+        self.assertEqual({2 * x + y: 1}[y + x * 2], 1)
+        self.assertEqual(hash(x + 0), hash(x))
+        self.assertEqual(hash((x * y).bind({y: 2})), hash(2 * x))
+        self.assertEqual((x * y).bind({y: 2}), 2 * x)
+        self.assertEqual(hash(x * y), hash(y * x))
+
     def test_expressions_of_parameter_with_constant(self):
         """Verify operating on a Parameter with a constant."""
 
@@ -1195,6 +1239,79 @@ class TestParameterExpressions(QiskitTestCase):
         self.assertEqual(x, x.conjugate())  # Parameters are real, therefore conjugate returns self
 
 
+class TestParameterBinder(QiskitTestCase):
+    """Test binding circuits to arrays of values with a ParameterBinder."""
+
+    def setUp(self):
+        super().setUp()
+        self.x = ParameterVector('x', 2)
+        self.theta = Parameter('θ')
+        qc = QuantumCircuit(2)
+        qc.rx(self.x[0], 0)
+        qc.rz(self.x[0] * self.x[1] + 1, 1)
+        qc.append(Gate('custom', 1, [self.theta]), [1])
+        qc.u3(self.theta, 0.5, self.x[1], 1)
+        qc.global_phase = self.theta / 2
+        self.circuit = qc
+
+    def test_bind_vector(self):
+        """Test binding a vector of values."""
+        binder = ParameterBinder(self.circuit, [self.theta, self.x[0], self.x[1]])
+        bound = binder([0.3, 1, 2])
+
+        expected = QuantumCircuit(2, global_phase=0.15)
+        expected.rx(1, 0)
+        expected.rz(3, 1)
+        expected.append(Gate('custom', 1, [0.3]), [1])
+        expected.u3(0.3, 0.5, 2, 1)
+        self.assertEqual(bound, expected)
+        self.assertEqual(bound.parameters, set())
+        self.assertEqual(self.circuit.parameters, {self.theta, self.x[0], self.x[1]})
+
+    def test_bind_array(self):
+        """Test binding the rows of a 2-D array of values."""
+        binder = ParameterBinder(self.circuit, [self.x[0], self.x[1], self.theta])
+        values = numpy.array([[1, 2, 0.3], [-1, 0.5, 0.1], [0, 0, 0]])
+        circuits = binder(values)
+
+        self.assertEqual(len(circuits), 3)
+        for row, circuit in zip(values, circuits):
+            with self.subTest(row=row):
+                expected = self.circuit.bind_parameters(
+                    {self.x: row[:2], self.theta: row[2]})
+                self.assertEqual([[float(param) for param in inst.params]
+                                  for inst, _, _ in circuit.data],
+                                 [[float(param) for param in inst.params]
+                                  for inst, _, _ in expected.data])
+                self.assertAlmostEqual(circuit.global_phase, float(expected.global_phase))
+
+    def test_bind_definition(self):
+        """Test binding an instruction with a definition also binds the definition."""
+        inner = QuantumCircuit(1)
+        inner.rz(self.theta, 0)
+        qc = QuantumCircuit(1)
+        qc.append(inner.to_instruction(), [0])
+        bound = ParameterBinder(qc, [self.theta])([0.25])
+
+        self.assertEqual(bound.data[0][0].params, [0.25])
+        self.assertEqual(float(bound.data[0][0].definition.data[0][0].params[0]), 0.25)
+
+    def test_invalid_parameters(self):
+        """Test the parameters must include those of the circuit, without duplicates."""
+        with self.assertRaises(CircuitError):
+            ParameterBinder(self.circuit, [self.x[0], self.theta])
+        with self.assertRaises(CircuitError):
+            ParameterBinder(self.circuit, [self.x[0], self.x[1], self.theta, self.x[0]])
+
+    def test_invalid_values(self):
+        """Test the values must have one column per parameter."""
+        binder = ParameterBinder(self.circuit, [self.x[0], self.x[1], self.theta])
+        with self.assertRaises(CircuitError):
+            binder([1, 2])
+        with self.assertRaises(CircuitError):
+            binder(numpy.zeros((2, 2, 3)))
+
+
 class TestParameterEquality(QiskitTestCase):
     """Test equality of Parameters and ParameterExpressions."""
 
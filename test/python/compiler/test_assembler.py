@@ -216,6 +216,39 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertTrue(hasattr(h_op, 'conditional'))
         self.assertEqual(bfunc_op.register, h_op.conditional)
 
+    def test_repeated_conditionals_and_gates(self):
+        """Verify repeated gates and conditions assemble to independent instructions."""
+        qr = QuantumRegister(2, 'q')
+        cr1 = ClassicalRegister(2, 'c1')
+        cr2 = ClassicalRegister(2, 'c2')
+        qc = QuantumCircuit(qr, cr1, cr2)
+
+        qc.u3(0.1, 0.2, 0.3, qr[0])
+        qc.u3(0.1, 0.2, 0.3, qr[1])
+        qc.x(qr[1]).c_if(cr2, 2)
+        qc.x(qr[0]).c_if(cr2, 2)
+        qc.x(qr[0]).c_if(cr1, 1)
+        qc.measure(qr, cr2)
+
+        qobj = assemble(qc)
+        validate_qobj_against_schema(qobj)
+
+        u3_0, u3_1, bfunc_0, x_0, bfunc_1, x_1, bfunc_2, x_2, meas_0, meas_1 = \
+            qobj.experiments[0].instructions
+
+        self.assertEqual(u3_0.qubits, [0])
+        self.assertEqual(u3_1.qubits, [1])
+        self.assertEqual(u3_0.params, [0.1, 0.2, 0.3])
+        self.assertIsNot(u3_0.params, u3_1.params)
+        self.assertEqual([bfunc_0.mask, bfunc_0.val], ['0xC', '0x8'])
+        self.assertEqual([bfunc_1.mask, bfunc_1.val], ['0xC', '0x8'])
+        self.assertEqual([bfunc_2.mask, bfunc_2.val], ['0x3', '0x1'])
+        self.assertEqual([bfunc_0.register, bfunc_1.register, bfunc_2.register], [4, 5, 6])
+        self.assertEqual([x_0.conditional, x_1.conditional, x_2.conditional], [4, 5, 6])
+        self.assertEqual([x_0.qubits, x_1.qubits, x_2.qubits], [[1], [0], [0]])
+        self.assertEqual([meas_0.memory, meas_1.memory], [[2], [3]])
+        self.assertEqual([meas_0.register, meas_1.register], [[2], [3]])
+
     def test_assemble_circuits_raises_for_bind_circuit_mismatch(self):
         """Verify assemble_circuits raises error for parameterized circuits without matching
         binds."""
@@ -327,6 +360,60 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(_qobj_inst_params(7, 0), [1, 0])
         self.assertEqual(_qobj_inst_params(8, 0), [2, 1])
 
+    def test_assemble_lazy_parameter_binds(self):
+        """Verify lazy_parameter_binds assembles one template per circuit with a values table."""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        qc1 = QuantumCircuit(qr, cr)
+        qc2 = QuantumCircuit(qr, cr)
+
+        x = Parameter('x')
+        y = Parameter('y')
+
+        qc1.u2(x, y, qr[0])
+        qc1.measure(qr, cr)
+        qc1.rz(x + y, qr[0]).c_if(cr, 1)
+
+        qc2.rz(x, qr[0])
+        qc2.u3(0.5, x * y, x, qr[0])
+
+        binds = [{x: 0, y: 0}, {x: 1, y: 0}, {x: 1, y: 2}]
+        qobj = assemble([qc1, qc2], parameter_binds=binds, lazy_parameter_binds=True)
+        validate_qobj_against_schema(qobj)
+
+        self.assertEqual(len(qobj.experiments), 2)
+        table1 = qobj.experiments[0].config.parameter_binds
+        table2 = qobj.experiments[1].config.parameter_binds
+        # The bfunc of the conditional rz shifts it to position 3
+        self.assertEqual(table1['slots'], [[0, 0], [0, 1], [3, 0]])
+        self.assertEqual(table1['values'], [[0, 0, 0], [1, 0, 1], [1, 2, 3]])
+        self.assertEqual(table2['slots'], [[0, 0], [1, 1], [1, 2]])
+        self.assertEqual(table2['values'], [[0, 0, 0], [1, 0, 1], [1, 2, 1]])
+
+        # The template is bound to the first bind
+        self.assertEqual([float(p) for p in qobj.experiments[1].instructions[1].params],
+                         [0.5, 0, 0])
+
+    def test_assemble_lazy_parameter_binds_raises_for_mismatch(self):
+        """Verify lazy_parameter_binds checks the binds like the expanded assembly."""
+        qr = QuantumRegister(1)
+        x = Parameter('x')
+        y = Parameter('y')
+        qc = QuantumCircuit(qr)
+        qc.u1(x + y, qr[0])
+
+        self.assertRaises(QiskitError, assemble, qc, lazy_parameter_binds=True)
+        self.assertRaises(QiskitError, assemble, qc, parameter_binds=[{x: 1}],
+                          lazy_parameter_binds=True)
+
+    def test_assemble_lazy_parameter_binds_without_parameters(self):
+        """Verify lazy_parameter_binds leaves unparameterized circuits untouched."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qobj = assemble(qc, lazy_parameter_binds=True)
+        self.assertEqual(len(qobj.experiments), 1)
+        self.assertFalse(hasattr(qobj.experiments[0].config, 'parameter_binds'))
+
     def test_init_qubits_default(self):
         """Check that the init_qubits=None assemble option is passed on to the qobj."""
         qobj = assemble(self.circ)
@@ -768,6 +768,69 @@ class TestDagLayers(QiskitTestCase):
             comp = [(nd.type, nd.name, nd._node_id) for nd in dag1.topological_nodes()]
             self.assertEqual(comp, truth)
 
+    def test_op_node_layers_match_layers(self):
+        """The op_node_layers() method yields the nodes of each layer of layers()."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qreg, creg)
+        circuit.h(qreg[0])
+        circuit.x(qreg[2])
+        circuit.cx(qreg[0], qreg[1])
+        circuit.barrier(qreg)
+        circuit.measure(qreg[1], creg[1])
+        circuit.x(qreg[0]).c_if(creg, 1)
+        circuit.measure(qreg[2], creg[0])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.layers())
+        node_layers = list(dag.op_node_layers())
+        self.assertEqual(len(layers), len(node_layers))
+        for layer, node_layer in zip(layers, node_layers):
+            self.assertEqual(layer["partition"], node_layer["partition"])
+            expected = sorted(layer["graph"].op_nodes(), key=lambda nd: nd._node_id)
+            self.assertEqual([(nd.name, nd.qargs, nd.cargs, nd.condition) for nd in expected],
+                             [(nd.name, nd.qargs, nd.cargs, nd.condition)
+                              for nd in node_layer["nodes"]])
+            for node in node_layer["nodes"]:
+                self.assertIs(dag.node(node._node_id), node)
+
+    def test_serial_op_node_layers(self):
+        """The serial_op_node_layers() method yields one node of the dag per layer."""
+        qreg = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qreg)
+        circuit.h(qreg[0])
+        circuit.barrier(qreg)
+        circuit.cx(qreg[0], qreg[1])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.serial_op_node_layers())
+        self.assertEqual([[node.name for node in layer["nodes"]] for layer in layers],
+                         [['h'], ['barrier'], ['cx']])
+        self.assertEqual([layer["partition"] for layer in layers],
+                         [[[qreg[0]]], [], [[qreg[0], qreg[1]]]])
+        self.assertEqual([layer["partition"] for layer in dag.serial_layers()],
+                         [layer["partition"] for layer in layers])
+
+    def test_serial_op_node_layers_of_layer(self):
+        """The serial_op_node_layers() method serializes the nodes of a layer in the
+        order serial_layers() gives on its sub-DAG."""
+        qreg = QuantumRegister(4, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qreg, creg)
+        circuit.cx(qreg[2], qreg[3])
+        circuit.h(qreg[1])
+        circuit.x(qreg[0]).c_if(creg, 1)
+        circuit.measure(qreg[1], creg[0])
+        dag = circuit_to_dag(circuit)
+
+        for layer, node_layer in zip(dag.layers(), dag.op_node_layers()):
+            expected = [serial_layer["graph"].op_nodes()[0]
+                        for serial_layer in layer["graph"].serial_layers()]
+            nodes = [serial_layer["nodes"][0]
+                     for serial_layer in dag.serial_op_node_layers(node_layer["nodes"])]
+            self.assertEqual([(nd.name, nd.qargs) for nd in expected],
+                             [(nd.name, nd.qargs) for nd in nodes])
+
 
 class TestCircuitSpecialCases(QiskitTestCase):
     """DAGCircuit test for special cases, usually for regression."""
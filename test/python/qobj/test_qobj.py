@@ -16,12 +16,17 @@
 """Qobj tests."""
 
 import copy
+import subprocess
+import sys
 import uuid
+from unittest.mock import patch
 
 import jsonschema
+import numpy as np
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.compiler import assemble
+from qiskit.exceptions import QiskitError
 from qiskit.providers.basicaer import basicaerjob
 
 from qiskit.qobj import (QasmQobj, PulseQobj, QobjHeader,
@@ -29,7 +34,8 @@ from qiskit.qobj import (QasmQobj, PulseQobj, QobjHeader,
                          PulseQobjConfig, QobjMeasurementOption,
                          PulseLibraryItem, QasmQobjInstruction,
                          QasmQobjExperiment, QasmQobjConfig)
-from qiskit.qobj import validate_qobj_against_schema
+from qiskit.qobj import validate_qobj_against_schema, validate_qobj_structure
+from qiskit.qobj.utils import get_validation_mode
 from qiskit.validation.jsonschema.exceptions import SchemaValidationError
 
 from qiskit.test import QiskitTestCase
@@ -182,6 +188,95 @@ class TestQASMQobj(QiskitTestCase):
             job = basicaerjob.BasicAerJob(backend, job_id, _nop, self.bad_qobj)
             job.submit()
 
+    def test_simjob_validation_modes(self):
+        """Test the qobj_validation user config setting of SimulatorJob."""
+        backend = FakeRueschlikon()
+        self.valid_qobj.experiments[0].instructions[0].qubits = [1, 1, 2]
+        # Duplicated qubits break the schema but not the structural invariants
+        for mode, raises in [('full', True), ('structure', False), ('none', False)]:
+            with self.subTest(mode=mode), \
+                    patch('qiskit.qobj.utils.get_validation_mode', return_value=mode):
+                job = basicaerjob.BasicAerJob(backend, str(uuid.uuid4()), _nop, self.valid_qobj)
+                with patch.object(basicaerjob.BasicAerJob, '_executor') as executor:
+                    if raises:
+                        self.assertRaises(SchemaValidationError, job.submit)
+                        executor.submit.assert_not_called()
+                    else:
+                        job.submit()
+                        executor.submit.assert_called_once()
+
+        self.valid_qobj.experiments[0].instructions[0].qubits = [-1]
+        with patch('qiskit.qobj.utils.get_validation_mode', return_value='structure'):
+            job = basicaerjob.BasicAerJob(backend, str(uuid.uuid4()), _nop, self.valid_qobj)
+            self.assertRaises(SchemaValidationError, job.submit)
+
+    def test_assemble_validation_modes(self):
+        """Test assemble checks the instructions it builds unless validation is off."""
+        from qiskit.circuit import Gate
+
+        class BadIndexGate(Gate):
+            """A gate assembled with an invalid memory slot."""
+
+            def assemble(self):
+                instruction = super().assemble()
+                instruction.memory = [5]
+                return instruction
+
+        circuit = QuantumCircuit(2, 2)
+        circuit.measure([0, 1], [0, 1])
+        circuit.append(BadIndexGate('bad', 1, []), [0])
+        unnamed = QuantumCircuit(1)
+        unnamed.append(Gate(None, 1, []), [0])
+        for mode, raises in [('full', True), ('structure', True), ('none', False)]:
+            with self.subTest(mode=mode), \
+                    patch('qiskit.qobj.utils.get_validation_mode', return_value=mode):
+                for bad_circuit in (circuit, unnamed):
+                    if raises:
+                        self.assertRaises(SchemaValidationError, assemble, bad_circuit)
+                    else:
+                        assemble(bad_circuit)
+
+    def test_assembled_structure_not_validated_again(self):
+        """Test validate_qobj_structure skips the experiments assemble checked."""
+        qobj = assemble(QuantumCircuit(2, 2), shots=10)
+        with patch('qiskit.qobj.utils.validate_experiment_structure') as validate:
+            validate_qobj_structure(qobj)
+            validate_qobj_structure(self.valid_qobj)
+        self.assertEqual(validate.call_count, 1)
+
+    def test_validation_mode_read_once(self):
+        """Test the qobj_validation setting is read from the config file once."""
+        get_validation_mode.cache_clear()
+        self.addCleanup(get_validation_mode.cache_clear)
+        with patch('qiskit.user_config.get_config',
+                   return_value={'qobj_validation': 'none'}) as get_config:
+            self.assertEqual(get_validation_mode(), 'none')
+            self.assertEqual(get_validation_mode(), 'none')
+        get_config.assert_called_once_with()
+
+    def test_validate_qobj_structure(self):
+        """Test the structural validation of a qobj."""
+        validate_qobj_structure(self.valid_qobj)
+        validate_qobj_structure(assemble(QuantumCircuit(2, 2), shots=10))
+        with self.assertRaises(SchemaValidationError):
+            validate_qobj_structure(self.bad_qobj)
+
+        self.valid_qobj.experiments[0].config.n_qubits = 1
+        with self.assertRaisesRegex(SchemaValidationError, r'experiments\[0\]\.instructions\[0\]'):
+            validate_qobj_structure(self.valid_qobj)
+
+        self.valid_qobj.experiments[0].config.n_qubits = 2
+        self.valid_qobj.experiments[0].instructions[1].memory = [0.5]
+        with self.assertRaisesRegex(SchemaValidationError, r'instructions\[1\]\.memory'):
+            validate_qobj_structure(self.valid_qobj)
+
+    def test_validator_compiled_lazily(self):
+        """Test that importing qiskit.qobj does not compile the qobj schema."""
+        code = ('import qiskit.qobj.qasm_qobj as qasm_qobj; '
+                'print(qasm_qobj._compiled_validator.cache_info().currsize)')
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.split()[-1], b'0')
+
     def test_change_qobj_after_compile(self):
         """Test modifying Qobj parameters after compile."""
         qr = QuantumRegister(3)
@@ -202,6 +297,27 @@ class TestQASMQobj(QiskitTestCase):
         self.assertTrue(qobj1.experiments[1].config.shots == 1)
         self.assertTrue(qobj1.config.shots == 1024)
 
+    def test_to_bytes_round_trip(self):
+        """Test that a Qobj is recovered from its binary representation."""
+        self.assertEqual(QasmQobj.from_bytes(self.valid_qobj.to_bytes()), self.valid_qobj)
+
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(3)
+        qc = QuantumCircuit(qr, cr)
+        qc.h(qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.measure(qr, cr)
+        qc.x(qr[2]).c_if(cr, 1)
+        qobj = assemble([qc, qc], shots=1024, seed_simulator=88)
+        new_qobj = QasmQobj.from_bytes(qobj.to_bytes())
+        self.assertEqual(new_qobj, qobj)
+        self.assertEqual(new_qobj.to_dict(), qobj.to_dict())
+
+    def test_from_bytes_invalid_data(self):
+        """Test that from_bytes raises on data not made by to_bytes."""
+        with self.assertRaises(QiskitError):
+            QasmQobj.from_bytes(b'{"qobj_id": "12345"}')
+
 
 class TestPulseQobj(QiskitTestCase):
     """Tests for PulseQobj."""
@@ -374,6 +490,20 @@ class TestPulseQobj(QiskitTestCase):
             with self.subTest(msg=str(qobj_class)):
                 self.assertEqual(qobj_item.to_dict(), expected_dict)
 
+    def test_to_bytes_round_trip(self):
+        """Test that a Qobj is recovered from its binary representation."""
+        self.assertEqual(PulseQobj.from_bytes(self.valid_qobj.to_bytes()), self.valid_qobj)
+
+        samples = np.exp(1j * np.linspace(0, np.pi, 160))
+        self.valid_qobj.config.pulse_library.append(
+            PulseLibraryItem(name='pulse1', samples=samples))
+        new_qobj = PulseQobj.from_bytes(self.valid_qobj.to_bytes())
+        new_samples = new_qobj.config.pulse_library[1].samples
+        self.assertIsInstance(new_samples, np.ndarray)
+        np.testing.assert_array_equal(new_samples, samples)
+        self.assertEqual(new_qobj.experiments, self.valid_qobj.experiments)
+        self.assertEqual(new_qobj.config.qubit_lo_freq, [4.9])
+
 
 def _nop():
     pass
@@ -25,9 +25,9 @@ import scipy.linalg as la
 
 from qiskit import QiskitError
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
-from qiskit.circuit.library import HGate, CHGate, CXGate
+from qiskit.circuit.library import HGate, CHGate, CXGate, RZGate, CCXGate, C3XGate
 from qiskit.test import QiskitTestCase
-from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.operator import Operator, _stacked_unitaries
 from qiskit.quantum_info.operators.predicates import matrix_equal
 
 logger = logging.getLogger(__name__)
@@ -197,6 +197,50 @@ class TestOperator(OperatorTestCase):
         circuit = self.simple_circuit_with_measure()
         self.assertRaises(QiskitError, Operator, circuit)
 
+    def test_circuit_init_fused_gates(self):
+        """Test initialization from a circuit with gates on more qubits than are fused."""
+        mat = self.rand_matrix(4, 4)
+        circuit = QuantumCircuit(5)
+        circuit.h(range(5))
+        circuit.rz(0.3, 1)
+        circuit.cx(0, 3)
+        circuit.barrier()
+        circuit.ccx(4, 1, 2)
+        circuit.rz(0.3, 2)
+        circuit.append(C3XGate(), [3, 1, 0, 4])
+        circuit.cu1(0.2, 2, 0)
+        circuit.unitary(la.expm(-1j * (mat + mat.conj().T)), [4, 2])
+        target = Operator(np.eye(32))
+        for instruction, qargs, _ in circuit:
+            if instruction.name != 'barrier':
+                qubits = [circuit.qubits.index(qubit) for qubit in qargs]
+                target = target.compose(Operator(instruction), qargs=qubits)
+        self.assertEqual(Operator(circuit), target)
+
+    def test_cached_gate_matrices(self):
+        """Test the cached matrices of gates depend on their parameters and controls."""
+        circuit = QuantumCircuit(2)
+        circuit.append(CXGate(ctrl_state=0), [0, 1])
+        circuit.cx(0, 1)
+        circuit.rz(0.5, 0)
+        circuit.rz(0.25, 0)
+        target = np.kron(np.eye(2), RZGate(0.75).to_matrix()) @ np.kron(self.UX, np.eye(2))
+        self.assertTrue(matrix_equal(Operator(circuit).data, target))
+
+    def test_stacked_unitaries(self):
+        """Test computing the unitaries of several circuits at once."""
+        circuits = [[(CXGate(), [0, 1]), (HGate(), [1]), (RZGate(0.1), [0])],
+                    [],
+                    [(HGate(), [0])],
+                    [(CCXGate(), [2, 0, 1]), (CHGate(), [1, 2]), (HGate(), [2])]]
+        unitaries = _stacked_unitaries(circuits, 3)
+        self.assertEqual(unitaries.shape, (4, 8, 8))
+        for circuit, unitary in zip(circuits, unitaries):
+            target = QuantumCircuit(3)
+            for instruction, qubits in circuit:
+                target.append(instruction, qubits)
+            assert_allclose(unitary, Operator(target).data, atol=1e-10)
+
     def test_equal(self):
         """Test __eq__ method"""
         mat = self.rand_matrix(2, 2, real=True)
@@ -396,6 +440,19 @@ class TestOperator(OperatorTestCase):
         self.assertEqual(op.compose(op1, qargs=[2]), Operator(targ))
         self.assertEqual(op @ op1([2]), Operator(targ))
 
+    def test_compose_large_subsystem(self):
+        """Test subsystem compose and dot methods on a large operator."""
+        # 7-qubit operator, contracted with tensordot
+        mat = self.rand_matrix(128, 128)
+        mat_a = self.rand_matrix(2, 2)
+        mat_b = self.rand_matrix(2, 2)
+        op = Operator(mat)
+        op2 = Operator(np.kron(mat_b, mat_a))
+        full = np.kron(np.kron(np.kron(np.eye(2), mat_a), np.eye(4)),
+                       np.kron(mat_b, np.eye(4)))
+        self.assertEqual(op.compose(op2, qargs=[5, 2]), Operator(np.dot(full, mat)))
+        self.assertEqual(op.dot(op2, qargs=[5, 2]), Operator(np.dot(mat, full)))
+
     def test_dot_subsystem(self):
         """Test subsystem dot method."""
         # 3-qubit operator
@@ -16,6 +16,7 @@
 
 import unittest
 from itertools import product
+from unittest.mock import patch
 
 import numpy as np
 import scipy.linalg as la
@@ -29,6 +30,7 @@ from qiskit.circuit.library import (HGate, IGate, SdgGate, SGate, U3Gate,
 from qiskit.providers.basicaer import UnitarySimulatorPy
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.random import random_unitary
+from qiskit.quantum_info.synthesis import two_qubit_decompose
 from qiskit.quantum_info.synthesis.one_qubit_decompose import OneQubitEulerDecomposer
 from qiskit.quantum_info.synthesis.two_qubit_decompose import (TwoQubitWeylDecomposition,
                                                                two_qubit_cnot_decompose,
@@ -401,6 +403,34 @@ class TestTwoQubitWeylDecomposition(QiskitTestCase):
                         a = Ud(aaa, aaa, ccc)
                         self.check_two_qubit_weyl_decomposition(k1 @ a @ k2)
 
+    def test_two_qubit_weyl_decomposition_deterministic(self):
+        """Degenerate targets are diagonalized without the randomized fallback"""
+        targets = []
+        for aaa, bbb, ccc in [(np.pi/4, 0, 0), (np.pi/4, np.pi/4, 0), (np.pi/4, np.pi/4, np.pi/4),
+                              (1e-10, 0, 0), (np.pi/8, np.pi/8, -np.pi/8), (0.3, 1e-12, 0)]:
+            for k1l, k1r, k2l, k2r in K1K2S:
+                k1 = np.kron(k1l.data, k1r.data)
+                k2 = np.kron(k2l.data, k2r.data)
+                targets.append(k1 @ Ud(aaa, bbb, ccc) @ k2)
+        with patch.object(two_qubit_decompose, '_diagonalize_randomized',
+                          side_effect=AssertionError("randomized fallback used")):
+            for target in targets:
+                self.check_two_qubit_weyl_decomposition(target)
+
+    def test_two_qubit_weyl_decomposition_batch(self):
+        """Batched Weyl decompositions match the single ones"""
+        targets = [random_unitary(4, seed=seed).data for seed in range(10)]
+        targets.append(Operator(CXGate()).data)
+        batch = TwoQubitWeylDecomposition.batch(targets)
+        self.assertEqual(len(batch), len(targets))
+        for target, decomp in zip(targets, batch):
+            single = TwoQubitWeylDecomposition(target)
+            np.testing.assert_allclose([decomp.a, decomp.b, decomp.c],
+                                       [single.a, single.b, single.c], atol=1e-12)
+            for attr in ['K1l', 'K1r', 'K2l', 'K2r']:
+                np.testing.assert_allclose(getattr(decomp, attr), getattr(single, attr),
+                                           atol=1e-12)
+
 
 class TestTwoQubitDecomposeExact(QiskitTestCase):
     """Test TwoQubitBasisDecomposer() for exact decompositions
@@ -453,6 +483,37 @@ class TestTwoQubitDecomposeExact(QiskitTestCase):
             decomposer = TwoQubitBasisDecomposer(UnitaryGate(basis_unitary))
             self.check_exact_decomposition(random_unitary(4).data, decomposer)
 
+    def test_decompose_many(self):
+        """Verify decompose_many gives exact decompositions in order, with repeats"""
+        targets = [random_unitary(4, seed=seed).data for seed in range(5)]
+        targets += [targets[1], Operator(CXGate()), targets[1] * 1j]
+        decomposer = TwoQubitBasisDecomposer(CXGate())
+        circuits = decomposer.decompose_many(targets)
+        self.assertEqual(len(circuits), len(targets))
+        self.assertEqual(len(decomposer._cache), 6)
+        for target, circuit in zip(targets, circuits):
+            self.assertTrue(Operator(circuit).equiv(target))
+        self.assertIsNot(circuits[1], circuits[5])
+
+    def test_decomposition_cache(self):
+        """Repeated targets, also up to global phase, reuse the cached decomposition"""
+        unitary = random_unitary(4, seed=1234).data
+        decomposer = TwoQubitBasisDecomposer(CXGate(), cache_size=2)
+        first = decomposer(unitary)
+        with patch.object(two_qubit_decompose, 'TwoQubitWeylDecomposition',
+                          side_effect=AssertionError("decomposed again")):
+            second = decomposer(np.exp(0.3j) * unitary)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        decomposer(random_unitary(4, seed=1).data)
+        decomposer(random_unitary(4, seed=2).data)
+        self.assertEqual(len(decomposer._cache), 2)
+
+        no_cache = TwoQubitBasisDecomposer(CXGate(), cache_size=0)
+        self.check_exact_decomposition(unitary.copy(), no_cache)
+        self.assertEqual(len(no_cache._cache), 0)
+
     def test_exact_nonsupercontrolled_decompose(self):
         """Check that the nonsupercontrolled basis throws a warning"""
         with self.assertWarns(UserWarning, msg="Supposed to warn when basis non-supercontrolled"):
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the incremental construction of Results."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from qiskit import QuantumCircuit, assemble
+from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.qobj import QobjExperimentHeader
+from qiskit.result import MappedMemory, ResultBuilder, models
+from qiskit.test import QiskitTestCase
+
+
+class TestResultBuilder(QiskitTestCase):
+    """Tests for ResultBuilder."""
+
+    def setUp(self):
+        super().setUp()
+        self.builder_args = dict(backend_name='test_backend',
+                                 backend_version='1.0.0',
+                                 qobj_id='id-123',
+                                 job_id='job-123')
+
+    def _memory_result(self, index, success=True):
+        memory = np.random.RandomState(index).rand(50, 2, 2).tolist()
+        return models.ExperimentResult(
+            shots=50, success=success, meas_level=1, meas_return='single',
+            data=models.ExperimentResultData(memory=memory),
+            header=QobjExperimentHeader(name='experiment%d' % index))
+
+    def test_build_in_memory(self):
+        """Test building a result from experiment results and their dicts."""
+        builder = ResultBuilder(status='COMPLETED', **self.builder_args)
+        builder.add(self._memory_result(0))
+        builder.add(self._memory_result(1).to_dict())
+        self.assertEqual(len(builder), 2)
+        self.assertEqual([exp.header.name for exp in builder], ['experiment0', 'experiment1'])
+
+        result = builder.result(time_taken=1.5)
+        self.assertTrue(result.success)
+        self.assertEqual(result.status, 'COMPLETED')
+        self.assertEqual(result.time_taken, 1.5)
+        raw_memory = np.array(self._memory_result(1).data.memory)
+        np.testing.assert_array_equal(result.get_memory('experiment1'),
+                                      raw_memory[:, :, 0] + 1j * raw_memory[:, :, 1])
+
+        builder.add(self._memory_result(2, success=False))
+        self.assertEqual(len(result.results), 2)
+        self.assertFalse(builder.result().success)
+
+    def test_build_spilled(self):
+        """Test that spilled experiment results are written to disk and read back."""
+        in_memory = ResultBuilder(**self.builder_args)
+        with tempfile.TemporaryDirectory() as spill_dir:
+            builder = ResultBuilder(spill_dir=spill_dir, **self.builder_args)
+            for index in range(3):
+                builder.add(self._memory_result(index))
+                in_memory.add(self._memory_result(index))
+            self.assertEqual(len(os.listdir(spill_dir)), 3)
+
+            result = builder.result()
+            expected = in_memory.result()
+            self.assertEqual(len(result.results), 3)
+            self.assertEqual(result.results[1:][0].header.name, 'experiment1')
+            for index in range(3):
+                np.testing.assert_array_equal(result.get_memory('experiment%d' % index),
+                                              expected.get_memory(index))
+            self.assertEqual(result.to_dict()['results'][2]['header'],
+                             expected.to_dict()['results'][2]['header'])
+
+    def test_edit_spilled(self):
+        """Test that spilled experiment results are copies, kept once assigned back."""
+        with tempfile.TemporaryDirectory() as spill_dir:
+            builder = ResultBuilder(spill_dir=spill_dir, **self.builder_args)
+            builder.add(self._memory_result(0))
+            builder.add(self._memory_result(1))
+            result = builder.result()
+            self.assertIsNot(result.results[0], result.results[0])
+
+            experiment = result.results[0]
+            experiment.header.name = 'renamed'
+            self.assertEqual(result.results[0].header.name, 'experiment0')
+            result.results[0] = experiment
+            self.assertEqual(result.results[0].header.name, 'renamed')
+            self.assertEqual(result.results[1].header.name, 'experiment1')
+            self.assertEqual(len(os.listdir(spill_dir)), 2)
+            with self.assertRaises(TypeError):
+                result.results[0:1] = [experiment]
+
+    def test_map_spilled_memory(self):
+        """Test moving the memory of spilled experiment results to files."""
+        with tempfile.TemporaryDirectory() as spill_dir, \
+                tempfile.TemporaryDirectory() as memory_dir:
+            builder = ResultBuilder(spill_dir=spill_dir, **self.builder_args)
+            for index in range(2):
+                builder.add(self._memory_result(index))
+            result = builder.result()
+            expected = result.get_memory(1)
+            result.map_memory(memory_dir, experiments=['experiment1'])
+
+            self.assertEqual(os.listdir(memory_dir), ['job-123-1.npy'])
+            self.assertIsInstance(result.results[1].data.memory, MappedMemory)
+            self.assertIsInstance(result.results[0].data.memory, list)
+            memory = result.get_memory('experiment1')
+            self.assertIsInstance(memory, np.memmap)
+            np.testing.assert_array_equal(memory, expected)
+
+    def test_build_from_simulator(self):
+        """Test collecting the streamed results of a simulator."""
+        backend = QasmSimulatorPy()
+        circuit = QuantumCircuit(1, 1)
+        circuit.u3(np.pi, 0, 0, 0)
+        circuit.measure(0, 0)
+        qobj = assemble([circuit, circuit], shots=10)
+
+        builder = ResultBuilder(backend.name(), '1.0.0', qobj.qobj_id, 'job-123')
+        builder.extend(backend.iter_results(qobj))
+        self.assertEqual(builder.result().get_counts(), [{'1': 10}, {'1': 10}])
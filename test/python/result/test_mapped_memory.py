@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test measurement memory stored in memory-mapped files."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.result import MappedMemory, Result, models
+from qiskit.test import QiskitTestCase
+
+
+class TestMappedMemory(QiskitTestCase):
+    """Tests for MappedMemory."""
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        rng = np.random.RandomState(1234)
+        # 10 shots, 3 memory slots, 8 samples
+        self.raw_memory = rng.rand(10, 3, 8, 2).tolist()
+        raw = np.array(self.raw_memory)
+        self.memory = raw[..., 0] + 1j * raw[..., 1]
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_from_list(self):
+        """Test storing memory from a list, and slicing it."""
+        memory = MappedMemory.from_memory(self.raw_memory, self._path('m.npy'), chunk_shots=3)
+        self.assertEqual(memory.shape, (10, 3, 8))
+        self.assertEqual(len(memory), 10)
+        self.assertIsInstance(memory.data, np.memmap)
+        np.testing.assert_array_equal(np.asarray(memory), self.memory)
+        np.testing.assert_array_equal(memory[4:6, 1], self.memory[4:6, 1])
+        np.testing.assert_array_equal(MappedMemory(self._path('m.npy'))[-1], self.memory[-1])
+
+    def test_from_complex_array(self):
+        """Test storing memory from a complex array."""
+        memory = MappedMemory.from_memory(self.memory, self._path('m.npy'), chunk_shots=4)
+        np.testing.assert_array_equal(memory.raw, self.raw_memory)
+
+    def test_invalid_memory(self):
+        """Test that memory not made of pairs is rejected."""
+        with self.assertRaises(QiskitError):
+            MappedMemory.from_memory([[1., 2., 3.]], self._path('m.npy'))
+        np.save(self._path('counts.npy'), np.arange(10))
+        with self.assertRaises(QiskitError):
+            MappedMemory(self._path('counts.npy'))
+
+    def test_average_and_integrate(self):
+        """Test the chunked average and kernel integration."""
+        memory = MappedMemory.from_memory(self.raw_memory, self._path('m.npy'))
+        np.testing.assert_allclose(memory.average(chunk_shots=3), self.memory.mean(axis=0))
+
+        kernel = np.linspace(0, 1, 8)
+        expected = (self.memory * kernel).sum(axis=-1)
+        np.testing.assert_allclose(memory.integrate(kernel, chunk_shots=4), expected)
+
+        kernels = np.random.RandomState(5).rand(3, 8)
+        integrated = memory.integrate(kernels, chunk_shots=4, path=self._path('l1.npy'))
+        self.assertIsInstance(integrated, MappedMemory)
+        np.testing.assert_allclose(integrated[:], (self.memory * kernels).sum(axis=-1))
+        with self.assertRaises(QiskitError):
+            memory.integrate(np.ones(5))
+
+    def test_result_map_memory(self):
+        """Test moving the memory of a result to files."""
+        results = [
+            models.ExperimentResult(shots=10, success=True, meas_level=0, meas_return='single',
+                                    data=models.ExperimentResultData(memory=self.raw_memory)),
+            models.ExperimentResult(shots=2, success=True, meas_level=2,
+                                    data=models.ExperimentResultData(memory=['0x0', '0x1']))]
+        result = Result(backend_name='test_backend', backend_version='1.0.0',
+                        qobj_id='id-123', job_id='job-123', success=True, results=results)
+        result.map_memory(self.directory.name)
+
+        self.assertIsInstance(result.results[0].data.memory, MappedMemory)
+        self.assertEqual(os.listdir(self.directory.name), ['job-123-0.npy'])
+        memory = result.get_memory(0)
+        self.assertIsInstance(memory, np.memmap)
+        np.testing.assert_array_equal(memory, self.memory)
+        self.assertEqual(result.get_memory(1), ['0', '1'])
+
+        new_result = Result.from_bytes(result.to_bytes())
+        np.testing.assert_array_equal(new_result.get_memory(0), self.memory)
@@ -16,6 +16,7 @@
 
 import numpy as np
 
+from qiskit.exceptions import QiskitError
 from qiskit.result import models
 from qiskit.result import marginal_counts
 from qiskit.result import Result
@@ -97,6 +98,72 @@ class TestResultOperations(QiskitTestCase):
                                                     processed_counts_3])
         self.assertEqual(sing_result.get_counts(), processed_counts_1)
 
+    def _named_counts_result(self, names):
+        """Build a result with one experiment per name, counting its position."""
+        results = []
+        for index, name in enumerate(names):
+            data = models.ExperimentResultData(counts={hex(index % 4): index + 1})
+            header = QobjExperimentHeader(creg_sizes=[['c0', 2]], memory_slots=2, name=name)
+            results.append(models.ExperimentResult(shots=index + 1, success=True, meas_level=2,
+                                                   data=data, header=header))
+        return Result(results=results, **self.base_result_args)
+
+    def test_counts_by_name(self):
+        """Test that experiments are found by name, the first one when duplicated."""
+        result = self._named_counts_result(['a', 'b', 'c', 'b'])
+        self.assertEqual(result.get_counts('a'), {'00': 1})
+        self.assertEqual(result.get_counts('b'), {'01': 2})
+        self.assertEqual(result.get_counts('c'), {'10': 3})
+        with self.assertRaises(QiskitError):
+            result.get_counts('d')
+
+        # The name lookup follows changes to the list of results
+        result.results[0].header.name = 'd'
+        result.results.append(self._named_counts_result(['a'] * 5).results[4])
+        self.assertEqual(result.get_counts('d'), {'00': 1})
+        self.assertEqual(result.get_counts('a'), {'00': 5})
+        result.results.insert(0, result.results.pop())
+        self.assertEqual(result.get_counts('a'), {'00': 5})
+        self.assertEqual(result.get_counts('b'), {'01': 2})
+
+    def test_counts_list_of_experiments(self):
+        """Test that a list of experiments gives a list of counts."""
+        result = self._named_counts_result(['a', 'b', 'c'])
+        self.assertEqual(result.get_counts(['c', 0]), [{'10': 3}, {'00': 1}])
+        self.assertEqual(result.get_counts(['b']), [{'01': 2}])
+
+    def test_counts_array(self):
+        """Test the dense array of counts of several experiments."""
+        result = self._named_counts_result(['a', 'b', 'c', 'd', 'e'])
+        expected = np.array([[1, 0, 0, 0],
+                             [0, 2, 0, 0],
+                             [0, 0, 3, 0],
+                             [0, 0, 0, 4],
+                             [5, 0, 0, 0]])
+        np.testing.assert_array_equal(result.get_counts_array(), expected)
+        np.testing.assert_array_equal(result.get_counts_array(['c', 0]), expected[[2, 0]])
+
+    def test_memory_array(self):
+        """Test the dense array of memories of several experiments."""
+        results = []
+        for index in range(3):
+            data = models.ExperimentResultData(memory=['0x0', hex(index), '0x3'])
+            results.append(models.ExperimentResult(shots=3, success=True, meas_level=2,
+                                                   memory=True, data=data))
+            data = models.ExperimentResultData(memory=[[[index, 1.], [1., 0.]]])
+            results.append(models.ExperimentResult(shots=1, success=True, meas_level=1,
+                                                   meas_return='single', data=data))
+        result = Result(results=results, **self.base_result_args)
+
+        np.testing.assert_array_equal(result.get_memory_array([0, 2, 4]),
+                                      [[0, 0, 3], [0, 1, 3], [0, 2, 3]])
+        memory = result.get_memory_array([1, 3, 5])
+        self.assertEqual(memory.shape, (3, 1, 2))
+        np.testing.assert_array_equal(memory[:, 0, 0], [1j, 1 + 1j, 2 + 1j])
+        self.assertEqual(len(result.get_memory([1, 3])), 2)
+        with self.assertRaises(QiskitError):
+            result.get_memory_array([0, 1])
+
     def test_marginal_counts(self):
         """Test that counts are marginalized correctly."""
         raw_counts = {'0x0': 4, '0x1': 7, '0x2': 10, '0x6': 5, '0x9': 11, '0xD': 9, '0xE': 8}
@@ -230,3 +297,28 @@ class TestResultOperations(QiskitTestCase):
         self.assertEqual(memory.shape, (2, 2, 3))
         self.assertEqual(memory.dtype, np.complex_)
         np.testing.assert_almost_equal(memory, processed_memory)
+
+    def test_to_bytes_round_trip(self):
+        """Test that a result is recovered from its binary representation."""
+        raw_memory = np.random.RandomState(1234).rand(100, 3, 2).tolist()
+        memory_result = models.ExperimentResult(
+            shots=(0, 100), success=True, meas_level=1, meas_return='single',
+            data=models.ExperimentResultData(memory=raw_memory),
+            header=QobjExperimentHeader(name='memory'))
+        statevector = np.full(16, 0.25, dtype=complex)
+        statevector_result = models.ExperimentResult(
+            shots=1, success=True, meas_level=2,
+            data=models.ExperimentResultData(statevector=statevector,
+                                             counts={'0x0': 1}),
+            header=QobjExperimentHeader(name='statevector'))
+        result = Result(results=[memory_result, statevector_result],
+                        **self.base_result_args)
+
+        new_result = Result.from_bytes(result.to_bytes())
+        self.assertEqual(new_result.job_id, 'job-123')
+        self.assertEqual(new_result.results[0].shots, (0, 100))
+        self.assertEqual(new_result.results[0].data.memory, raw_memory)
+        np.testing.assert_array_equal(new_result.get_memory('memory'),
+                                      result.get_memory('memory'))
+        np.testing.assert_array_equal(new_result.get_statevector('statevector'), statevector)
+        self.assertEqual(new_result.get_counts('statevector'), {'0': 1})
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for what ``import qiskit`` imports."""
+
+import subprocess
+import sys
+from unittest import mock
+
+import qiskit
+from qiskit.test import QiskitTestCase
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter and return its last output line."""
+    output = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', code])
+    return output.decode('utf-8').split('\n')[-2]
+
+
+class TestImport(QiskitTestCase):
+    """Tests for the lazy attributes of the qiskit package."""
+
+    def test_heavy_modules_not_imported(self):
+        """Test the heavy modules are not imported by ``import qiskit``."""
+        modules = ['qiskit.compiler', 'qiskit.transpiler', 'networkx', 'scipy.stats',
+                   'jsonschema', 'fastjsonschema', 'pkg_resources']
+        code = ('import sys; import qiskit; '
+                'print([name for name in %r if name in sys.modules])' % modules)
+        self.assertEqual(_run(code), '[]')
+
+    def test_lazy_attributes(self):
+        """Test the lazy attributes resolve to the right objects."""
+        from qiskit.compiler import transpile, assemble, schedule
+        from qiskit.execute import execute
+        from qiskit.providers.basicaer import BasicAer
+        self.assertIs(qiskit.transpile, transpile)
+        self.assertIs(qiskit.assemble, assemble)
+        self.assertIs(qiskit.schedule, schedule)
+        self.assertIs(qiskit.execute, execute)
+        self.assertIs(qiskit.BasicAer, BasicAer)
+        self.assertIn('qiskit-terra', qiskit.__qiskit_version__)
+
+    def test_execute_is_function_after_submodule_import(self):
+        """Test ``qiskit.execute`` stays the function once its module is imported."""
+        code = ('import qiskit.execute; import qiskit; '
+                'print(callable(qiskit.execute))')
+        self.assertEqual(_run(code), 'True')
+
+    def test_execute_can_be_patched(self):
+        """Test ``qiskit.execute`` can be patched like a normal attribute."""
+        original = qiskit.execute
+        with mock.patch('qiskit.execute') as patched:
+            self.assertIs(qiskit.execute, patched)
+        self.assertIs(qiskit.execute, original)
+
+    def test_qiskit_version_in_version_module(self):
+        """Test ``__qiskit_version__`` can still be imported from qiskit.version."""
+        from qiskit.version import __qiskit_version__
+        self.assertIs(__qiskit_version__, qiskit.__qiskit_version__)
+
+    def test_subpackages_not_imported_by_attribute_access(self):
+        """Test unknown attributes do not import the subpackage of that name."""
+        code = ('import sys; import qiskit; '
+                "print(hasattr(qiskit, 'test'), 'qiskit.test' in sys.modules)")
+        self.assertEqual(_run(code), 'False False')
+
+    def test_star_import(self):
+        """Test ``from qiskit import *`` provides the lazy attributes."""
+        code = ('from qiskit import *; '
+                'print(execute.__name__, transpile.__name__, BasicAer)')
+        self.assertEqual(_run(code), 'execute transpile BasicAer')
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            _ = qiskit.not_an_attribute  # pylint: disable=no-member
@@ -100,6 +100,33 @@ class TestUserConfig(QiskitTestCase):
             self.assertEqual({'transpile_optimization_level': 1},
                              config.settings)
 
+    def test_invalid_qobj_validation(self):
+        test_config = """
+        [default]
+        qobj_validation = sometimes
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            self.assertRaises(exceptions.QiskitUserConfigError,
+                              config.read_config_file)
+
+    def test_qobj_validation_valid(self):
+        test_config = """
+        [default]
+        qobj_validation = structure
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, 'w') as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            config.read_config_file()
+            self.assertEqual({'qobj_validation': 'structure'},
+                             config.settings)
+
     def test_valid_suppress_packaging_warnings_false(self):
         test_config = """
         [default]
@@ -304,9 +304,9 @@ class TestFinalLayouts(QiskitTestCase):
                         15: ancilla[10], 16: ancilla[11], 17: ancilla[12], 18: ancilla[13],
                         19: ancilla[14]}
 
-        csp_layout = {0: qr1[1], 1: qr1[2], 2: qr2[0], 5: qr1[0], 3: qr2[1], 4: ancilla[0],
-                      6: ancilla[1], 7: ancilla[2], 8: ancilla[3], 9: ancilla[4], 10: ancilla[5],
-                      11: ancilla[6], 12: ancilla[7], 13: ancilla[8], 14: ancilla[9],
+        vf2_layout = {14: qr1[0], 13: qr1[1], 8: qr1[2], 9: qr2[0], 3: qr2[1], 0: ancilla[0],
+                      1: ancilla[1], 2: ancilla[2], 4: ancilla[3], 5: ancilla[4], 6: ancilla[5],
+                      7: ancilla[6], 10: ancilla[7], 11: ancilla[8], 12: ancilla[9],
                       15: ancilla[10], 16: ancilla[11], 17: ancilla[12], 18: ancilla[13],
                       19: ancilla[14]}
 
@@ -314,9 +314,9 @@ class TestFinalLayouts(QiskitTestCase):
         expected_layout_level0 = trivial_layout
         # Dense layout
         expected_layout_level1 = dense_layout
-        # CSP layout
-        expected_layout_level2 = csp_layout
-        expected_layout_level3 = csp_layout
+        # VF2 layout
+        expected_layout_level2 = vf2_layout
+        expected_layout_level3 = vf2_layout
 
         expected_layouts = [expected_layout_level0,
                             expected_layout_level1,
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the SabreLayout pass"""
+
+import unittest
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.transpiler import CouplingMap, PassManager
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.passes import SabreLayout
+from qiskit.converters import circuit_to_dag
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeAlmaden
+
+
+def _example_circuit():
+    qr = QuantumRegister(6, 'q')
+    circuit = QuantumCircuit(qr)
+    for i in range(6):
+        for j in range(i + 1, 6, 2):
+            circuit.cx(qr[i], qr[j])
+    circuit.measure_all()
+    return circuit
+
+
+class TestSabreLayout(QiskitTestCase):
+    """Tests the SabreLayout pass"""
+
+    def setUp(self):
+        self.coupling_map = CouplingMap.from_grid(3, 3)
+        self.circuit = _example_circuit()
+
+    def _run(self, layout_pass):
+        pass_manager = PassManager(layout_pass)
+        pass_manager.run(self.circuit)
+        return pass_manager.property_set['layout']
+
+    def test_layout_covers_circuit(self):
+        """Test the layout maps every virtual qubit to a distinct physical qubit."""
+        layout = self._run(SabreLayout(self.coupling_map, seed=0))
+        physical = [layout[qubit] for qubit in self.circuit.qubits]
+        self.assertEqual(len(set(physical)), len(self.circuit.qubits))
+        for qubit in physical:
+            self.assertIn(qubit, self.coupling_map.physical_qubits)
+
+    def test_multi_start_deterministic(self):
+        """Test the multi-start layout only depends on the seed."""
+        layout_1 = self._run(SabreLayout(self.coupling_map, seed=42, num_starts=4))
+        layout_2 = self._run(SabreLayout(self.coupling_map, seed=42, num_starts=4))
+        self.assertEqual(layout_1.get_virtual_bits(), layout_2.get_virtual_bits())
+
+    def test_multi_start_not_worse(self):
+        """Test the best of many starts is at least as good as the first one."""
+        single = SabreLayout(self.coupling_map, seed=7)
+        multi = SabreLayout(self.coupling_map, seed=7, num_starts=5)
+        single_layout = self._run(single)
+        multi_layout = self._run(multi)
+
+        circuit = _example_circuit()
+        single_score = single._score_layout(7, circuit, single_layout)
+        multi_score = multi._score_layout(7, circuit, multi_layout)
+        self.assertLessEqual(multi_score, single_score)
+
+    def test_fidelity_score(self):
+        """Test the multi-start layout can be scored with backend properties."""
+        backend = FakeAlmaden()
+        coupling_map = CouplingMap(backend.configuration().coupling_map)
+        layout_pass = SabreLayout(coupling_map, seed=3, num_starts=3, score='fidelity',
+                                  backend_properties=backend.properties())
+        layout_pass.run(circuit_to_dag(self.circuit))
+        layout = layout_pass.property_set['layout']
+        self.assertEqual(len(set(layout[qubit] for qubit in self.circuit.qubits)), 6)
+
+    def test_invalid_score(self):
+        """Test an invalid score raises."""
+        with self.assertRaises(TranspilerError):
+            SabreLayout(self.coupling_map, score='depth')
+        with self.assertRaises(TranspilerError):
+            SabreLayout(self.coupling_map, score='fidelity')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -536,6 +536,28 @@ class TestStochasticSwap(QiskitTestCase):
         after = circuit_to_dag(after)
         self.assertEqual(expected_dag, after)
 
+    def test_threaded_trials_independent_of_thread_count(self):
+        """Test the threaded trials give the same result for any number of threads."""
+        coupling = CouplingMap.from_grid(3, 3)
+        qr = QuantumRegister(9, 'q')
+        circuit = QuantumCircuit(qr)
+        for i in range(9):
+            for j in range(i + 1, 9):
+                circuit.cx(qr[i], qr[j])
+        dag = circuit_to_dag(circuit)
+
+        results = []
+        for num_threads in [2, 3, 8]:
+            pass_ = StochasticSwap(coupling, 20, 13, num_threads=num_threads)
+            results.append(pass_.run(dag))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertEqual(results[0].count_ops()['cx'], 36)
+        for gate in results[0].two_qubit_ops():
+            physical = [q.index for q in gate.qargs]
+            self.assertEqual(coupling.distance(*physical), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
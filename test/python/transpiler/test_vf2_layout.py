@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the VF2Layout pass"""
+
+import unittest
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.passes import VF2Layout
+from qiskit.converters import circuit_to_dag
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeTenerife, FakeRueschlikon, FakeTokyo, FakeMontreal
+
+
+class TestVF2Layout(QiskitTestCase):
+    """Tests the VF2Layout pass"""
+
+    def assertLayoutIsPerfect(self, circuit, coupling_map, layout, strict_direction=False):
+        """Every two-qubit gate of circuit acts on coupled physical qubits."""
+        edges = set(coupling_map.get_edges())
+        for gate in circuit_to_dag(circuit).two_qubit_ops():
+            pair = (layout[gate.qargs[0]], layout[gate.qargs[1]])
+            if strict_direction:
+                self.assertIn(pair, edges)
+            else:
+                self.assertTrue(pair in edges or pair[::-1] in edges)
+
+    def test_2q_circuit_2q_coupling(self):
+        """ A simple example, without considering the direction
+          0 - 1
+        qr1 - qr0
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[1], qr[0])  # qr1 -> qr0
+
+        coupling_map = CouplingMap([[0, 1]])
+        pass_ = VF2Layout(coupling_map, strict_direction=False)
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set['layout']
+
+        self.assertLayoutIsPerfect(circuit, coupling_map, layout)
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], 'solution found')
+
+    def test_2q_circuit_2q_coupling_sd(self):
+        """ A simple example, considering the direction
+         0  -> 1
+        qr1 -> qr0
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[1], qr[0])  # qr1 -> qr0
+
+        coupling_map = CouplingMap([[0, 1]])
+        pass_ = VF2Layout(coupling_map, strict_direction=True)
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set['layout']
+
+        self.assertEqual(layout[qr[0]], 1)
+        self.assertEqual(layout[qr[1]], 0)
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], 'solution found')
+
+    def test_3q_circuit_5q_coupling(self):
+        """ 3 qubits in Tenerife, with and without considering the direction"""
+        coupling_map = CouplingMap(FakeTenerife().configuration().coupling_map)
+
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[1], qr[0])  # qr1 -> qr0
+        circuit.cx(qr[0], qr[2])  # qr0 -> qr2
+        circuit.cx(qr[1], qr[2])  # qr1 -> qr2
+
+        for strict_direction in [False, True]:
+            with self.subTest(strict_direction=strict_direction):
+                pass_ = VF2Layout(coupling_map, strict_direction=strict_direction)
+                pass_.run(circuit_to_dag(circuit))
+                layout = pass_.property_set['layout']
+
+                self.assertLayoutIsPerfect(circuit, coupling_map, layout, strict_direction)
+                self.assertEqual(pass_.property_set['VF2Layout_stop_reason'],
+                                 'solution found')
+
+    def test_idle_qubits_are_laid_out(self):
+        """Qubits without two-qubit gates also get a physical qubit"""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[3])
+
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3]])
+        pass_ = VF2Layout(coupling_map)
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set['layout']
+
+        self.assertEqual({layout[qubit] for qubit in qr}, {0, 1, 2, 3})
+        self.assertLayoutIsPerfect(circuit, coupling_map, layout)
+
+    def test_5q_circuit_16q_coupling_no_solution(self):
+        """ 5 qubits in Rueschlikon, no solution
+
+          q0[1] ↖     ↗ q0[2]
+                 q0[0]
+          q0[3] ↙     ↘ q0[4]
+        """
+        cmap16 = FakeRueschlikon().configuration().coupling_map
+
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[0], qr[2])
+        circuit.cx(qr[0], qr[3])
+        circuit.cx(qr[0], qr[4])
+        pass_ = VF2Layout(CouplingMap(cmap16))
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set['layout']
+        self.assertIsNone(layout)
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], 'nonexistent solution')
+
+    def test_call_limit(self):
+        """Hard to solve situations hit the call limit"""
+        circuit = QuantumCircuit(20)
+        for qubit_0, qubit_1 in [(13, 12), (6, 0), (5, 10), (10, 7), (2, 15), (16, 18),
+                                 (6, 4), (10, 3), (11, 10), (4, 0), (7, 8), (9, 6),
+                                 (16, 17), (9, 3), (14, 12), (1, 16), (5, 3), (8, 12),
+                                 (2, 1), (13, 5), (15, 18)]:
+            circuit.cx(qubit_0, qubit_1)
+        coupling_map = CouplingMap(FakeTokyo().configuration().coupling_map)
+        pass_ = VF2Layout(coupling_map, call_limit=1, time_limit=None)
+        pass_.run(circuit_to_dag(circuit))
+
+        self.assertIsNone(pass_.property_set['layout'])
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], 'call limit reached')
+
+    def test_properties_pick_the_best_match(self):
+        """With backend properties, the lowest error perfect layout is chosen"""
+        backend = FakeMontreal()
+        coupling_map = CouplingMap(backend.configuration().coupling_map)
+        properties = backend.properties()
+        cx_errors = {tuple(gate.qubits): gate.parameters[0].value
+                     for gate in properties.gates if gate.gate == 'cx'}
+
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.measure_all()
+
+        pass_ = VF2Layout(coupling_map, properties)
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set['layout']
+
+        readout_error = properties.readout_error
+        chosen = (layout[qr[0]], layout[qr[1]])
+        chosen_error = cx_errors[chosen] + readout_error(chosen[0]) + readout_error(chosen[1])
+        best_error = min(error + readout_error(pair[0]) + readout_error(pair[1])
+                         for pair, error in cx_errors.items())
+        self.assertAlmostEqual(chosen_error, best_error, places=2)
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], 'solution found')
+
+
+if __name__ == '__main__':
+    unittest.main()